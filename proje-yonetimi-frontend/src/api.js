@@ -64,6 +64,16 @@ export async function findUserByEmail(email, token) {
   return await res.json();
 }
 
+// Atanan seçici: e-posta, ad veya soyad önekiyle en fazla `limit` kullanıcı
+export async function autocompleteUsers(q, token, limit = 10) {
+  const params = new URLSearchParams({ q, limit });
+  const res = await fetch(`${API_BASE}users/autocomplete/?${params}`, {
+    headers: { "Authorization": `Bearer ${token}` },
+  });
+  if (!res.ok) throw new Error("Kullanıcılar alınamadı");
+  return await res.json();
+}
+
 
 // ---- KULLANICI GİRİŞ/KAYIT ----
 export async function loginUser(email, password) {
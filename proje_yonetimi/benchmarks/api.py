@@ -0,0 +1,184 @@
+"""API senaryo benchmark'ı: her yol için gecikme dağılımı, sorgu sayısı ve tepe bellek.
+
+    python -m benchmarks.api --users 200 --projects 1000 --tasks 20000 --output sonuc.json
+    python -m benchmarks.api --only tasks. --repeat 50
+    python -m benchmarks.compare onceki.json sonuc.json --threshold 0.2
+
+İstekler gerçek JWT belirteçleriyle DRF test istemcisi üzerinden atılır, yani
+kimlik doğrulama ve ara katmanlar da ölçüme dahildir. Akış (streaming) yanıtları
+ölçüm içinde sonuna kadar okunur. Tepe bellek ``tracemalloc`` ile ayrı bir
+turda ölçülür; izleme maliyeti gecikme değerlerine karışmaz.
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+from .utils import benchmark_database, setup_django
+
+
+def percentile(sorted_values, q):
+    """En yakın sıra yöntemi; ``sorted_values`` sıralı ve boş olmamalı."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _summary(latencies):
+    values = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 3)  # noqa: E731
+    return {
+        "min_ms": ms(values[0]),
+        "p50_ms": ms(percentile(values, 0.5)),
+        "p95_ms": ms(percentile(values, 0.95)),
+        "p99_ms": ms(percentile(values, 0.99)),
+        "max_ms": ms(values[-1]),
+        "mean_ms": ms(sum(values) / len(values)),
+    }
+
+
+class ScenarioRunner:
+    def __init__(self, dataset):
+        from rest_framework.test import APIClient
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        from users.models import User
+
+        self.clients = {None: APIClient()}
+        for role, pk in (("owner", dataset.owner_id), ("staff", dataset.staff_id)):
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(User.objects.get(pk=pk)).access_token}")
+            self.clients[role] = client
+
+    def call(self, scenario):
+        """Senaryoyu bir kez çalıştır: (durum kodu, süre sn, sorgu sayısı)."""
+        from django.db import connection, transaction
+        from django.test.utils import CaptureQueriesContext
+
+        data = scenario.before() if scenario.before else None
+        if data is None:
+            data = scenario.data
+        client = self.clients[scenario.user]
+        request = getattr(client, scenario.method.lower())
+        path = scenario.path
+        if scenario.query:
+            from urllib.parse import urlencode
+
+            path = f"{path}?{urlencode(scenario.query)}"
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                response = request(path, data, format="json") if data is not None else request(path)
+                if response.streaming:
+                    for _ in response.streaming_content:
+                        pass
+                elapsed = time.perf_counter() - start
+            if scenario.mutates:
+                transaction.set_rollback(True)
+        return response.status_code, elapsed, len(ctx.captured_queries)
+
+    def measure(self, scenario, repeat, warmup):
+        status = None
+        for _ in range(warmup):
+            status, _, _ = self.call(scenario)
+        latencies, queries = [], []
+        for _ in range(repeat):
+            status, elapsed, count = self.call(scenario)
+            latencies.append(elapsed)
+            queries.append(count)
+
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            self.call(scenario)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "route": scenario.route,
+            "method": scenario.method,
+            "status": status,
+            "repeat": repeat,
+            **_summary(latencies),
+            "queries": max(queries),
+            "peak_kib": round(peak / 1024, 1),
+        }
+        if status != scenario.expected:
+            result["error"] = f"beklenen durum {scenario.expected}, gelen {status}"
+        return result
+
+
+def run(dataset, repeat=20, warmup=2, only=None):
+    from .scenarios import build_scenarios, uncovered_routes
+
+    scenarios = build_scenarios(dataset)
+    runner = ScenarioRunner(dataset)
+    results = {}
+    for scenario in scenarios:
+        if only and not any(scenario.name.startswith(prefix) for prefix in only):
+            continue
+        results[scenario.name] = runner.measure(scenario, repeat, warmup)
+    return results, [f"{route} {method}" for route, method in uncovered_routes(scenarios)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--dependency-density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--only", action="append", help="Yalnızca bu önekle başlayan senaryolar (tekrarlanabilir)")
+    parser.add_argument("--output", help="Sonuçları bu JSON dosyasına da yaz")
+    parser.add_argument("--keep-file", help="Test veritabanını bu dosyada tut (ör. /tmp/bench.sqlite3)")
+    args = parser.parse_args()
+
+    setup_django()
+    import django
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from .data import generate
+
+    # ALLOWED_HOSTS'a "testserver" eklenir, e-posta bellekte kalır
+    setup_test_environment()
+    with benchmark_database(args.keep_file):
+        start = time.perf_counter()
+        dataset = generate(args.users, args.projects, args.tasks, args.dependency_density, args.seed)
+        seed_seconds = round(time.perf_counter() - start, 2)
+        scenarios, uncovered = run(dataset, args.repeat, args.warmup, args.only)
+        vendor = connection.vendor
+
+    output = {
+        "meta": {
+            "dataset": dataset.counts,
+            "seed": args.seed,
+            "seed_seconds": seed_seconds,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": vendor,
+        },
+        "scenarios": scenarios,
+        "uncovered": uncovered,
+    }
+    text = json.dumps(output, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    print(text)
+
+    errors = [f"{name}: {result['error']}" for name, result in scenarios.items() if "error" in result]
+    for line in errors + [f"senaryosu olmayan yol: {route}" for route in uncovered]:
+        print(line, file=sys.stderr)
+    sys.exit(1 if errors or uncovered else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Kullanıcı otomatik tamamlama: /api/users/autocomplete/ gecikmesi (p50/p95).
+
+    python -m benchmarks.autocomplete --users 500000
+
+``cold``: her istekten önce önek önbelleği boşaltılır (her istek veritabanına
+gider). ``typing``: örnek kullanıcıların e-posta/ad/soyadı harf harf yazılır;
+her dizi boş önbellekle başlar, sonraki tuş vuruşları önbellekten süzülebilir.
+Karşılaştırma için aynı önekler indekssiz ``icontains`` sorgusuyla da ölçülür.
+Hız sınırı ölçüm süresince kapatılır.
+"""
+import argparse
+import json
+import random
+import time
+from unittest import mock
+
+from .api import percentile
+from .utils import benchmark_database, setup_django
+
+FIRST_NAMES = ("Ayşe", "Mehmet", "Zeynep", "Ali", "Elif", "Can", "Şule", "Emre", "İpek", "Oğuz", "Çağla", "Burak",
+               "Deniz", "Ece", "Hakan", "Gül", "Kerem", "Selin", "Tolga", "Ümit")
+LAST_NAMES = ("Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Öztürk", "Aydın", "Arslan", "Doğan", "Kılıç",
+              "Aslan", "Çetin", "Koç", "Kurt", "Özdemir", "Işık", "Acar", "Güneş", "Polat")
+
+
+def seed(users, seed_value=1):
+    from users.models import User
+
+    rnd = random.Random(seed_value)
+    batch = []
+    for i in range(users):
+        first, last = rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)
+        batch.append(User(email=f"u{i}.{rnd.randrange(10**6)}@example.com", first_name=first, last_name=f"{last}{i % 997}"))
+        if len(batch) >= 20000:
+            User.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        User.objects.bulk_create(batch)
+
+
+def typing_sequences(sample, rnd):
+    sequences = []
+    for user in sample:
+        text = rnd.choice((user.email, user.first_name, user.last_name))
+        sequences.append([text[:length] for length in range(1, min(len(text), 6) + 1)])
+    return sequences
+
+
+def _summary(latencies):
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2),
+    }
+
+
+def run(users, samples):
+    from django.db import connection
+    from django.db.models import Q
+    from django.test.utils import setup_test_environment
+    from rest_framework.test import APIClient
+    from rest_framework.throttling import ScopedRateThrottle
+
+    from users.lookup import get_prefix_cache
+    from users.models import User
+
+    setup_test_environment()
+    start = time.perf_counter()
+    seed(users)
+    results = {"database": connection.vendor, "users": users, "seed_seconds": round(time.perf_counter() - start, 1)}
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    rnd = random.Random(2)
+    pks = list(User.objects.values_list("pk", flat=True))
+    sample = list(User.objects.filter(pk__in=rnd.sample(pks, samples)))
+    sequences = typing_sequences(sample, rnd)
+    client = APIClient()
+    client.force_authenticate(sample[0])
+    cache = get_prefix_cache()
+
+    def request(q):
+        started = time.perf_counter()
+        response = client.get("/api/users/autocomplete/", {"q": q})
+        elapsed = time.perf_counter() - started
+        assert response.status_code == 200, response.content
+        return elapsed
+
+    with mock.patch.object(ScopedRateThrottle, "THROTTLE_RATES", {"user-autocomplete": None}):
+        request("a")  # ısınma
+        cold = []
+        for sequence in sequences:
+            for q in sequence:
+                cache.clear()
+                cold.append(request(q))
+        typing = []
+        for sequence in sequences:
+            cache.clear()
+            typing.extend(request(q) for q in sequence)
+    results["cold"] = _summary(cold)
+    results["typing"] = _summary(typing)
+
+    scan = []
+    for sequence in sequences[:20]:
+        for q in sequence:
+            started = time.perf_counter()
+            list(
+                User.objects.filter(Q(email__icontains=q) | Q(first_name__icontains=q) | Q(last_name__icontains=q))
+                .order_by("email").values_list("pk", flat=True)[:10]
+            )
+            scan.append(time.perf_counter() - started)
+    results["icontains_scan"] = _summary(scan)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=500000)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args.users, args.samples)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Toplu görev güncelleme: PATCH /api/tasks/bulk/ süresi ve sorgu sayısı.
+
+    python -m benchmarks.bulk --items 1000 --repeat 5 --budget-ms 1000
+
+Sorgu sayısının satır sayısından bağımsız olduğu birim testte
+(tasks.tests.TaskBulkApiTests) doğrulanır; süre makineye bağlı olduğu için
+burada ölçülür. İki senaryo: satır başına farklı değerler (``UPDATE … FROM
+(VALUES …)``) ve herkese aynı durum (``UPDATE … WHERE id IN (…)``). Herhangi
+birinin p50'si ``--budget-ms``'i aşarsa çıkış kodu 1'dir.
+"""
+import argparse
+import json
+import sys
+import time
+
+from .api import percentile
+from .utils import benchmark_database, setup_django
+
+
+def run(items, repeat):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext, setup_test_environment
+    from rest_framework.test import APIClient
+
+    from projects.models import Project
+    from tasks.models import Task
+    from users.models import User
+
+    setup_test_environment()
+    owner = User.objects.create_user(email="bench@example.com")
+    project = Project.objects.create(name="Toplu", owner=owner)
+    Task.objects.bulk_create([Task(project=project, title=f"B{i}") for i in range(items)], batch_size=5000)
+    ids = list(Task.objects.filter(project=project).values_list("pk", flat=True))
+    client = APIClient()
+    client.force_authenticate(owner)
+
+    statuses = ("Beklemede", "Devam Ediyor")
+    scenarios = {
+        "bulk-update": lambda n: (client.patch, "/api/tasks/bulk/", [
+            {"id": pk, "status": statuses[n % 2], "progress": (i + n) % 100, "due_date": "2025-05-01"}
+            for i, pk in enumerate(ids)
+        ]),
+        "bulk-status": lambda n: (client.post, "/api/tasks/bulk/status/", [
+            {"id": pk, "status": statuses[n % 2]} for pk in ids
+        ]),
+    }
+    results = {"database": connection.vendor, "items": items}
+    for name, build in scenarios.items():
+        latencies, queries = [], 0
+        for round_number in range(repeat):
+            method, url, payload = build(round_number)
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = method(url, payload, format="json")
+                latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.content
+            queries = len(ctx.captured_queries)
+
+        latencies.sort()
+        results[name] = {
+            "p50_ms": round(percentile(latencies, 0.5) * 1000, 1),
+            "max_ms": round(latencies[-1] * 1000, 1),
+            "queries": queries,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000, help="İzin verilen en yüksek p50 (0: denetleme)")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args.items, args.repeat)
+    print(json.dumps(results, indent=2))
+
+    over = [
+        name for name, value in results.items()
+        if isinstance(value, dict) and args.budget_ms and value["p50_ms"] > args.budget_ms
+    ]
+    for name in over:
+        print(f"GERİLEME: {name} p50 {results[name]['p50_ms']} ms > {args.budget_ms:g} ms", file=sys.stderr)
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
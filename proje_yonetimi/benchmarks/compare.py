@@ -0,0 +1,72 @@
+"""İki ``benchmarks.api`` sonuç dosyasını karşılaştır; eşiği aşan gerilemede çık kodu 1.
+
+    python -m benchmarks.compare onceki.json sonuc.json --threshold 0.2
+    python -m benchmarks.compare onceki.json sonuc.json --metric p95_ms --metric queries
+
+Süre ölçütleri oransal eşikle (``--threshold``) karşılaştırılır; çok kısa
+isteklerde gürültü alarm üretmesin diye ``--min-delta-ms`` altındaki farklar
+yok sayılır. Sorgu sayısı belirlenimci olduğundan varsayılan olarak tek bir
+fazla sorgu bile gerilemedir (``--query-threshold 0``).
+"""
+import argparse
+import json
+import sys
+
+DEFAULT_METRICS = ("p50_ms", "p95_ms", "queries", "peak_kib")
+
+
+def compare(baseline, current, metrics=DEFAULT_METRICS, threshold=0.2, query_threshold=0, min_delta_ms=1.0):
+    """Satır listesi döndür: (senaryo, ölçüt, önceki, şimdiki, oran, gerileme mi)."""
+    rows = []
+    before_all, after_all = baseline["scenarios"], current["scenarios"]
+    for name in sorted(before_all.keys() & after_all.keys()):
+        before, after = before_all[name], after_all[name]
+        for metric in metrics:
+            old, new = before.get(metric), after.get(metric)
+            if old is None or new is None:
+                continue
+            ratio = (new - old) / old if old else (0.0 if new == old else float("inf"))
+            if metric == "queries":
+                regressed = new - old > query_threshold
+            elif metric.endswith("_ms"):
+                regressed = ratio > threshold and new - old >= min_delta_ms
+            else:
+                regressed = ratio > threshold
+            rows.append((name, metric, old, new, ratio, regressed))
+        if "error" in after and "error" not in before:
+            rows.append((name, "status", before.get("status"), after.get("status"), 0.0, True))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.2, help="İzin verilen oransal artış (0.2 = %%20)")
+    parser.add_argument("--query-threshold", type=int, default=0, help="İzin verilen fazla sorgu sayısı")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    parser.add_argument("--metric", action="append", help=f"Karşılaştırılacak ölçüt (varsayılan: {', '.join(DEFAULT_METRICS)})")
+    parser.add_argument("--all", action="store_true", help="Gerilemeyen satırları da yazdır")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)
+
+    rows = compare(baseline, current, args.metric or DEFAULT_METRICS, args.threshold, args.query_threshold,
+                   args.min_delta_ms)
+    regressions = [row for row in rows if row[5]]
+    for name, metric, old, new, ratio, regressed in rows if args.all else regressions:
+        mark = "GERİLEME" if regressed else "ok"
+        print(f"{mark:9} {name:32} {metric:9} {old!s:>10} -> {new!s:>10} ({ratio:+.1%})")
+
+    missing = sorted(baseline["scenarios"].keys() - current["scenarios"].keys())
+    for name in missing:
+        print(f"eksik     {name}")
+    print(f"{len(rows)} karşılaştırma, {len(regressions)} gerileme, {len(missing)} eksik senaryo", file=sys.stderr)
+    sys.exit(1 if regressions or missing else 0)
+
+
+if __name__ == "__main__":
+    main()
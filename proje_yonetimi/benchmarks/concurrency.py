@@ -0,0 +1,161 @@
+"""TaskViewSet üzerinde eşzamanlı yazar/okuyucu yük testi: iş hacmi ve kilit hataları.
+
+    python -m benchmarks.concurrency --writers 4 --readers 8 --seconds 10
+    python -m benchmarks.concurrency --baseline     # pragmasız, eski SQLite ayarları
+
+İşçiler varsayılan olarak ayrı süreçlerdir ve her biri kendi veritabanı
+bağlantısını açar (gunicorn işçileri gibi). Yazarlar görev oluşturur ve günceller, okuyucular liste ve
+ayrıntı ister. Test veritabanı geçici bir dosyadadır; bellek içi SQLite paylaşımlı
+önbellek kilitleri kullandığından gerçek davranışı yansıtmaz.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
+
+from .api import percentile
+from .utils import benchmark_database, setup_django
+
+
+def _request(client, kind, rnd, project_id, task_ids):
+    if kind == "writer":
+        if rnd.random() < 0.5:
+            return client.post("/api/tasks/", {"project": project_id, "title": "Yük"}, format="json")
+        return client.patch(f"/api/tasks/{rnd.choice(task_ids)}/", {"progress": rnd.randint(0, 100)}, format="json")
+    if rnd.random() < 0.5:
+        return client.get("/api/tasks/", {"page_size": 50})
+    return client.get(f"/api/tasks/{rnd.choice(task_ids)}/")
+
+
+def work(kind, token, project_id, task_ids, seconds, seed_value):
+    """Bir işçi: ``seconds`` boyunca istek at; gecikmeleri ve hataları döndür."""
+    from django.db import OperationalError, connection
+    from rest_framework.test import APIClient
+
+    rnd = random.Random(seed_value)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    result = {"kind": kind, "latencies": [], "lock_errors": 0, "errors": []}
+    deadline = time.perf_counter() + seconds
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = _request(client, kind, rnd, project_id, task_ids)
+            except OperationalError as exc:
+                if "locked" in str(exc):
+                    result["lock_errors"] += 1
+                else:
+                    result["errors"].append(str(exc))
+                continue
+            if response.status_code >= 400:
+                result["errors"].append(f"HTTP {response.status_code}")
+                continue
+            result["latencies"].append(time.perf_counter() - start)
+    finally:
+        connection.close()
+    return result
+
+
+def _work_star(args):
+    return work(*args)
+
+
+def _report(workers, seconds):
+    latencies = sorted(value for worker in workers for value in worker["latencies"])
+    errors = [error for worker in workers for error in worker["errors"]]
+    result = {
+        "workers": len(workers),
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / seconds, 1),
+        "lock_errors": sum(worker["lock_errors"] for worker in workers),
+        "other_errors": len(errors),
+    }
+    if latencies:
+        result["p50_ms"] = round(percentile(latencies, 0.5) * 1000, 2)
+        result["p95_ms"] = round(percentile(latencies, 0.95) * 1000, 2)
+        result["max_ms"] = round(latencies[-1] * 1000, 2)
+    if errors:
+        result["first_errors"] = sorted(set(errors))[:5]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--threads", action="store_true",
+                        help="İşçileri süreç yerine iş parçacığı olarak çalıştır (GIL paylaşılır)")
+    parser.add_argument("--baseline", action="store_true",
+                        help="Pragmalar ve IMMEDIATE işlem kipi olmadan (rollback journal) çalıştır")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from tasks.models import Task
+    from users.models import User
+
+    from .data import generate
+
+    if connection.vendor == "sqlite" and args.baseline:
+        settings.SQLITE_PRAGMAS = {"journal_mode": "DELETE"}
+        connection.settings_dict["OPTIONS"].pop("transaction_mode", None)
+    elif connection.vendor == "sqlite":
+        # Dağıtım profili: WAL yalnızca açıkça istendiğinde uygulanır
+        settings.SQLITE_PRAGMAS = {**settings.SQLITE_PRAGMAS, "journal_mode": "WAL", "synchronous": "NORMAL"}
+
+    setup_test_environment()
+    workdir = tempfile.mkdtemp(prefix="bench-concurrency-")
+    path = os.path.join(workdir, "db.sqlite3")
+    with benchmark_database(path if connection.vendor == "sqlite" else None):
+        dataset = generate(args.users, args.projects, args.tasks, dependency_density=0.1)
+        token = str(RefreshToken.for_user(User.objects.get(pk=dataset.owner_id)).access_token)
+        task_ids = list(Task.objects.filter(project_id=dataset.project_id).values_list("pk", flat=True))
+        # Ana iş parçacığının bağlantısı yazma kilidi tutmasın
+        connection.close()
+
+        jobs = [("writer", token, dataset.project_id, task_ids, args.seconds, i) for i in range(args.writers)]
+        jobs += [("reader", token, dataset.project_id, task_ids, args.seconds, 1000 + i) for i in range(args.readers)]
+        # fork: çocuk süreçler kurulu Django'yu ve test veritabanı adını devralır
+        pool = ThreadPool(len(jobs)) if args.threads else multiprocessing.get_context("fork").Pool(len(jobs))
+        with pool:
+            start = time.perf_counter()
+            workers = pool.map(_work_star, jobs)
+            elapsed = time.perf_counter() - start
+
+        journal_mode = None
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA journal_mode")
+                journal_mode = cursor.fetchone()[0]
+
+    for name in os.listdir(workdir):
+        os.remove(os.path.join(workdir, name))
+    os.rmdir(workdir)
+
+    output = {
+        "database": connection.vendor,
+        "journal_mode": journal_mode,
+        "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+        "seconds": round(elapsed, 2),
+        "mode": "threads" if args.threads else "processes",
+        "writers": _report([w for w in workers if w["kind"] == "writer"], elapsed),
+        "readers": _report([w for w in workers if w["kind"] == "reader"], elapsed),
+    }
+    print(json.dumps(output, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Bağımlılık grafı motoru: topolojik sıra + kritik yol.
+
+    python -m benchmarks.critical_path --tasks 10000 --edges 50000
+    python -m benchmarks.critical_path --tasks 10000 --edges 50000 --db
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+
+from .utils import benchmark_database, setup_django, timed
+
+
+def random_dag(tasks, edges, seed_value=1):
+    rnd = random.Random(seed_value)
+    pairs = set()
+    while len(pairs) < edges:
+        a, b = rnd.randrange(tasks), rnd.randrange(tasks)
+        if a != b:
+            pairs.add((min(a, b), max(a, b)))
+    base = date(2025, 1, 1)
+    starts = [base + timedelta(days=rnd.randint(0, 30)) for _ in range(tasks)]
+    ends = [start + timedelta(days=rnd.randint(0, 14)) for start in starts]
+    return sorted(pairs), starts, ends
+
+
+def run_in_memory(tasks, edges):
+    from tasks.graph import TaskGraph
+
+    pairs, starts, ends = random_dag(tasks, edges)
+    results = {}
+    start = time.perf_counter()
+    graph = TaskGraph(range(tasks), pairs, starts, ends)
+    results["build_seconds"] = round(time.perf_counter() - start, 4)
+    start = time.perf_counter()
+    schedule = graph.schedule()
+    path = schedule.critical_path()
+    results["schedule_seconds"] = round(time.perf_counter() - start, 4)
+    results["critical_path_length"] = len(path)
+    results["duration_days"] = schedule.finish
+    return results
+
+
+def run_database(tasks, edges):
+    from projects.models import Project
+    from tasks.graph import load_project_graph
+    from tasks.models import Task
+    from users.models import User
+
+    pairs, starts, ends = random_dag(tasks, edges)
+    owner = User.objects.create_user(email="bench@example.com")
+    project = Project.objects.create(name="Kritik yol", owner=owner)
+    Task.objects.bulk_create(
+        [Task(project=project, title=f"görev {i}", start_date=s, end_date=e) for i, (s, e) in enumerate(zip(starts, ends))],
+        batch_size=5000,
+    )
+    ids = list(Task.objects.filter(project=project).order_by("pk").values_list("pk", flat=True))
+    Through = Task.dependencies.through
+    # (önce, sonra) -> sonra gelen görev öncekine bağımlı
+    Through.objects.bulk_create(
+        [Through(from_task_id=ids[b], to_task_id=ids[a]) for a, b in pairs], batch_size=5000
+    )
+
+    results = {}
+    with timed(results, "load_graph"):
+        graph = load_project_graph(project.pk)
+    with timed(results, "schedule"):
+        graph.schedule().critical_path()
+    results["edges_loaded"] = graph.edge_count
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--edges", type=int, default=50000)
+    parser.add_argument("--db", action="store_true", help="Veritabanından yükleme süresini de ölç")
+    args = parser.parse_args()
+
+    setup_django()
+    results = {"in_memory": run_in_memory(args.tasks, args.edges)}
+    if args.db:
+        with benchmark_database():
+            results["database"] = run_database(args.tasks, args.edges)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark senaryoları için belirlenimci (deterministic) veri üreticisi.
+
+Aynı parametreler ve tohumla her çalıştırmada aynı satırlar üretilir (zaman
+damgaları hariç). Yazma ``bulk_create`` ile yapılır; model sinyalleri çalışmadığı
+için görev özetleri, üyelik tablosu ve günlük görüntüler sonunda toplu kurulur.
+
+Bağımlılıklar yalnızca aynı projedeki daha önce oluşturulmuş görevlere verilir,
+böylece graf her zaman döngüsüzdür (kritik yol senaryosu 409 dönmez).
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List
+
+BASE_DAY = date(2025, 3, 1)
+STATUSES = ("Devam Ediyor", "Tamamlandı", "Beklemede", "Aktif")
+STATUS_WEIGHTS = (4, 4, 1, 1)
+# Giriş (login) senaryosu için parolası olan kullanıcı
+LOGIN_PASSWORD = "benchmark-parola"
+
+
+@dataclass
+class Dataset:
+    owner_id: int             # projelerin bir kısmının sahibi, diğerlerinde atanan
+    staff_id: int
+    login_email: str
+    project_id: int           # sahibinin en kalabalık projesi (Gantt, kritik yol, burndown)
+    task_id: int
+    other_user_id: int
+    user_ids: List[int] = field(default_factory=list)
+    counts: dict = field(default_factory=dict)
+
+
+def _batched(ids, size=1000):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def generate(users=200, projects=1000, tasks=20000, dependency_density=0.3, seed=1, snapshot_days=14) -> Dataset:
+    """``dependency_density``: bağımlılığı olan görev oranı (her birinde 1-3 bağımlılık)."""
+    from projects.membership import rebuild_memberships
+    from projects.models import Project
+    from projects.snapshots import take_snapshots
+    from projects.utils import refresh_task_rollups
+    from tasks.models import Task
+    from users.models import User
+
+    rnd = random.Random(seed)
+
+    User.objects.bulk_create(
+        [
+            User(email=f"bench{i}@example.com", first_name="Kullanıcı", last_name=str(i), is_staff=(i == 1))
+            for i in range(users)
+        ],
+        batch_size=2000,
+    )
+    user_ids = list(User.objects.filter(email__startswith="bench").order_by("pk").values_list("pk", flat=True))
+    owner_id, staff_id = user_ids[0], user_ids[1]
+    login_user = User.objects.get(pk=user_ids[2])
+    login_user.set_password(LOGIN_PASSWORD)
+    login_user.save(update_fields=["password"])
+
+    # Sahip kullanıcı projelerin ~%5'ine sahip; geri kalanı rastgele
+    Project.objects.bulk_create(
+        [
+            Project(
+                name=f"Proje {i}", owner_id=owner_id if i == 0 or rnd.random() < 0.05 else rnd.choice(user_ids),
+                status=rnd.choice(("Aktif", "Tamamlandı")), progress=rnd.choice((0, 0, 10, 50)),
+                start_date=BASE_DAY - timedelta(days=rnd.randint(0, 120)) if rnd.random() < 0.6 else None,
+                end_date=BASE_DAY + timedelta(days=rnd.randint(1, 240)) if rnd.random() < 0.6 else None,
+            )
+            for i in range(projects)
+        ],
+        batch_size=2000,
+    )
+    project_ids = list(Project.objects.order_by("pk").values_list("pk", flat=True))
+
+    task_objects = []
+    for i in range(tasks):
+        start = BASE_DAY + timedelta(days=rnd.randint(-180, 180)) if rnd.random() < 0.7 else None
+        end = start + timedelta(days=rnd.randint(0, 45)) if start else None
+        task_objects.append(Task(
+            project_id=rnd.choice(project_ids), title=f"Görev {i}",
+            assignee_id=(owner_id if rnd.random() < 0.02 else rnd.choice(user_ids)) if rnd.random() < 0.8 else None,
+            start_date=start, end_date=end,
+            due_date=(end or BASE_DAY + timedelta(days=rnd.randint(-180, 200))) if rnd.random() < 0.9 else None,
+            status=rnd.choices(STATUSES, weights=STATUS_WEIGHTS)[0], progress=rnd.randint(0, 100),
+        ))
+    Task.objects.bulk_create(task_objects, batch_size=2000)
+
+    # Döngüsüz bağımlılıklar: aynı projede daha küçük id'li görevlere
+    by_project = {}
+    for pk, project_id in Task.objects.order_by("pk").values_list("pk", "project_id"):
+        by_project.setdefault(project_id, []).append(pk)
+    through = Task.dependencies.through
+    edges = []
+    for ids in by_project.values():
+        for position, pk in enumerate(ids[1:], start=1):
+            if rnd.random() < dependency_density:
+                for dependency in rnd.sample(ids[:position], min(position, rnd.randint(1, 3))):
+                    edges.append(through(from_task_id=pk, to_task_id=dependency))
+    through.objects.bulk_create(edges, batch_size=5000)
+
+    for batch in _batched(project_ids):
+        refresh_task_rollups(batch)
+        rebuild_memberships(batch)
+    for offset in range(snapshot_days):
+        take_snapshots(BASE_DAY - timedelta(days=offset))
+
+    owned = Project.objects.filter(owner_id=owner_id).values_list("pk", flat=True)
+    project_id = max(owned, key=lambda pk: len(by_project.get(pk, ())), default=project_ids[0])
+    return Dataset(
+        owner_id=owner_id,
+        staff_id=staff_id,
+        login_email=login_user.email,
+        project_id=project_id,
+        task_id=(by_project.get(project_id) or [Task.objects.values_list("pk", flat=True).first()])[-1],
+        other_user_id=user_ids[-1],
+        user_ids=user_ids,
+        counts={"users": users, "projects": projects, "tasks": tasks, "dependencies": len(edges)},
+    )
@@ -0,0 +1,181 @@
+"""Görev/proje indeksleri: önce (indekssiz) / sonra süre ve EXPLAIN QUERY PLAN.
+
+    python -m benchmarks.indexes --tasks 1000000
+    python -m benchmarks.indexes --tasks 1000000 --keep-file /tmp/bench.sqlite3
+
+Veri bir kez yüklenir; "önce" ölçümü Meta.indexes kaldırılmış halde, "sonra"
+ölçümü indeksler yeniden kurulup ANALYZE çalıştırıldıktan sonra yapılır.
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from .utils import benchmark_database, setup_django
+
+DONE = "Tamamlandı"
+STATUSES = [DONE, "Devam Ediyor", "Beklemede"]
+
+
+def seed(tasks, projects, users, seed_value=1):
+    from django.db import connection
+
+    from projects.models import Project
+    from tasks.models import Task
+    from users.models import User
+
+    rnd = random.Random(seed_value)
+    User.objects.bulk_create(
+        [User(email=f"bench{i}@example.com", first_name="Kullanıcı", last_name=str(i)) for i in range(users)],
+        batch_size=5000,
+    )
+    user_ids = list(User.objects.values_list("pk", flat=True))
+    now = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+    Project.objects.bulk_create(
+        [Project(name=f"Proje {i}", owner_id=rnd.choice(user_ids)) for i in range(projects)], batch_size=5000,
+    )
+    # created_at auto_now_add; sıralama anlamlı olsun diye yayalım
+    project_ids = list(Project.objects.values_list("pk", flat=True))
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"UPDATE {Project._meta.db_table} SET created_at = %s WHERE id = %s",
+            [(now - timedelta(minutes=i), pk) for i, pk in enumerate(project_ids)],
+        )
+
+    base = date(2024, 1, 1)
+    table = Task._meta.db_table
+    sql = (
+        f"INSERT INTO {table} (project_id, title, description, assignee_id, start_date, end_date, due_date, status,"
+        " progress, updated_at) VALUES (%s, %s, '', %s, %s, %s, %s, %s, %s, %s)"
+    )
+    batch = []
+    with connection.cursor() as cursor:
+        for i in range(tasks):
+            start = base + timedelta(days=rnd.randint(0, 720)) if rnd.random() < 0.7 else None
+            end = start + timedelta(days=rnd.randint(1, 60)) if start else None
+            due = (end or base + timedelta(days=rnd.randint(0, 780))) if rnd.random() < 0.9 else None
+            batch.append((
+                rnd.choice(project_ids), f"görev {i}", rnd.choice(user_ids) if rnd.random() < 0.8 else None,
+                start, end, due, rnd.choices(STATUSES, weights=(6, 3, 1))[0], rnd.randint(0, 100), now,
+            ))
+            if len(batch) >= 20000:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+    return user_ids
+
+
+def scenarios(user_id):
+    """Uç noktaların ürettiği sorgular (görünümlerdeki queryset'lerin aynısı)."""
+    from django.db.models import Count, F, Q
+
+    from projects.models import Project
+    from tasks.models import Task
+    from users.models import User
+
+    def keyset_page(qs, size=100):
+        return qs.order_by(F("due_date").asc(nulls_last=True), F("id").asc(nulls_last=True))[:size + 1]
+
+    today = date(2025, 6, 1)
+    return {
+        "reports_status_counts": lambda: Task.objects.values_list("status").annotate(cnt=Count("id")).order_by(),
+        "reports_users": lambda: (
+            User.objects.annotate(total=Count("task"), done=Count("task", filter=Q(task__status=DONE)))
+            .values("id", "total", "done").order_by("-total", "-done", "id")[:20]
+        ),
+        "tasks_by_date": lambda: keyset_page(
+            Task.objects.filter(start_date__gte=date(2025, 3, 1), end_date__lte=date(2025, 3, 15)).with_progress()
+        ),
+        "tasks_active": lambda: keyset_page(Task.objects.exclude(status=DONE).with_progress()),
+        "tasks_completed": lambda: keyset_page(Task.objects.filter(status=DONE).with_progress()),
+        "tasks_by_user": lambda: keyset_page(Task.objects.filter(assignee_id=user_id).with_progress()),
+        "dashboard_upcoming": lambda: (
+            Task.objects.filter(project__owner_id=user_id, due_date__gte=today)
+            .exclude(status=DONE).select_related("project", "assignee").order_by("due_date")[:10]
+        ),
+        "dashboard_counts": lambda: Task.objects.filter(project__owner_id=user_id).aggregate(
+            active=Count("pk", filter=~Q(status=DONE)), done=Count("pk", filter=Q(status=DONE)),
+        ),
+        "dashboard_recent_projects": lambda: Project.objects.filter(owner_id=user_id).order_by("-created_at")[:5],
+    }
+
+
+def measure(build, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = build()
+        if not isinstance(result, dict):
+            list(result)
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1000, 2)
+
+
+def explain(build):
+    qs = build()
+    if isinstance(qs, dict):
+        return None  # aggregate() doğrudan sonuç döndürür
+    return qs.explain().splitlines()
+
+
+def run_all(user_id, repeat):
+    results = {}
+    for name, build in scenarios(user_id).items():
+        results[name] = {"ms": measure(build, repeat), "plan": explain(build)}
+    return results
+
+
+def set_indexes(enabled):
+    from django.db import connection
+
+    from projects.models import Project
+    from tasks.models import Task
+
+    with connection.schema_editor() as editor:
+        for model in (Task, Project):
+            for index in model._meta.indexes:
+                if enabled:
+                    editor.add_index(model, index)
+                else:
+                    editor.remove_index(model, index)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--projects", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep-file", help="Test veritabanını bu dosyada tut (ör. /tmp/bench.sqlite3)")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database(args.keep_file):
+        started = time.perf_counter()
+        user_ids = seed(args.tasks, args.projects, args.users)
+        seconds = round(time.perf_counter() - started, 1)
+        user_id = user_ids[len(user_ids) // 2]
+
+        set_indexes(False)
+        before = run_all(user_id, args.repeat)
+        set_indexes(True)
+        after = run_all(user_id, args.repeat)
+
+    report = {"seed_seconds": seconds, "tasks": args.tasks, "scenarios": {}}
+    for name in before:
+        report["scenarios"][name] = {
+            "before_ms": before[name]["ms"],
+            "after_ms": after[name]["ms"],
+            "before_plan": before[name]["plan"],
+            "after_plan": after[name]["plan"],
+        }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Görev listesi: TaskSerializer + JSONRenderer vs. hızlı liste yolu (satır/sn).
+
+    python -m benchmarks.list_serializers --tasks 10000
+
+``encode`` yalnızca satırların sözlüğe + JSON'a çevrilmesidir (veri önceden
+okunmuş); ``total`` sorgular dahil uçtan uca süredir. İki yolun baytları
+karşılaştırılır (``identical``).
+"""
+import argparse
+import json
+import time
+
+from .utils import benchmark_database, setup_django
+
+
+def _best(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(tasks, repeat):
+    from rest_framework.renderers import JSONRenderer
+
+    from proje_yonetimi.fastlist import FastJSONRenderer, orjson
+    from tasks.models import Task
+    from tasks.serializers import TASK_LIST_COLUMNS, TaskSerializer, task_row_encoder
+
+    from .data import generate
+
+    generate(users=200, projects=50, tasks=tasks, dependency_density=0.3, snapshot_days=0)
+
+    def serializer_query():
+        return list(Task.objects.select_related("project", "assignee").with_dependencies().with_progress())
+
+    def serializer_encode(objs):
+        return JSONRenderer().render(TaskSerializer(objs, many=True).data)
+
+    def fast_query():
+        qs = Task.objects.with_progress().values_list(*TASK_LIST_COLUMNS, named=True)
+        return list(qs), qs.dependency_map()
+
+    def fast_encode(fetched):
+        rows, dependencies = fetched
+        encode = task_row_encoder()
+        return FastJSONRenderer().render([encode(row, dependencies) for row in rows])
+
+    objs, fetched = serializer_query(), fast_query()
+    results = {"rows": len(objs), "orjson": orjson is not None}
+    for key, query, encode, data in (
+        ("serializer", serializer_query, serializer_encode, objs),
+        ("fast", fast_query, fast_encode, fetched),
+    ):
+        encode_seconds, body = _best(lambda: encode(data), repeat)
+        total_seconds, _ = _best(lambda: encode(query()), repeat)
+        results[key] = {
+            "encode_seconds": round(encode_seconds, 4),
+            "encode_rows_per_second": round(len(objs) / encode_seconds),
+            "total_seconds": round(total_seconds, 4),
+            "total_rows_per_second": round(len(objs) / total_seconds),
+            "bytes": len(body),
+        }
+        results.setdefault("_bodies", []).append(body)
+    first, second = results.pop("_bodies")
+    results["identical"] = first == second
+    results["encode_speedup"] = round(results["serializer"]["encode_seconds"] / results["fast"]["encode_seconds"], 1)
+    results["total_speedup"] = round(results["serializer"]["total_seconds"] / results["fast"]["total_seconds"], 1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args.tasks, args.repeat)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
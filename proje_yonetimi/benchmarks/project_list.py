@@ -0,0 +1,79 @@
+"""ProjectViewSet listesi: görevleri prefetch edip Python'da hesaplama vs. özet + SQL.
+
+    python -m benchmarks.project_list --projects 1000 --tasks 200 --timed-ratio 0.1
+"""
+import argparse
+import json
+import random
+from datetime import date, timedelta
+
+from .utils import benchmark_database, setup_django, timed
+
+
+def seed(projects, tasks_per_project, timed_ratio, seed_value=1):
+    from projects.models import Project
+    from projects.utils import refresh_task_rollups
+    from tasks.models import Task
+    from users.models import User
+
+    rnd = random.Random(seed_value)
+    owner = User.objects.create_user(email="bench@example.com")
+    Project.objects.bulk_create(
+        [Project(name=f"Proje {i}", owner=owner) for i in range(projects)], batch_size=1000
+    )
+    project_ids = list(Project.objects.values_list("pk", flat=True))
+    base = date(2025, 1, 1)
+
+    batch = []
+    for pk in project_ids:
+        for _ in range(tasks_per_project):
+            start = end = None
+            if rnd.random() < timed_ratio:
+                start = base + timedelta(days=rnd.randint(0, 60))
+                end = start + timedelta(days=rnd.randint(1, 90))
+            batch.append(Task(project_id=pk, title="görev", progress=rnd.randint(0, 100),
+                              start_date=start, end_date=end))
+            if len(batch) >= 10000:
+                Task.objects.bulk_create(batch)
+                batch = []
+    Task.objects.bulk_create(batch)
+    for start in range(0, len(project_ids), 1000):
+        refresh_task_rollups(project_ids[start:start + 1000])
+
+
+def run(projects, tasks_per_project, timed_ratio):
+    from projects.models import Project
+    from projects.serializers import ProjectSerializer
+
+    results = {}
+    seed(projects, tasks_per_project, timed_ratio)
+
+    with timed(results, "before_prefetch_python"):
+        qs = Project.objects.select_related("owner").prefetch_related("tasks")
+        before = ProjectSerializer(qs, many=True).data
+
+    with timed(results, "after_rollup_sql"):
+        qs = Project.objects.select_related("owner").with_progress()
+        after = ProjectSerializer(qs, many=True).data
+
+    mismatches = sum(1 for a, b in zip(before, after) if a != b)
+    results["rows"] = len(after)
+    results["mismatches"] = mismatches
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--timed-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args.projects, args.tasks, args.timed_ratio)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""API senaryoları: tasks/, projects/, users/, dashboard/ ve search/ altındaki her yol.
+
+Her senaryo bir (URL adı, HTTP yöntemi) çiftini DRF test istemcisiyle çağırır.
+Veri değiştiren senaryolar her tekrarda geri alınan bir işlem içinde çalışır,
+böylece ölçümler aynı veri üzerinde tekrarlanır. ``uncovered_routes`` senaryosu
+olmayan yolları listeler; yeni bir yol eklendiğinde buraya da eklenmelidir.
+"""
+import importlib
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Optional
+
+from .data import BASE_DAY, LOGIN_PASSWORD
+
+URLCONFS = {
+    "tasks.urls": "/api/tasks/",
+    "projects.urls": "/api/projects/",
+    "users.urls": "/api/users/",
+    "dashboard.urls": "/api/dashboard/",
+    "search.urls": "/api/search/",
+}
+
+# Router'ın kök görünümü ("^$") liste yolunun arkasında kalır, erişilemez
+UNREACHABLE = {"api-root"}
+# HEAD/OPTIONS GET'in ve DRF meta verisinin kopyası, ayrıca ölçülmez
+METHODS = ("get", "post", "put", "patch", "delete")
+
+
+@dataclass
+class Scenario:
+    name: str
+    route: str                      # "<urlconf>:<url adı>" (adsız yollarda kalıp)
+    method: str
+    path: str
+    data: object = None
+    user: Optional[str] = "owner"   # "owner" | "staff" | None (anonim)
+    expected: int = 200
+    mutates: bool = False
+    before: Optional[Callable] = None
+    query: dict = field(default_factory=dict)
+
+
+def _route_key(urlconf, pattern):
+    return f"{urlconf}:{pattern.name or pattern.pattern}"
+
+
+def route_methods():
+    """{(rota, yöntem)}: senaryo beklenen tüm çiftler (biçim sonekli kopyalar hariç)."""
+    expected = set()
+    for urlconf in URLCONFS:
+        for pattern in importlib.import_module(urlconf).urlpatterns:
+            if pattern.name in UNREACHABLE or "format" in str(pattern.pattern):
+                continue
+            callback = pattern.callback
+            view_class = getattr(callback, "cls", None) or getattr(callback, "view_class", None)
+            allowed = set(getattr(view_class, "http_method_names", ()))
+            actions = getattr(callback, "actions", None)
+            methods = actions.keys() if actions else (m for m in METHODS if hasattr(view_class, m))
+            for method in methods:
+                if method in allowed and method in METHODS:
+                    expected.add((_route_key(urlconf, pattern), method.upper()))
+    return expected
+
+
+def uncovered_routes(scenarios):
+    covered = {(scenario.route, scenario.method) for scenario in scenarios}
+    return sorted(route_methods() - covered)
+
+
+def build_scenarios(dataset):
+    from django.core.cache import cache
+
+    from tasks.models import Task
+    from users.models import User
+
+    window = {"start": (BASE_DAY - timedelta(days=14)).isoformat(), "end": (BASE_DAY + timedelta(days=14)).isoformat()}
+    page = {"page_size": 100}
+    task_url = f"/api/tasks/{dataset.task_id}/"
+    project_url = f"/api/projects/{dataset.project_id}/"
+    visible_task_ids = list(
+        Task.objects.visible_to(User.objects.get(pk=dataset.owner_id)).order_by("pk").values_list("pk", flat=True)[:100]
+    )
+    new_task = {"project": dataset.project_id, "title": "Benchmark görevi", "status": "Devam Ediyor", "progress": 10}
+
+    def refresh_token():
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        return {"refresh": str(RefreshToken.for_user(User.objects.get(pk=dataset.owner_id)))}
+
+    S = Scenario
+    return [
+        # tasks/
+        S("tasks.gantt", "tasks.urls:gantt-tasks", "GET", "/api/tasks/gantt/", query={"project_id": dataset.project_id}),
+        S("tasks.gantt.all", "tasks.urls:gantt-tasks", "GET", "/api/tasks/gantt/", query={"format": "columnar"}),
+        S("tasks.critical_path", "tasks.urls:gantt-critical-path", "GET", "/api/tasks/gantt/critical-path/",
+          query={"project_id": dataset.project_id}),
+        S("tasks.calendar", "tasks.urls:calendar-tasks", "GET", "/api/tasks/calendar/", query=window),
+        S("tasks.calendar.ics", "tasks.urls:calendar-tasks", "GET", "/api/tasks/calendar/",
+          query={**window, "format": "ics"}),
+        S("tasks.calendar_feed", "tasks.urls:calendar-feed", "GET", "/api/tasks/calendar/feed/"),
+        S("tasks.calendar_feed_rotate", "tasks.urls:calendar-feed", "POST", "/api/tasks/calendar/feed/", mutates=True),
+        S("tasks.completed", "tasks.urls:completed-tasks", "GET", "/api/tasks/reports/completed/", query=page),
+        S("tasks.active", "tasks.urls:active-tasks", "GET", "/api/tasks/reports/active/", query=page),
+        S("tasks.by_user", "tasks.urls:tasks-by-user", "GET", f"/api/tasks/reports/by-user/{dataset.owner_id}/",
+          query=page),
+        S("tasks.by_date", "tasks.urls:tasks-by-date", "GET", "/api/tasks/reports/by-date/",
+          query={**window, **page}),
+        S("tasks.reports_summary", "tasks.urls:reports-summary", "GET", "/api/tasks/reports/summary/"),
+        S("tasks.list", "tasks.urls:task-list", "GET", "/api/tasks/", query=page),
+        S("tasks.list.staff", "tasks.urls:task-list", "GET", "/api/tasks/", user="staff", query=page),
+        S("tasks.create", "tasks.urls:task-list", "POST", "/api/tasks/", data=new_task, expected=201, mutates=True),
+        S("tasks.export", "tasks.urls:task-export", "GET", "/api/tasks/export/"),
+        S("tasks.retrieve", "tasks.urls:task-detail", "GET", task_url),
+        S("tasks.update", "tasks.urls:task-detail", "PUT", task_url, data=new_task, mutates=True),
+        S("tasks.partial_update", "tasks.urls:task-detail", "PATCH", task_url, data={"progress": 55}, mutates=True),
+        # Silme kapalı: görünüm 405 döner
+        S("tasks.destroy", "tasks.urls:task-detail", "DELETE", task_url, expected=405, mutates=True),
+        S("tasks.bulk_create", "tasks.urls:task-bulk", "POST", "/api/tasks/bulk/",
+          data=[{**new_task, "title": f"Toplu {i}"} for i in range(100)], expected=201, mutates=True),
+        S("tasks.bulk_update", "tasks.urls:task-bulk", "PATCH", "/api/tasks/bulk/",
+          data=[{"id": pk, "progress": 30} for pk in visible_task_ids], mutates=True),
+        S("tasks.bulk_status", "tasks.urls:task-bulk-status", "POST", "/api/tasks/bulk/status/",
+          data=[{"id": pk, "status": "Tamamlandı"} for pk in visible_task_ids], mutates=True),
+
+        # projects/
+        S("projects.dashboard_summary", "projects.urls:dashboard-summary/", "GET", "/api/projects/dashboard-summary/"),
+        S("projects.list", "projects.urls:project-list", "GET", "/api/projects/", query=page),
+        S("projects.list.staff", "projects.urls:project-list", "GET", "/api/projects/", user="staff", query=page),
+        S("projects.create", "projects.urls:project-list", "POST", "/api/projects/", data={"name": "Benchmark"},
+          expected=201, mutates=True),
+        S("projects.export", "projects.urls:project-export", "GET", "/api/projects/export/"),
+        S("projects.retrieve", "projects.urls:project-detail", "GET", project_url),
+        S("projects.update", "projects.urls:project-detail", "PUT", project_url, data={"name": "Yeni ad"},
+          mutates=True),
+        S("projects.partial_update", "projects.urls:project-detail", "PATCH", project_url, data={"progress": 40},
+          mutates=True),
+        S("projects.destroy", "projects.urls:project-detail", "DELETE", project_url, expected=204, mutates=True),
+        S("projects.burndown", "projects.urls:project-burndown", "GET", f"{project_url}burndown/",
+          query={"from": (BASE_DAY - timedelta(days=13)).isoformat(), "to": BASE_DAY.isoformat()}),
+
+        # users/
+        S("users.register", "users.urls:register", "POST", "/api/users/register/", user=None, expected=201,
+          data={"email": "yeni@example.com", "password": "gizli-parola-123"}, mutates=True),
+        S("users.login", "users.urls:login", "POST", "/api/users/login/", user=None,
+          data={"email": dataset.login_email, "password": LOGIN_PASSWORD}),
+        # Ağ erişimi gerektirmeyen yol: belirteç yok -> 400
+        S("users.google_login", "users.urls:google-login", "POST", "/api/users/google-login/", user=None,
+          data={}, expected=400),
+        S("users.google_config", "users.urls:google-config", "GET", "/api/users/google-config/", user=None),
+        S("users.refresh", "users.urls:token_refresh", "POST", "/api/users/refresh/", user=None,
+          before=refresh_token),
+        S("users.me", "users.urls:me", "GET", "/api/users/me/"),
+        S("users.find_by_email", "users.urls:find-by-email", "GET", "/api/users/find-by-email/",
+          query={"email": dataset.login_email}),
+        S("users.autocomplete", "users.urls:autocomplete", "GET", "/api/users/autocomplete/", query={"q": "bench1"}),
+        S("users.list", "users.urls:user-list", "GET", "/api/users/", query=page),
+        S("users.retrieve", "users.urls:user-detail", "GET", f"/api/users/{dataset.other_user_id}/"),
+        S("users.update", "users.urls:user-detail", "PUT", f"/api/users/{dataset.owner_id}/",
+          data={"email": "bench0@example.com", "first_name": "Ad", "last_name": "Soyad"}, mutates=True),
+        S("users.partial_update", "users.urls:user-detail", "PATCH", f"/api/users/{dataset.owner_id}/",
+          data={"first_name": "Ad"}, mutates=True),
+
+        # dashboard/
+        S("dashboard.summary", "dashboard.urls:summary", "GET", "/api/dashboard/summary/"),
+        S("dashboard.summary.cold", "dashboard.urls:summary", "GET", "/api/dashboard/summary/", before=cache.clear),
+
+        # search/
+        S("search", "search.urls:search", "GET", "/api/search/", query={"q": "görev 12"}),
+        S("search.staff", "search.urls:search", "GET", "/api/search/", user="staff", query={"q": "görev 12"}),
+    ]
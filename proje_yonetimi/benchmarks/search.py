@@ -0,0 +1,139 @@
+"""Arama: tam metin dizini (FTS5/tsvector) vs. ``icontains`` taraması, sorgu süresi.
+
+    python -m benchmarks.search --tasks 1000000
+    python -m benchmarks.search --tasks 1000000 --keep-file /tmp/search.sqlite3
+
+Başlık ve açıklamalar Zipf dağılımlı bir sözcük dağarcığından üretilir; böylece
+sorgular nadir, orta sıklıkta ve çok sık geçen sözcükleri kapsar. Görevler ham
+SQL ile eklenir, dizin tetikleyicilerle dolar. Her sorgu bir personel (kısıtsız)
+ve bir üye kullanıcı (üyelik alt sorgusu) için ölçülür.
+"""
+import argparse
+import itertools
+import json
+import random
+import statistics
+import time
+
+from .utils import benchmark_database, setup_django
+
+SYLLABLES = ("ka", "le", "mi", "to", "ru", "sa", "ne", "di", "po", "za", "gü", "şe", "çi", "ba", "ko", "ye")
+VOCABULARY = 20000
+
+
+def vocabulary(rnd, size=VOCABULARY):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4))))
+    return sorted(words, key=lambda _: rnd.random())
+
+
+def seed(tasks, projects, users, seed_value=1):
+    from django.db import connection
+    from django.utils import timezone
+
+    from projects.membership import rebuild_memberships
+    from projects.models import Project
+    from tasks.models import Task
+    from users.models import User
+
+    rnd = random.Random(seed_value)
+    words = vocabulary(rnd)
+    # Zipf: i. sözcüğün ağırlığı 1/i
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+    def text(count):
+        return " ".join(rnd.choices(words, cum_weights=cum_weights, k=count))
+
+    User.objects.bulk_create([User(email=f"search{i}@example.com") for i in range(users)], batch_size=5000)
+    user_ids = list(User.objects.values_list("pk", flat=True))
+    Project.objects.bulk_create(
+        [Project(name=text(2), description=text(8), owner_id=rnd.choice(user_ids)) for _ in range(projects)],
+        batch_size=5000,
+    )
+    project_ids = list(Project.objects.values_list("pk", flat=True))
+    rebuild_memberships(project_ids)
+
+    sql = (
+        f"INSERT INTO {Task._meta.db_table} (project_id, title, description, status, progress, updated_at)"
+        " VALUES (%s, %s, %s, %s, 0, %s)"
+    )
+    now = timezone.now()
+    batch = []
+    with connection.cursor() as cursor:
+        for _ in range(tasks):
+            batch.append((rnd.choice(project_ids), text(rnd.randint(2, 5)), text(rnd.randint(0, 20)), "Beklemede", now))
+            if len(batch) >= 20000:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+    return words, user_ids[0]
+
+
+def queries(words):
+    return {
+        "no_match": ["yokböylesözcük"],
+        "rare_word": [words[15000]],
+        "mid_word": [words[300]],
+        "common_word": [words[0]],
+        "two_words": [words[50], words[400]],
+        "prefix": [words[2000][:3]],
+    }
+
+
+def _measure(fn, repeat):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return {"p50_ms": round(statistics.median(timings) * 1000, 2), "max_ms": round(max(timings) * 1000, 2),
+            "hits": len(result)}
+
+
+def run(tasks, projects, users, repeat, limit):
+    from django.db import connection
+
+    from projects.models import ProjectMembership
+    from search.backends import FallbackBackend, get_backend
+    from users.models import User
+
+    start = time.perf_counter()
+    words, user_id = seed(tasks, projects, users)
+    results = {"database": connection.vendor, "tasks": tasks, "seed_seconds": round(time.perf_counter() - start, 1)}
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    indexed, scan = get_backend(), FallbackBackend()
+    scopes = {"staff": None, "member": ProjectMembership.objects.for_user(User.objects.get(pk=user_id))}
+    for name, terms in queries(words).items():
+        for scope_name, scope in scopes.items():
+            results[f"{name}.{scope_name}"] = {
+                "terms": terms,
+                "index": _measure(lambda: indexed.rank("tasks", terms, limit, scope), repeat),
+                # Tarama yavaş: tek ölçüm
+                "like_scan": _measure(lambda: scan.rank("tasks", terms, limit, scope), 1),
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--projects", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--keep-file", help="Veritabanını bu dosyada tut (SQLite)")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database(args.keep_file):
+        results = run(args.tasks, args.projects, args.users, args.repeat, args.limit)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Günlük ilerleme görüntüsü komutu: proje sayısına göre süre ve sorgu sayısı.
+
+    python -m benchmarks.snapshots --projects 100000 --tasks 1000000
+
+İlk çalıştırma tüm projeleri yazar; ikinci çalıştırma (devam) hiçbir şey
+yazmamalı, ``--force`` ise hepsini yeniden hesaplayıp günceller.
+"""
+import argparse
+import json
+from datetime import date
+
+from .utils import benchmark_database, setup_django, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--keep-file", help="Test veritabanını bu dosyada tut (ör. /tmp/bench.sqlite3)")
+    args = parser.parse_args()
+
+    setup_django()
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from projects.snapshots import take_snapshots
+
+    from .indexes import seed
+
+    day = date(2025, 1, 15)
+    with benchmark_database(args.keep_file):
+        seed(args.tasks, args.projects, args.users)
+        # Ham INSERT sinyalleri atlar; görev özetleri gerçek veriye göre kurulsun
+        call_command("rebuild_project_rollups", stdout=StringIO())
+
+        results, written = {}, {}
+        for key, force in (("ilk", False), ("devam", False), ("force", True)):
+            with timed(results, key):
+                written[key] = take_snapshots(day, batch_size=args.batch_size, force=force).written
+            results[key]["written"] = written[key]
+
+    print(json.dumps({"projects": args.projects, "tasks": args.tasks, "results": results}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from django.test import TestCase
+
+from .api import percentile, run
+from .compare import compare
+from .data import generate
+from .scenarios import build_scenarios, uncovered_routes
+
+
+def _result(**metrics):
+    return {"p50_ms": 10.0, "p95_ms": 20.0, "queries": 3, "peak_kib": 100.0, "status": 200, **metrics}
+
+
+class ScenarioSuiteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataset = generate(users=12, projects=8, tasks=120, snapshot_days=3)
+
+    def test_generator_is_deterministic(self):
+        from projects.models import Project
+        from tasks.models import Task
+        from users.models import User
+
+        rows = list(Task.objects.order_by("pk").values_list("title", "status", "progress", "start_date"))
+        Task.objects.all().delete()
+        Project.objects.all().delete()
+        User.objects.all().delete()
+        generate(users=12, projects=8, tasks=120, snapshot_days=3)
+        self.assertEqual(list(Task.objects.order_by("pk").values_list("title", "status", "progress", "start_date")), rows)
+
+    def test_every_route_has_a_scenario(self):
+        self.assertEqual(uncovered_routes(build_scenarios(self.dataset)), [])
+
+    def test_scenarios_return_expected_status_and_leave_data_intact(self):
+        from tasks.models import Task
+
+        before = Task.objects.count()
+        results, uncovered = run(self.dataset, repeat=1, warmup=0)
+        self.assertEqual(uncovered, [])
+        self.assertEqual({name: r.get("error") for name, r in results.items() if "error" in r}, {})
+        self.assertEqual(Task.objects.count(), before)
+        self.assertTrue(all(r["queries"] >= 0 and r["peak_kib"] > 0 for r in results.values()))
+
+
+class CompareTests(TestCase):
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.95), 7)
+
+    def test_regressions_beyond_threshold(self):
+        baseline = {"scenarios": {"a": _result(), "b": _result()}}
+        current = {"scenarios": {"a": _result(p95_ms=30.0), "b": _result(p50_ms=11.0, queries=4)}}
+        regressed = {(name, metric) for name, metric, *_, flag in compare(baseline, current) if flag}
+        self.assertEqual(regressed, {("a", "p95_ms"), ("b", "queries")})
+
+    def test_small_absolute_deltas_are_noise(self):
+        baseline = {"scenarios": {"a": _result(p50_ms=0.5)}}
+        current = {"scenarios": {"a": _result(p50_ms=1.2)}}
+        self.assertFalse(any(row[5] for row in compare(baseline, current)))
+
+    def test_new_error_status_is_a_regression(self):
+        baseline = {"scenarios": {"a": _result()}}
+        current = {"scenarios": {"a": _result(status=500, error="beklenen durum 200, gelen 500")}}
+        self.assertIn(("a", "status"), {(row[0], row[1]) for row in compare(baseline, current) if row[5]})
@@ -0,0 +1,42 @@
+"""Benchmark betikleri için ortak yardımcılar.
+
+Betikler proje kökünden modül olarak çalıştırılır:
+    python -m benchmarks.project_list --projects 1000 --tasks 200
+"""
+import os
+import time
+from contextlib import contextmanager
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "proje_yonetimi.settings")
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(keep_file=None):
+    """Geçici test veritabanı oluştur, iş bitince sil (geliştirme verisine dokunmaz)."""
+    from django.db import connection
+
+    if keep_file:
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = keep_file
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=bool(keep_file))
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=bool(keep_file))
+
+
+@contextmanager
+def timed(results, key):
+    """Bloğun süresini (sn) ve sorgu sayısını results[key] içine yaz."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+    results[key] = {"seconds": round(elapsed, 4), "queries": len(ctx.captured_queries)}
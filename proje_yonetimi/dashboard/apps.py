@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dashboard'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .plan import summary_plan
+
+        # Şema yetenekleri istek sırasında değil, burada bir kez çözülür
+        summary_plan()
@@ -0,0 +1,94 @@
+"""Kullanıcı + gün bazında dashboard özeti önbelleği.
+
+Anahtar: ``dashboard:<görünüm>:<kullanıcı>:<tarih>:<genel sürüm>:<kullanıcı sürümü>``.
+Tarih anahtarda, çünkü dinamik ilerleme ``today``'e bağlıdır. Geçersiz kılma
+veri anahtarlarını silmek yerine sürüm belirtecini değiştirir; böylece
+hesaplama sırasında gelen bir değişiklik eski sürüme yazılır ve bir daha okunmaz.
+Belirteçler rastgeledir: önbellekten atılan bir sürüm anahtarı daha önce
+kullanılmış bir değere geri dönemez.
+
+Sinyaller ``dashboard.signals`` içinde; sıcak okuma veritabanına hiç gitmez.
+ETag de belirteçlerden sorgusuz çıkar (``summary_validators``).
+"""
+import threading
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+
+from proje_yonetimi.conditional import Validators, weak_etag
+
+GENERATION_KEY = "dashboard:generation"
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _token():
+    return uuid.uuid4().hex[:16]
+
+
+def _user_version_key(user_id):
+    return f"dashboard:user-version:{user_id}"
+
+
+def _versions(user_id):
+    keys = [GENERATION_KEY, _user_version_key(user_id)]
+    values = cache.get_many(keys)
+    missing = {key: _token() for key in keys if key not in values}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        values.update(missing)
+    return values[keys[0]], values[keys[1]]
+
+
+def _count(name, outcome):
+    with _stats_lock:
+        _stats[(name, outcome)] += 1
+
+
+def cached_summary(name, user, today, build):
+    """``build()`` sonucunu kullanıcı ve gün için önbellekten ver ya da hesaplayıp yaz."""
+    generation, version = _versions(user.pk)
+    key = f"dashboard:{name}:{user.pk}:{today.isoformat()}:{generation}:{version}"
+    data = cache.get(key)
+    if data is not None:
+        _count(name, "hit")
+        return data
+
+    _count(name, "miss")
+    data = build()
+    cache.set(key, data, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return data
+
+
+def summary_validators(name, user, today):
+    """Özet değişmediyse aynı kalan zayıf ETag (veritabanına gitmez)."""
+    generation, version = _versions(user.pk)
+    return Validators(etag=weak_etag([name, user.pk, today.isoformat(), generation, version]))
+
+
+def invalidate_users(user_ids):
+    user_ids = {pk for pk in user_ids if pk is not None}
+    if user_ids:
+        cache.set_many({_user_version_key(pk): _token() for pk in user_ids}, timeout=None)
+
+
+def invalidate_all():
+    """Herkesin özetini etkileyen değişiklikler için (ör. toplam kullanıcı sayısı)."""
+    cache.set(GENERATION_KEY, _token(), timeout=None)
+
+
+def cache_stats():
+    """{görünüm: {"hit": n, "miss": n}} — süreç başına sayaçlar."""
+    with _stats_lock:
+        result = {}
+        for (name, outcome), count in _stats.items():
+            result.setdefault(name, {"hit": 0, "miss": 0})[outcome] = count
+        return result
+
+
+def reset_cache_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,84 @@
+"""Dashboard özetinin derlenmiş planı.
+
+Şema soruları ("Project'te members var mı?" vb.) her istekte değil, uygulama
+hazır olduğunda (``DashboardConfig.ready``) bir kez yanıtlanır; görünüm yalnızca
+hazır Q nesnelerini ve alan adlarını kullanır.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from django.apps import apps
+from django.db.models import Q
+
+# ---- SİSTEMİNDEKİ DURUM ADLARI ----
+ACTIVE_STATUSES = ["Devam Ediyor", "Beklemede"]
+DONE_STATUSES   = ["Tamamlandı"]
+CANCELLED       = []  # istersen "İptal" vb. ekleyebilirsin
+
+
+@dataclass(frozen=True)
+class SummaryPlan:
+    project_user_lookups: Tuple[str, ...]   # kullanıcının içinde olduğu projeler
+    task_user_lookups: Tuple[str, ...]      # kullanıcıyla doğrudan ilişkili görevler
+    task_project_lookup: Optional[str]      # Task -> Project FK adı
+    active_q: Optional[Q]                   # None: filtre yok
+    done_q: Optional[Q]
+    upcoming_q: Optional[Q]                 # yaklaşan görevlerden elenecek durumlar
+    members_lookup: Optional[str]           # Project üzerinden sayılacak kullanıcı alanı
+    project_order: str
+    project_progress: bool
+    project_task_rollup: bool               # task_count / task_progress_sum özeti var mı
+    project_tasks_lookup: Optional[str]     # Project -> Task ters ilişki adı (ortalama için)
+    task_due_date: bool
+    task_select_related: Tuple[str, ...]
+
+
+def _field_names(model):
+    return {getattr(f, "name", None) for f in model._meta.get_fields()}
+
+
+def compile_summary_plan() -> SummaryPlan:
+    Project = apps.get_model("projects", "Project")
+    Task = apps.get_model("tasks", "Task")
+    project_fields = _field_names(Project)
+    task_fields = _field_names(Task)
+
+    if "status" in task_fields:
+        active_q = ~Q(status__in=DONE_STATUSES + CANCELLED)
+        done_q = Q(status__in=DONE_STATUSES)
+    elif "date_completed" in task_fields:
+        active_q = Q(date_completed__isnull=True)
+        done_q = Q(date_completed__isnull=False)
+    else:
+        active_q, done_q = None, None  # hepsi aktif sayılır
+
+    task_project_lookup = "project" if "project" in task_fields else None
+    project_tasks_lookup = None
+    if task_project_lookup:
+        project_tasks_lookup = Task._meta.get_field("project").related_query_name()
+
+    return SummaryPlan(
+        project_user_lookups=tuple(name for name in ("owner", "created_by", "members") if name in project_fields),
+        task_user_lookups=tuple(name for name in ("assignee", "created_by") if name in task_fields),
+        task_project_lookup=task_project_lookup,
+        active_q=active_q,
+        done_q=done_q,
+        upcoming_q=active_q if "status" in task_fields else None,
+        members_lookup="members" if "members" in project_fields else "owner" if "owner" in project_fields else None,
+        project_order=next((name for name in ("created_at", "created") if name in project_fields), "id"),
+        project_progress="progress" in project_fields,
+        project_task_rollup={"task_count", "task_progress_sum"} <= project_fields,
+        project_tasks_lookup=project_tasks_lookup,
+        task_due_date="due_date" in task_fields,
+        task_select_related=tuple(name for name in ("project", "assignee") if name in task_fields),
+    )
+
+
+_plan: Optional[SummaryPlan] = None
+
+
+def summary_plan() -> SummaryPlan:
+    global _plan
+    if _plan is None:
+        _plan = compile_summary_plan()
+    return _plan
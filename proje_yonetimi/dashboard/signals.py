@@ -0,0 +1,82 @@
+"""Dashboard önbelleğini yalnızca etkilenen kullanıcılar için geçersiz kıl.
+
+Bir görev değişikliği proje sahibini ve (eski/yeni) atananı, bir proje
+değişikliği sahibini ve projedeki görevlere atananları etkiler. Toplam kullanıcı
+sayısı da gösterildiği için kullanıcı ekleme/silme herkesi geçersiz kılar.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from projects.models import Project
+from tasks.models import Task
+from tasks.signals import tasks_bulk_changed
+from users.models import User
+
+from .cache import invalidate_all, invalidate_users
+
+
+def _owner_ids(project_ids):
+    project_ids = {pk for pk in project_ids if pk is not None}
+    if not project_ids:
+        return set()
+    return set(Project.objects.filter(pk__in=project_ids).values_list("owner_id", flat=True))
+
+
+def _assignee_ids(project_ids):
+    return set(
+        Task.objects.filter(project_id__in=project_ids, assignee__isnull=False)
+        .values_list("assignee_id", flat=True).distinct()
+    )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_for_task(sender, instance, raw=False, origin=None, **kwargs):
+    if raw:
+        return
+    if isinstance(origin, Project):
+        # Proje silinirken sahibi invalidate_for_project'te; burada yalnızca atanan
+        invalidate_users([instance.assignee_id])
+        return
+    project_ids = {instance.project_id}
+    user_ids = {instance.assignee_id}
+    previous = getattr(instance, "_loaded_links", None)
+    if previous is not None:
+        project_ids.add(previous[0])
+        user_ids.add(previous[1])
+    invalidate_users(user_ids | _owner_ids(project_ids))
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_for_project(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    user_ids = {instance.owner_id, getattr(instance, "_loaded_owner_id", None)}
+    # Proje adı/ilerlemesi atananların yaklaşan görevlerinde de görünür
+    invalidate_users(user_ids | _assignee_ids([instance.pk]))
+
+
+@receiver(tasks_bulk_changed)
+def invalidate_after_bulk(sender, project_ids, user_ids=(), **kwargs):
+    # user_ids: toplu yeniden atamada görevi elinden alınanlar
+    invalidate_users(set(user_ids) | _owner_ids(project_ids) | _assignee_ids(project_ids))
+
+
+@receiver(post_save, sender=User)
+def invalidate_for_user(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if created:
+        invalidate_all()
+        return
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    # Ad/e-posta, sahiplerin özetinde "atanan" olarak görünür
+    owners = set(Task.objects.filter(assignee=instance).values_list("project__owner_id", flat=True).distinct())
+    invalidate_users(owners | {instance.pk})
+
+
+@receiver(post_delete, sender=User)
+def invalidate_for_user_delete(sender, instance, **kwargs):
+    invalidate_all()
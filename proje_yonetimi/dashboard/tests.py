@@ -1,3 +1,208 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from projects.models import Project
+from tasks.models import Task
+from tasks.signals import tasks_bulk_changed
+from users.models import User
+
+from .cache import cache_stats, reset_cache_stats
+
+
+class DashboardCacheTests(TestCase):
+    urls = ("/api/dashboard/summary/", "/api/projects/dashboard-summary/")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.assignee = User.objects.create_user(email="assignee@example.com")
+        cls.other = User.objects.create_user(email="other@example.com")
+        cls.project = Project.objects.create(name="Önbellek", owner=cls.owner)
+        cls.other_project = Project.objects.create(name="Başka", owner=cls.other)
+        cls.task = Task.objects.create(
+            project=cls.project, title="Yaklaşan", assignee=cls.assignee,
+            due_date=timezone.now().date() + timedelta(days=2),
+        )
+
+    def setUp(self):
+        cache.clear()
+        reset_cache_stats()
+        self.client = APIClient()
+
+    def get(self, user, url):
+        self.client.force_authenticate(user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def misses(self, user, url):
+        """İsteğin önbellekten mi (0) hesaplanarak mı (>0) geldiğini sorgu sayısıyla ölç."""
+        self.client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        return len(ctx.captured_queries)
+
+    def test_warm_hit_runs_no_queries(self):
+        for url in self.urls:
+            cold = self.get(self.owner, url)
+            with self.assertNumQueries(0):
+                warm = self.client.get(url).json()
+            self.assertEqual(cold, warm)
+        self.assertEqual(cache_stats(), {
+            "dashboard": {"hit": 1, "miss": 1},
+            "project-dashboard": {"hit": 1, "miss": 1},
+        })
+
+    def test_task_change_invalidates_only_owner_and_assignee(self):
+        url = self.urls[0]
+        for user in (self.owner, self.assignee, self.other):
+            self.get(user, url)
+
+        self.task.title = "Yeni başlık"
+        self.task.save()
+
+        self.assertEqual(self.get(self.owner, url)["upcoming_tasks"][0]["title"], "Yeni başlık")
+        self.assertEqual(self.get(self.assignee, url)["upcoming_tasks"][0]["title"], "Yeni başlık")
+        self.assertEqual(self.misses(self.other, url), 0)
+
+    def test_reassignment_invalidates_previous_assignee(self):
+        url = self.urls[0]
+        self.assertEqual(len(self.get(self.assignee, url)["upcoming_tasks"]), 1)
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.assignee = self.other
+        task.save()
+
+        self.assertEqual(self.get(self.assignee, url)["upcoming_tasks"], [])
+        self.assertEqual(len(self.get(self.other, url)["upcoming_tasks"]), 1)
+
+    def test_bulk_reassignment_invalidates_previous_assignee(self):
+        url = self.urls[0]
+        self.assertEqual(self.get(self.assignee, url)["active_tasks"], 1)
+
+        self.client.force_authenticate(self.owner)
+        response = self.client.patch(
+            "/api/tasks/bulk/", [{"id": self.task.pk, "assignee": self.other.pk}], format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.get(self.assignee, url)["active_tasks"], 0)
+        self.assertEqual(self.get(self.other, url)["active_tasks"], 1)
+
+    def test_project_rename_reaches_assignees(self):
+        url = self.urls[0]
+        self.get(self.assignee, url)
+        project = Project.objects.get(pk=self.project.pk)
+        project.name = "Yeniden adlandırıldı"
+        project.save()
+        self.assertEqual(self.get(self.assignee, url)["upcoming_tasks"][0]["project_name"], "Yeniden adlandırıldı")
+
+    def test_bulk_change_and_new_user(self):
+        url = self.urls[1]
+        self.assertEqual(self.get(self.owner, url)["aktif_gorev"], 1)
+
+        Task.objects.filter(pk=self.task.pk).update(status="Tamamlandı")
+        tasks_bulk_changed.send(sender=Task, project_ids=[self.project.pk])
+        body = self.get(self.owner, url)
+        self.assertEqual((body["aktif_gorev"], body["tamamlanan"]), (0, 1))
+
+        self.get(self.other, url)
+        User.objects.create_user(email="new@example.com")
+        self.assertEqual(self.get(self.other, url)["ekip_uyesi"], 4)
+
+    def test_login_timestamp_does_not_invalidate(self):
+        url = self.urls[0]
+        self.get(self.owner, url)
+        self.owner.last_login = timezone.now()
+        self.owner.save(update_fields=["last_login"])
+        self.assertEqual(self.misses(self.owner, url), 0)
+
+
+class DashboardSummaryPlanTests(TestCase):
+    url = "/api/dashboard/summary/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="plan@example.com")
+        cls.helper = User.objects.create_user(email="helper@example.com", first_name="Ayşe", last_name="Kaya")
+        today = timezone.now().date()
+        for i in range(8):
+            project = Project.objects.create(name=f"P{i}", owner=cls.user, progress=i * 10)
+            for j in range(6):
+                Task.objects.create(
+                    project=project, title=f"T{i}-{j}", assignee=cls.helper,
+                    status="Tamamlandı" if j == 0 else "Devam Ediyor",
+                    due_date=today + timedelta(days=j),
+                )
+        foreign = Project.objects.create(name="Yabancı", owner=cls.helper)
+        Task.objects.create(project=foreign, title="Bana atanan", assignee=cls.user, due_date=today)
+        Task.objects.create(project=foreign, title="Görünmez", due_date=today)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_payload_in_fixed_number_of_queries(self):
+        with self.assertNumQueries(4):
+            body = self.client.get(self.url).json()
+
+        self.assertEqual(body["total_projects"], 8)
+        self.assertEqual(body["active_tasks"], 8 * 5 + 1)
+        self.assertEqual(body["completed"], 8)
+        self.assertEqual(body["members"], 1)
+        self.assertEqual([p["name"] for p in body["recent_projects"]], ["P7", "P6", "P5", "P4", "P3"])
+        self.assertEqual(body["recent_projects"][0]["effective_progress"], 70)
+
+        upcoming = body["upcoming_tasks"]
+        self.assertEqual(len(upcoming), 10)
+        self.assertNotIn("Görünmez", [t["title"] for t in upcoming])
+        self.assertTrue(all(not t["title"].endswith("-0") for t in upcoming))  # tamamlananlar yok
+        mine = next(t for t in upcoming if t["title"] == "Bana atanan")
+        self.assertEqual((mine["project_name"], mine["assignee_name"]), ("Yabancı", "plan@example.com"))
+        other = next(t for t in upcoming if t["title"] != "Bana atanan")
+        self.assertEqual(other["assignee_name"], "Ayşe Kaya")
+
+    def test_query_count_does_not_grow_with_data(self):
+        project = Project.objects.create(name="Ek", owner=self.user)
+        Task.objects.bulk_create([Task(project=project, title=f"x{i}") for i in range(50)])
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+
+class DashboardConditionalGetTests(TestCase):
+    url = "/api/dashboard/summary/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="etag@example.com")
+        cls.project = Project.objects.create(name="ETag", owner=cls.owner)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_not_modified_without_building_or_querying(self):
+        from unittest import mock
+
+        from .views import DashboardSummaryView
+
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        with mock.patch.object(DashboardSummaryView, "build_summary", side_effect=AssertionError("hesaplandı")), \
+                self.assertNumQueries(0):
+            response = self.client.get(self.url, headers={"if-none-match": first["ETag"]})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
 
-# Create your tests here.
+        Task.objects.create(project=self.project, title="Yeni")
+        response = self.client.get(self.url, headers={"if-none-match": first["ETag"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
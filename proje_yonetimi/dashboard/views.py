@@ -1,99 +1,91 @@
 # dashboard/views.py
 from datetime import timedelta
-from django.db.models import Q, Avg
+from django.db.models import Avg, Count, Q
 from django.utils.timezone import now
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from proje_yonetimi.conditional import not_modified_response, with_validators
 from projects.models import Project
+from .cache import cached_summary, summary_validators
+from .plan import summary_plan
 from tasks.models import Task
-from users.models import User
-
-
-# ---- SİSTEMİNDEKİ DURUM ADLARI ----
-ACTIVE_STATUSES = ["Devam Ediyor", "Beklemede"]
-DONE_STATUSES   = ["Tamamlandı"]
-CANCELLED       = []  # istersen "İptal" vb. ekleyebilirsin
-
-
-def has_field(model, name: str) -> bool:
-    return any(getattr(f, "name", None) == name for f in model._meta.get_fields())
 
 
 class DashboardSummaryView(APIView):
+    """Özet, proje/görev sayısından bağımsız olarak en fazla 4 sorguda çıkar:
+    proje sayıları, görev sayıları, son projeler, yaklaşan görevler."""
+
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        u = request.user
+        today = now().date()
+        # Önbellek sürümleri sinyallerle zaten kesin geçersiz kılınıyor; ETag de onlardan
+        validators = summary_validators("dashboard", request.user, today)
+        not_modified = not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
+        data = cached_summary("dashboard", request.user, today, lambda: self.build_summary(request.user, today))
+        return with_validators(Response(data), validators)
+
+    def build_summary(self, u, today):
+        plan = summary_plan()
 
         # --- Kullanıcının içinde olduğu projeler (owner / created_by / members)
         proj_q = Q()
-        if has_field(Project, "owner"):
-            proj_q |= Q(owner=u)
-        if has_field(Project, "created_by"):
-            proj_q |= Q(created_by=u)
-        if has_field(Project, "members"):          # ManyToMany ise
-            proj_q |= Q(members=u)
+        for lookup in plan.project_user_lookups:
+            proj_q |= Q(**{lookup: u})
 
         if proj_q:
-            user_projects = Project.objects.filter(proj_q).distinct()
-        else:
+            user_projects = Project.objects.filter(proj_q)
+        elif plan.task_project_lookup and "assignee" in plan.task_user_lookups:
             # Proje şeması çok yalınsa, kullanıcının görevlerinden projeyi türet
-            if has_field(Task, "assignee") and has_field(Task, "project"):
-                proj_ids = Task.objects.filter(assignee=u).values_list("project_id", flat=True)
-                user_projects = Project.objects.filter(id__in=proj_ids).distinct()
-            else:
-                user_projects = Project.objects.none()
-
-        total_projects = user_projects.count()
-
-        # --- Kullanıcıyla ilişkili görevler (proje ilişkili + atanan + oluşturan)
-        task_q = Q(project__in=user_projects)
-        if has_field(Task, "assignee"):
-            task_q |= Q(assignee=u)
-        if has_field(Task, "created_by"):
-            task_q |= Q(created_by=u)
-
-        user_tasks = Task.objects.filter(task_q).distinct()
-
-        # --- Aktif / tamamlanan sayıları (status alanı varsa Türkçe değerlerle)
-        if has_field(Task, "status"):
-            active_tasks = user_tasks.exclude(status__in=DONE_STATUSES + CANCELLED).count()
-            completed    = user_tasks.filter(status__in=DONE_STATUSES).count()
-        else:
-            # status yoksa kaba bir ayrım (date_completed varsa)
-            if has_field(Task, "date_completed"):
-                active_tasks = user_tasks.filter(date_completed__isnull=True).count()
-                completed    = user_tasks.filter(date_completed__isnull=False).count()
-            else:
-                active_tasks = user_tasks.count()
-                completed    = 0
-
-        # --- Üye sayısı (members varsa ordan; yoksa owner sayısı)
-        if has_field(Project, "members"):
-            members = User.objects.filter(projects__in=user_projects).distinct().count()
-        elif has_field(Project, "owner"):
-            members = user_projects.values("owner").distinct().count()
+            user_projects = Project.objects.filter(id__in=Task.objects.filter(assignee=u).values("project_id"))
         else:
-            members = 1  # en azından kendin varsın
-
-        # --- Son projeler (5 adet) + etkin ilerleme
-        order_proj = (
-            "created_at" if has_field(Project, "created_at")
-            else "created" if has_field(Project, "created")
-            else "id"
-        )
-        recent_qs = user_projects.order_by(f"-{order_proj}")[:5]
+            user_projects = Project.objects.none()
+
+        # members join'i satırları çoğaltabilir; sonraki sorgularda alt sorgu (pk IN ...) olarak kullan
+        project_ids = user_projects.values("pk")
+        scoped_projects = Project.objects.filter(pk__in=project_ids)
+
+        # --- 1) Proje ve üye sayısı
+        project_counts = {"total": Count("pk")}
+        if plan.members_lookup:
+            project_counts["members"] = Count(plan.members_lookup, distinct=True)
+        counts = scoped_projects.aggregate(**project_counts)
+        total_projects = counts["total"]
+        members = counts.get("members") if plan.members_lookup else 1  # en azından kendin varsın
+
+        # --- 2) Kullanıcıyla ilişkili görevler (proje ilişkili + atanan + oluşturan): aktif / tamamlanan
+        task_q = Q(**{f"{plan.task_project_lookup}__in": project_ids}) if plan.task_project_lookup else Q(pk__in=[])
+        for lookup in plan.task_user_lookups:
+            task_q |= Q(**{lookup: u})
+        user_tasks = Task.objects.filter(task_q)
+
+        task_counts = {"active": Count("pk", filter=plan.active_q)}
+        if plan.done_q is not None:
+            task_counts["completed"] = Count("pk", filter=plan.done_q)
+        counts = user_tasks.aggregate(**task_counts)
+        active_tasks = counts["active"]
+        completed = counts.get("completed", 0)
+
+        # --- 3) Son projeler (5 adet) + etkin ilerleme
+        recent_qs = scoped_projects.order_by(f"-{plan.project_order}")
+        if plan.project_tasks_lookup and not plan.project_task_rollup:
+            recent_qs = recent_qs.annotate(task_average=Avg(f"{plan.project_tasks_lookup}__progress"))
+        recent_qs = recent_qs[:5]
 
         recent_projects = []
         for p in recent_qs:
             # Projede progress alanı varsa onu, yoksa görev ortalamasını kullan
-            if has_field(Project, "progress") and getattr(p, "progress", None) is not None:
+            if plan.project_progress and getattr(p, "progress", None) is not None:
                 eff = round(p.progress or 0)
+            elif plan.project_task_rollup:
+                eff = round(p.task_progress_sum / p.task_count) if p.task_count else 0
             else:
-                agg = Task.objects.filter(project=p).aggregate(avg=Avg("progress"))
-                eff = round(agg["avg"] or 0)
+                eff = round(getattr(p, "task_average", None) or 0)
 
             recent_projects.append({
                 "id": p.id,
@@ -105,39 +97,30 @@ class DashboardSummaryView(APIView):
                 "progress": eff,
             })
 
-        # --- Yaklaşan görevler (14 gün) + alanlara güvenli erişim
-        today = now().date()
-        if has_field(Task, "due_date"):
+        # --- 4) Yaklaşan görevler (14 gün)
+        if plan.task_due_date:
             upcoming_qs = user_tasks.filter(
                 due_date__gte=today,
                 due_date__lte=today + timedelta(days=14),
             )
-            if has_field(Task, "status"):
-                upcoming_qs = upcoming_qs.exclude(status__in=DONE_STATUSES + CANCELLED)
-
-            # hız için ilişkileri getir
-            sel = []
-            if has_field(Task, "project"):  sel.append("project")
-            if has_field(Task, "assignee"): sel.append("assignee")
-            if sel:
-                upcoming_qs = upcoming_qs.select_related(*sel)
-
+            if plan.upcoming_q is not None:
+                upcoming_qs = upcoming_qs.filter(plan.upcoming_q)
+            if plan.task_select_related:
+                upcoming_qs = upcoming_qs.select_related(*plan.task_select_related)
             upcoming_qs = upcoming_qs.order_by("due_date")[:10]
         else:
             upcoming_qs = Task.objects.none()
 
         upcoming_tasks = []
         for t in upcoming_qs:
-            project_name = None
-            if has_field(Task, "project") and getattr(t, "project", None):
-                project_name = getattr(t.project, "name", str(t.project))
+            project = getattr(t, "project", None)
+            project_name = getattr(project, "name", str(project)) if project else None
 
             assignee_name = None
-            if has_field(Task, "assignee") and getattr(t, "assignee", None):
-                fn = getattr(t.assignee, "first_name", "") or ""
-                ln = getattr(t.assignee, "last_name", "") or ""
-                full = (fn + " " + ln).strip()
-                assignee_name = full or getattr(t.assignee, "email", None)
+            assignee = getattr(t, "assignee", None)
+            if assignee:
+                full = ((getattr(assignee, "first_name", "") or "") + " " + (getattr(assignee, "last_name", "") or "")).strip()
+                assignee_name = full or getattr(assignee, "email", None)
 
             upcoming_tasks.append({
                 "id": t.id,
@@ -151,11 +134,11 @@ class DashboardSummaryView(APIView):
                 "assignee_name": assignee_name,
             })
 
-        return Response({
+        return {
             "total_projects":  total_projects,
             "active_tasks":    active_tasks,
             "completed":       completed,
             "members":         members,
             "recent_projects": recent_projects,
             "upcoming_tasks":  upcoming_tasks,
-        })
+        }
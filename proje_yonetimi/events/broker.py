@@ -0,0 +1,153 @@
+"""Süreç içi yayın/abone (pub/sub) ve tekrar oynatma tamponu.
+
+Model sinyalleri işlem commit edildikten sonra ``publish`` çağırır; SSE
+akışları ``subscribe`` ile abone olur. Olay id'leri süreç içinde artan
+tamsayılardır; son ``EVENTS_REPLAY_BUFFER`` olay halka tamponda tutulur ve
+``Last-Event-ID`` ile yeniden bağlanan istemciye kaçırdıkları gönderilir.
+Tampon yetmezse (ya da süreç yeniden başlamışsa) abonelik ``replay_complete``
+False olur; istemci durumu baştan yüklemelidir.
+
+Varsayılan ``InMemoryBroker`` harici servis gerektirmez ve yalnızca kendi
+sürecindeki abonelere ulaşır. Çok süreçli kurulumda ``EVENTS_BROKER`` ile aynı
+arayüzü (``publish`` / ``subscribe``) sağlayan bir sınıf verilebilir.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    type: str
+    data: dict
+    project_ids: frozenset
+    # Görünürlüğü bu olayla değişmiş olabilecek kullanıcılar (yeni sahip/atanan)
+    user_ids: frozenset = frozenset()
+    encoded: str = ""
+
+
+def encode_event(event_id, event_type, data) -> str:
+    """SSE çerçevesi; abone sayısından bağımsız olarak olay başına bir kez üretilir."""
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":"))
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event_type}\ndata: {payload}\n\n"
+
+
+# Kuyruk taştığında akışa konan işaret: akış kapanır, istemci Last-Event-ID ile devam eder
+OVERFLOW = object()
+
+
+class Subscription:
+    def __init__(self, broker, loop, queue_size):
+        self.broker = broker
+        self.loop = loop
+        self.queue_size = queue_size
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.overflowed = False
+        self.replay: List[Event] = []
+        self.replay_complete = True
+
+    def deliver(self, event):
+        # Yayıncı herhangi bir iş parçacığında olabilir; kuyruk yalnızca olay döngüsünden beslenir
+        try:
+            self.loop.call_soon_threadsafe(self._offer, event)
+        except RuntimeError:  # döngü kapanmış
+            self.close()
+
+    def _offer(self, event):
+        if self.overflowed:
+            return
+        if self.queue.qsize() >= self.queue_size:
+            self.overflowed = True
+            self.queue.put_nowait(OVERFLOW)
+            return
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Sıradaki olay; ``timeout`` saniyede olay yoksa None, taşmışsa ``OVERFLOW``."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InMemoryBroker:
+    def __init__(self, buffer_size=1000, queue_size=500):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._subscribers = set()
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type, data, *, project_ids: Iterable[int], user_ids: Iterable[int] = ()) -> Event:
+        project_ids = frozenset(pk for pk in project_ids if pk is not None)
+        user_ids = frozenset(pk for pk in user_ids if pk is not None)
+        with self._lock:
+            self._last_id += 1
+            event = Event(
+                id=self._last_id, type=event_type, data=data, project_ids=project_ids, user_ids=user_ids,
+                encoded=encode_event(self._last_id, event_type, data),
+            )
+            self._buffer.append(event)
+            # Kilit altında dağıt: abonelere id sırasıyla ulaşsın
+            for subscription in tuple(self._subscribers):
+                subscription.deliver(event)
+        return event
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        """Çalışan olay döngüsünden çağrılmalı; kaçırılan olaylar ``replay`` içinde döner."""
+        subscription = Subscription(self, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            if last_event_id is not None:
+                subscription.replay, subscription.replay_complete = self._since(last_event_id)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def events_since(self, last_event_id: int):
+        """(``last_event_id``'den sonraki olaylar, eksiksiz mi)."""
+        with self._lock:
+            return self._since(last_event_id)
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def _since(self, last_id):
+        if last_id > self._last_id:
+            # Süreç yeniden başlamış; eski id'ler bu sayaçla ilgisiz
+            return [], False
+        if not self._buffer:
+            return [], last_id == self._last_id
+        oldest = self._buffer[0].id
+        if last_id < oldest - 1:
+            return list(self._buffer), False
+        # id'ler ardışık: tampondaki konum doğrudan hesaplanır
+        return list(islice(self._buffer, last_id - oldest + 1, None)), True
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    broker_class = import_string(settings.EVENTS_BROKER)
+    return broker_class(buffer_size=settings.EVENTS_REPLAY_BUFFER, queue_size=settings.EVENTS_QUEUE_SIZE)
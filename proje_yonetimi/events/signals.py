@@ -0,0 +1,138 @@
+"""Model sinyallerinden akış olayları üret.
+
+Olaylar ``transaction.on_commit`` ile yayınlanır; geri alınan işlemler olay
+üretmez. Her olay etkilediği projelerle etiketlenir (görünürlük akışta bu
+id'lerle süzülür). Başka projeye taşınan görevin tam yükü yalnızca yeni
+projeye gider; eski projenin üyeleri yalnızca ``task.moved`` (id ve eski proje)
+alır. Proje ilerlemesi görev özetinden SQL'de hesaplanır ve
+yalnızca değer değiştiğinde ``project.progress_changed`` gönderilir.
+"""
+import threading
+from collections import OrderedDict
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from projects.models import Project
+from tasks.models import Task
+from tasks.signals import tasks_bulk_changed
+
+from .broker import get_broker
+
+TASK_EVENT_FIELDS = (
+    "id", "project_id", "title", "status", "assignee_id", "start_date", "end_date", "due_date", "progress",
+    "updated_at",
+)
+
+# Son yayınlanan proje ilerlemeleri (aynı değeri tekrar göndermemek için), sınırlı
+_PROGRESS_CACHE_SIZE = 10000
+_last_progress = OrderedDict()
+_progress_lock = threading.Lock()
+
+
+def _publish(event_type, data, project_ids, user_ids=()):
+    transaction.on_commit(
+        lambda: get_broker().publish(event_type, data, project_ids=project_ids, user_ids=user_ids)
+    )
+
+
+def _task_data(task):
+    data = {name: getattr(task, name) for name in TASK_EVENT_FIELDS}
+    data["project"] = data.pop("project_id")
+    data["assignee"] = data.pop("assignee_id")
+    return data
+
+
+def _progress_changed(project_id, progress):
+    with _progress_lock:
+        if _last_progress.get(project_id) == progress:
+            _last_progress.move_to_end(project_id)
+            return False
+        _last_progress[project_id] = progress
+        _last_progress.move_to_end(project_id)
+        if len(_last_progress) > _PROGRESS_CACHE_SIZE:
+            _last_progress.popitem(last=False)
+        return True
+
+
+def _publish_progress_now(project_ids):
+    rows = (
+        Project.objects.filter(pk__in=project_ids).with_progress()
+        .values("id", "manual_progress", "dynamic_progress", "effective_progress")
+    )
+    broker = get_broker()
+    for row in rows:
+        progress = (row["manual_progress"], row["dynamic_progress"], row["effective_progress"])
+        if _progress_changed(row["id"], progress):
+            broker.publish("project.progress_changed", {
+                "id": row["id"],
+                "progress": row["effective_progress"],
+                "manual_progress": row["manual_progress"],
+                "dynamic_progress": row["dynamic_progress"],
+            }, project_ids=[row["id"]])
+
+
+def _publish_progress(project_ids):
+    project_ids = sorted({pk for pk in project_ids if pk is not None})
+    if project_ids:
+        transaction.on_commit(lambda: _publish_progress_now(project_ids))
+
+
+def _deleted_with_project(origin):
+    return isinstance(origin, Project) or getattr(origin, "model", None) is Project
+
+
+@receiver(post_save, sender=Task)
+def publish_task_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous_project, previous_assignee = getattr(instance, "_loaded_links", None) or (None, None)
+    previous_status = getattr(instance, "_loaded_status", None)
+    data = _task_data(instance)
+    if created:
+        event_type = "task.created"
+    elif previous_status is not None and previous_status != instance.status:
+        event_type = "task.status_changed"
+        data["previous_status"] = previous_status
+    else:
+        event_type = "task.updated"
+    if previous_project is not None and previous_project != instance.project_id:
+        _publish("task.moved", {"id": instance.pk, "project": previous_project}, {previous_project})
+    _publish(event_type, data, {instance.project_id}, {instance.assignee_id, previous_assignee})
+    _publish_progress([instance.project_id, previous_project])
+
+
+@receiver(post_delete, sender=Task)
+def publish_task_deleted(sender, instance, origin=None, **kwargs):
+    if _deleted_with_project(origin):
+        return
+    _publish("task.deleted", {"id": instance.pk, "project": instance.project_id}, {instance.project_id})
+    _publish_progress([instance.project_id])
+
+
+@receiver(tasks_bulk_changed)
+def publish_tasks_bulk_changed(sender, project_ids, **kwargs):
+    # Toplu yollarda hangi görevlerin değiştiği bilinmez; istemci projeyi yeniden yükler
+    for project_id in project_ids:
+        _publish("tasks.changed", {"project": project_id}, {project_id})
+    _publish_progress(project_ids)
+
+
+@receiver(post_save, sender=Project)
+def publish_project_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    data = {
+        "id": instance.pk, "name": instance.name, "status": instance.status, "owner": instance.owner_id,
+        "start_date": instance.start_date, "end_date": instance.end_date, "updated_at": instance.updated_at,
+    }
+    owners = {instance.owner_id, getattr(instance, "_loaded_owner_id", None)}
+    _publish("project.created" if created else "project.updated", data, {instance.pk}, owners)
+    # Elle girilen ilerleme ve tarih aralığı da etkin ilerlemeyi değiştirir
+    _publish_progress([instance.pk])
+
+
+@receiver(post_delete, sender=Project)
+def publish_project_deleted(sender, instance, **kwargs):
+    _publish("project.deleted", {"id": instance.pk}, {instance.pk})
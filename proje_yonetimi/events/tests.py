@@ -0,0 +1,189 @@
+from datetime import date
+
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from projects.models import Project
+from tasks.models import Task
+from tasks.signals import tasks_bulk_changed
+from users.models import User
+
+from .broker import InMemoryBroker, get_broker
+from .signals import _last_progress
+from .views import Visibility, stream_events
+
+
+class InMemoryBrokerTests(TestCase):
+    def test_replay_from_ring_buffer(self):
+        broker = InMemoryBroker(buffer_size=3)
+        ids = [broker.publish("task.updated", {"n": n}, project_ids=[1]).id for n in range(5)]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+
+        events, complete = broker.events_since(3)
+        self.assertTrue(complete)
+        self.assertEqual([event.id for event in events], [4, 5])
+        self.assertEqual(broker.events_since(5), ([], True))
+
+        # 2 tampondan düştü; eksik kalan geri oynatma işaretlenir
+        events, complete = broker.events_since(1)
+        self.assertFalse(complete)
+        self.assertEqual([event.id for event in events], [3, 4, 5])
+        # Süreç yeniden başlamış gibi: bilinmeyen id
+        self.assertEqual(broker.events_since(99), ([], False))
+
+    def test_event_is_encoded_once_as_sse_frame(self):
+        event = InMemoryBroker().publish("task.created", {"title": "Çizim", "due": date(2025, 1, 2)}, project_ids=[7])
+        self.assertEqual(
+            event.encoded, 'id: 1\nevent: task.created\ndata: {"title":"Çizim","due":"2025-01-02"}\n\n',
+        )
+        self.assertEqual(event.project_ids, frozenset({7}))
+
+
+class EventSignalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.project = Project.objects.create(name="Olay", owner=cls.owner)
+
+    def setUp(self):
+        get_broker.cache_clear()
+        self.addCleanup(get_broker.cache_clear)
+
+        _last_progress.clear()
+
+    def published(self):
+        events, _ = get_broker().events_since(0)
+        return [(event.type, event.data) for event in events]
+
+    def test_task_lifecycle_events(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(project=self.project, title="A", assignee=self.owner)
+        types = [event_type for event_type, _ in self.published()]
+        self.assertEqual(types, ["task.created", "project.progress_changed"])
+
+        task = Task.objects.get(pk=task.pk)
+        task.status = "Tamamlandı"
+        task.progress = 100
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        event_type, data = self.published()[2]
+        self.assertEqual(event_type, "task.status_changed")
+        self.assertEqual((data["status"], data["previous_status"], data["project"]), ("Tamamlandı", "Devam Ediyor", self.project.pk))
+        self.assertEqual(self.published()[3], ("project.progress_changed", {
+            "id": self.project.pk, "progress": 100, "manual_progress": 0, "dynamic_progress": 100,
+        }))
+
+        # İlerleme değişmeyen güncelleme yalnızca görev olayı üretir
+        task.title = "A2"
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        self.assertEqual([event_type for event_type, _ in self.published()[4:]], ["task.updated"])
+
+        task_id = task.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            task.delete()
+        self.assertEqual(self.published()[5], ("task.deleted", {"id": task_id, "project": self.project.pk}))
+
+    def test_moved_task_payload_goes_only_to_new_project(self):
+        target = Project.objects.create(name="Hedef", owner=self.owner)
+        task = Task.objects.create(project=self.project, title="Taşınan")
+        task = Task.objects.get(pk=task.pk)
+        last_id = get_broker().last_id
+
+        task.project = target
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+
+        events, _ = get_broker().events_since(last_id)
+        tasks = [(event.type, event.data, event.project_ids) for event in events if event.type.startswith("task.")]
+        self.assertEqual(tasks[0], ("task.moved", {"id": task.pk, "project": self.project.pk}, {self.project.pk}))
+        self.assertEqual((tasks[1][0], tasks[1][1]["title"], tasks[1][2]), ("task.updated", "Taşınan", {target.pk}))
+        self.assertEqual(len(tasks), 2)
+
+    def test_bulk_changes_and_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tasks_bulk_changed.send(sender=Task, project_ids=[self.project.pk])
+        self.assertEqual(self.published()[0], ("tasks.changed", {"project": self.project.pk}))
+
+        # Commit edilmeyen işlem olay üretmez
+        last_id = get_broker().last_id
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Task.objects.create(project=self.project, title="Geri alınan")
+        self.assertTrue(callbacks)
+        self.assertEqual(get_broker().last_id, last_id)
+
+
+@override_settings(EVENTS_HEARTBEAT=0.05)
+class EventStreamViewTests(TestCase):
+    url = "/api/events/stream/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.other = User.objects.create_user(email="other@example.com")
+        cls.visible = Project.objects.create(name="Görünür", owner=cls.owner)
+        cls.hidden = Project.objects.create(name="Gizli", owner=cls.other)
+
+    def setUp(self):
+        get_broker.cache_clear()
+        self.addCleanup(get_broker.cache_clear)
+
+    async def read_frames(self, response, count):
+        frames = []
+        async for chunk in response.streaming_content:
+            chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+            if not chunk.startswith(":"):
+                frames.append(chunk)
+            if len(frames) == count:
+                break
+        await response.streaming_content.aclose()
+        return frames
+
+    def test_requires_asgi(self):
+        self.assertEqual(self.client.get(self.url).status_code, 501)
+
+    async def test_rejects_missing_token(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_streams_only_visible_projects(self):
+        token = str(AccessToken.for_user(self.owner))
+        response = await self.async_client.get(self.url, {"token": token})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        broker = get_broker()
+        broker.publish("task.created", {"id": 1}, project_ids=[self.hidden.pk])
+        broker.publish("task.created", {"id": 2}, project_ids=[self.visible.pk])
+        frames = await self.read_frames(response, 2)
+        self.assertEqual(frames[0], "retry: 3000\n\n")
+        self.assertEqual(frames[1], 'id: 2\nevent: task.created\ndata: {"id":2}\n\n')
+
+    async def test_closed_stream_unsubscribes(self):
+        broker = get_broker()
+        visibility = Visibility(self.owner, ttl=30)
+        stream = stream_events(broker.subscribe(), visibility, heartbeat=0.05)
+        self.assertEqual(await anext(stream), "retry: 3000\n\n")
+        self.assertEqual(broker.subscriber_count(), 1)
+        await stream.aclose()
+        self.assertEqual(broker.subscriber_count(), 0)
+
+    async def test_resumes_from_last_event_id(self):
+        broker = get_broker()
+        first = broker.publish("task.updated", {"id": 1}, project_ids=[self.visible.pk])
+        broker.publish("task.updated", {"id": 2}, project_ids=[self.hidden.pk])
+        broker.publish("task.updated", {"id": 3}, project_ids=[self.visible.pk])
+
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": f"Bearer {AccessToken.for_user(self.owner)}",
+                               "Last-Event-ID": str(first.id)},
+        )
+        frames = await self.read_frames(response, 2)
+        self.assertEqual(frames[1], 'id: 3\nevent: task.updated\ndata: {"id":3}\n\n')
+
+        # Bilinmeyen id: istemciye durumu yeniden yüklemesi söylenir
+        response = await self.async_client.get(
+            self.url, {"token": str(AccessToken.for_user(self.owner)), "last_event_id": "999"},
+        )
+        frames = await self.read_frames(response, 2)
+        self.assertTrue(frames[1].startswith("event: reset\n"))
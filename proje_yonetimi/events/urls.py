@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import event_stream
+
+app_name = "events"
+
+urlpatterns = [
+    path("stream/", event_stream, name="stream"),
+]
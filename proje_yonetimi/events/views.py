@@ -0,0 +1,116 @@
+"""Görev/proje değişikliklerinin SSE (text/event-stream) akışı.
+
+Yoklama (polling) yerine tarayıcı ``EventSource`` ile bağlanır. Uzun ömürlü
+bağlantı iş parçacığı tutmasın diye görünüm asenkrondur ve yalnızca ASGI
+altında (``proje_yonetimi.asgi:application``) sunulur.
+
+``EventSource`` başlık gönderemediği için JWT ``?token=`` ile de verilebilir.
+Yeniden bağlanan tarayıcı ``Last-Event-ID`` başlığını kendisi ekler; kaçırılan
+olaylar halka tampondan gönderilir, tampon yetmezse önce ``reset`` olayı gelir.
+"""
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from projects.models import ProjectMembership
+from users.authentication import CachedJWTAuthentication
+
+from .broker import OVERFLOW, encode_event, get_broker
+
+
+def _authenticate(request):
+    auth = CachedJWTAuthentication()
+    try:
+        raw_token = request.GET.get("token")
+        if raw_token:
+            return auth.get_user(auth.get_validated_token(raw_token))
+        result = auth.authenticate(request)
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None
+    return result[0] if result else None
+
+
+def _last_event_id(request):
+    value = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+class Visibility:
+    """Abonenin görebildiği proje id'leri; süresi dolunca ya da kullanıcı olayda geçince yenilenir."""
+
+    def __init__(self, user, ttl):
+        self.user = user
+        self.ttl = ttl
+        self.project_ids = frozenset()
+        self.loaded_at = None
+
+    def _load(self):
+        return frozenset(ProjectMembership.objects.for_user(self.user).values_list("project_id", flat=True))
+
+    async def refresh(self):
+        self.project_ids = await sync_to_async(self._load)()
+        self.loaded_at = time.monotonic()
+
+    async def allows(self, event):
+        if self.user.is_staff:
+            return True
+        if self.loaded_at is None or self.user.pk in event.user_ids or time.monotonic() - self.loaded_at > self.ttl:
+            await self.refresh()
+        return not self.project_ids.isdisjoint(event.project_ids)
+
+
+async def stream_events(subscription, visibility, *, heartbeat):
+    """SSE çerçeveleri; kuyruk taşarsa biter (istemci kaldığı yerden yeniden bağlanır)."""
+    try:
+        yield f"retry: {settings.EVENTS_RETRY_MS}\n\n"
+        if not subscription.replay_complete:
+            yield encode_event(None, "reset", {"last_event_id": get_broker().last_id})
+        last_sent = 0
+        for event in subscription.replay:
+            if await visibility.allows(event):
+                yield event.encoded
+            last_sent = event.id
+        while True:
+            event = await subscription.get(heartbeat)
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            if event is OVERFLOW:
+                return
+            if event.id <= last_sent:
+                continue
+            last_sent = event.id
+            if await visibility.allows(event):
+                yield event.encoded
+    finally:
+        subscription.close()
+
+
+async def event_stream(request):
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"detail": "Olay akışı yalnızca ASGI sunucusu altında çalışır."}, status=501)
+    if request.method != "GET":
+        return JsonResponse({"detail": "Yalnızca GET desteklenir."}, status=405)
+    user = await sync_to_async(_authenticate)(request)
+    if user is None:
+        return JsonResponse({"detail": "Kimlik doğrulama bilgileri verilmedi."}, status=401)
+
+    visibility = Visibility(user, settings.EVENTS_VISIBILITY_TTL)
+    if not user.is_staff:
+        await visibility.refresh()
+    subscription = get_broker().subscribe(_last_event_id(request))
+    response = StreamingHttpResponse(
+        stream_events(subscription, visibility, heartbeat=settings.EVENTS_HEARTBEAT),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx tamponlamasın
+    return response
@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class OpsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'ops'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from .db import configure_sqlite
+        from .metrics import instrument_serializers
+
+        connection_created.connect(configure_sqlite, dispatch_uid="ops.configure_sqlite")
+
+        options = settings.OPS_METRICS
+        if options["ENABLED"] and options["SERIALIZER_TIMING"]:
+            instrument_serializers()
@@ -0,0 +1,31 @@
+"""SQLite bağlantı ayarları: her yeni bağlantıda ``SQLITE_PRAGMAS`` uygulanır.
+
+WAL kipinde okuyucular yazarı beklemez, ``busy_timeout`` kilitli veritabanında
+hemen hata vermek yerine bekletir. ``journal_mode`` veritabanı dosyasında kalıcıdır
+(``manage.py check`` bile dosya başlığını yeniden yazar); bu yüzden yalnızca
+ayarlarda açıkça verildiğinde uygulanır. Diğerleri bağlantıya özgüdür. Bellek içi
+veritabanlarında (testler) WAL atlanır.
+"""
+from django.conf import settings
+
+# Bağlantı başına ayarlar; journal_mode ayrıca ve ilk önce uygulanır
+CONNECTION_PRAGMAS = ("synchronous", "busy_timeout", "mmap_size", "cache_size", "temp_store")
+
+
+def _in_memory(connection):
+    name = str(connection.settings_dict["NAME"])
+    return name == ":memory:" or "mode=memory" in name
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    pragmas = settings.SQLITE_PRAGMAS
+    # Ham sürücü bağlantısı: pragmalar sorgu kaydına/sayımına karışmaz
+    raw = connection.connection
+    journal_mode = pragmas.get("journal_mode")
+    if journal_mode and not _in_memory(connection):
+        raw.execute(f"PRAGMA journal_mode={journal_mode}")
+    for name in CONNECTION_PRAGMAS:
+        if pragmas.get(name) is not None:
+            raw.execute(f"PRAGMA {name}={pragmas[name]}")
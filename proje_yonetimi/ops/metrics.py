@@ -0,0 +1,251 @@
+"""İstek başına performans ölçümleri: süreç içi kayan pencereli histogramlar.
+
+Her görünüm (``view_name``, yoksa URL kalıbı) ve HTTP yöntemi için toplam süre,
+veritabanı süresi, sorgu sayısı ve serileştirme süresi sabit sınırlı
+(logaritmik) kovalara yazılır. Pencere ``WINDOW_SLICES`` dilime bölünür;
+eskiyen dilim üzerine yazılırken sıfırlanır, yüzdelikler (p50/p95/p99) son
+``WINDOW_SECONDS`` saniyedeki dilimlerin toplamından kova içi doğrusal
+aradeğerlemeyle hesaplanır. Toplam/sayaç değerleri süreç ömrü boyunca birikir.
+
+Ölçümler süreç belleğindedir; çok işçili kurulumda her işçi kendi değerlerini
+sunar (Prometheus her hedefi ayrı toplar).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+
+def _geometric(start, stop, per_doubling):
+    bounds, value, step = [], start, 2 ** (1 / per_doubling)
+    while value < stop:
+        bounds.append(value)
+        value *= step
+    bounds.append(stop)
+    return tuple(bounds)
+
+
+# Saniye: 50µs .. 120s, her ikiye katlamada 4 kova (~%19 göreli hata)
+TIME_BOUNDS = _geometric(0.00005, 120.0, 4)
+QUERY_BOUNDS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 20, 25, 32, 40, 50, 64, 80, 100, 128, 160, 200, 256, 512, 1024)
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+@dataclass
+class RequestTiming:
+    """Örneklenen isteğin ölçümleri; middleware ve serileştirici kancaları doldurur."""
+
+    db_time: float = 0.0
+    queries: int = 0
+    serializer_time: float = 0.0
+    render_time: float = 0.0
+    serializing: bool = False
+
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("ops_request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current_timing.get()
+
+
+def set_current_timing(timing):
+    return _current_timing.set(timing)
+
+
+def reset_current_timing(token):
+    _current_timing.reset(token)
+
+
+class RollingHistogram:
+    def __init__(self, bounds, slices):
+        self.bounds = bounds
+        self.slices = slices
+        # Son kova sınırsız (+Inf)
+        self._counts = [[0] * (len(bounds) + 1) for _ in range(slices)]
+        self._slots = [-1] * slices
+
+    def observe(self, value, slot):
+        index = slot % self.slices
+        counts = self._counts[index]
+        if self._slots[index] != slot:
+            counts[:] = [0] * len(counts)
+            self._slots[index] = slot
+        counts[bisect_left(self.bounds, value)] += 1
+
+    def merged(self, slot):
+        merged = [0] * (len(self.bounds) + 1)
+        for index, counts in enumerate(self._counts):
+            if slot - self.slices < self._slots[index] <= slot:
+                for bucket, n in enumerate(counts):
+                    merged[bucket] += n
+        return merged
+
+    def quantiles(self, slot, quantiles=QUANTILES) -> Dict[float, Optional[float]]:
+        counts = self.merged(slot)
+        total = sum(counts)
+        if not total:
+            return {q: None for q in quantiles}
+        result = {}
+        for q in quantiles:
+            rank, seen = q * total, 0
+            for bucket, n in enumerate(counts):
+                if n and seen + n >= rank:
+                    lower = self.bounds[bucket - 1] if bucket else 0
+                    upper = self.bounds[bucket] if bucket < len(self.bounds) else self.bounds[-1]
+                    result[q] = lower + (upper - lower) * (rank - seen) / n
+                    break
+                seen += n
+        return result
+
+
+METRICS = (
+    # (ad, RequestTiming/ölçüm alanı, sınırlar, açıklama)
+    ("http_request_duration_seconds", "duration", TIME_BOUNDS, "İstek süresi (saniye)"),
+    ("http_request_db_seconds", "db_time", TIME_BOUNDS, "İstek içindeki veritabanı süresi (saniye)"),
+    ("http_request_db_queries", "queries", QUERY_BOUNDS, "İstek başına veritabanı sorgusu"),
+    ("http_request_serializer_seconds", "serializer_time", TIME_BOUNDS, "Serileştirme + render süresi (saniye)"),
+)
+
+
+class RouteMetrics:
+    def __init__(self, slices):
+        self.lock = threading.Lock()
+        self.histograms = {name: RollingHistogram(bounds, slices) for name, _, bounds, _ in METRICS}
+        self.sums = {name: 0 for name, *_ in METRICS}
+        self.count = 0
+        self.statuses: Dict[str, int] = {}
+
+    def observe(self, values, status_class, slot):
+        with self.lock:
+            self.count += 1
+            self.statuses[status_class] = self.statuses.get(status_class, 0) + 1
+            for name, field, _, _ in METRICS:
+                value = values[field]
+                self.sums[name] += value
+                self.histograms[name].observe(value, slot)
+
+
+class MetricsRegistry:
+    def __init__(self, window_seconds=300, slices=10, max_routes=500):
+        self.slice_seconds = window_seconds / slices
+        self.slices = slices
+        self.max_routes = max_routes
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def slot(self, now=None):
+        return int((time.monotonic() if now is None else now) / self.slice_seconds)
+
+    def route(self, view, method) -> Optional[RouteMetrics]:
+        key = (view, method)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self.routes.get(key)
+                if metrics is None:
+                    # Etiket sayısı sınırlı kalsın (ör. bilinmeyen yöntemler)
+                    if len(self.routes) >= self.max_routes:
+                        return None
+                    metrics = self.routes[key] = RouteMetrics(self.slices)
+        return metrics
+
+    def observe(self, view, method, status_code, *, duration, db_time, queries, serializer_time, now=None):
+        metrics = self.route(view, method)
+        if metrics is None:
+            return
+        values = {"duration": duration, "db_time": db_time, "queries": queries, "serializer_time": serializer_time}
+        metrics.observe(values, f"{status_code // 100}xx", self.slot(now))
+
+    def reset(self):
+        with self._lock:
+            self.routes = {}
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        options = settings.OPS_METRICS
+        _registry = MetricsRegistry(options["WINDOW_SECONDS"], options["WINDOW_SLICES"], options["MAX_ROUTES"])
+    return _registry
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value):
+    return "NaN" if value is None else repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(registry: MetricsRegistry, *, sample_rate=1.0, now=None) -> str:
+    """Prometheus metin biçimi (0.0.4): yüzdelikler kayan pencere, _sum/_count süreç ömrü."""
+    slot = registry.slot(now)
+    routes = sorted(registry.routes.items())
+    lines = []
+    for name, _, _, help_text in METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} summary")
+        for (view, method), metrics in routes:
+            labels = f'view="{_label(view)}",method="{_label(method)}"'
+            with metrics.lock:
+                quantiles = metrics.histograms[name].quantiles(slot)
+                total, count = metrics.sums[name], metrics.count
+            for q, value in quantiles.items():
+                lines.append(f'{name}{{{labels},quantile="{q}"}} {_number(value)}')
+            lines.append(f"{name}_sum{{{labels}}} {_number(total)}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+
+    lines.append("# HELP http_responses_total Yanıt sayısı (durum sınıfına göre)")
+    lines.append("# TYPE http_responses_total counter")
+    for (view, method), metrics in routes:
+        with metrics.lock:
+            statuses = sorted(metrics.statuses.items())
+        for status_class, n in statuses:
+            lines.append(
+                f'http_responses_total{{view="{_label(view)}",method="{_label(method)}",status="{status_class}"}} {n}'
+            )
+
+    lines.append("# HELP ops_metrics_sample_rate Ölçülen isteklerin oranı")
+    lines.append("# TYPE ops_metrics_sample_rate gauge")
+    lines.append(f"ops_metrics_sample_rate {_number(float(sample_rate))}")
+    return "\n".join(lines) + "\n"
+
+
+def _timed_data(prop):
+    getter = prop.fget
+
+    def data(self):
+        timing = _current_timing.get()
+        # İç içe serileştiriciler (ListSerializer -> Serializer) bir kez sayılır
+        if timing is None or timing.serializing:
+            return getter(self)
+        timing.serializing = True
+        start = time.perf_counter()
+        try:
+            return getter(self)
+        finally:
+            timing.serializer_time += time.perf_counter() - start
+            timing.serializing = False
+
+    data._ops_timed = True
+    return property(data, doc=prop.__doc__)
+
+
+def instrument_serializers():
+    """DRF ``Serializer.data`` / ``ListSerializer.data`` sürelerini örneklenen isteğe ekle."""
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        prop = cls.__dict__["data"]
+        if not getattr(prop.fget, "_ops_timed", False):
+            cls.data = _timed_data(prop)
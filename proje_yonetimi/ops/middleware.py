@@ -0,0 +1,128 @@
+"""İstek süresi, veritabanı süresi/sorgu sayısı ve serileştirme süresi ölçümü.
+
+``MIDDLEWARE`` listesinin başında durmalı ki diğer middleware'ler de süreye
+dahil olsun. ``OPS_METRICS["SAMPLE_RATE"]`` oranında istek ölçülür; ölçülmeyen
+istekte yalnızca bir rastgele sayı üretilir. ``ENABLED`` kapalıysa middleware
+hiç yüklenmez.
+
+``OPS_METRICS["SERVER_TIMING"]`` açıksa ölçülen isteklere ``Server-Timing``
+başlığı eklenir (tarayıcı geliştirici araçlarında görünür): ``db`` (sorgu
+sayısıyla), ``ser`` (serializer ``.data``), ``render`` ve ``total``. Bunlar
+/api/ops/metrics/ gibi iç bilgidir; başlık yalnızca personele, ``DEBUG``'da
+herkese gönderilir.
+"""
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .metrics import RequestTiming, get_registry, reset_current_timing, set_current_timing
+
+UNMATCHED_VIEW = "<eşleşmeyen>"
+
+
+def _exposes_timing(request):
+    if settings.DEBUG:
+        return True
+    # DRF kimlik doğrulaması kullanıcıyı alttaki HttpRequest'e de yazar
+    user = getattr(request, "user", None)
+    return bool(getattr(user, "is_staff", False))
+
+
+def _view_label(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return UNMATCHED_VIEW
+    return match.view_name or match.route or UNMATCHED_VIEW
+
+
+class PerformanceMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = settings.OPS_METRICS
+        if not options["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = options["SAMPLE_RATE"]
+        self.server_timing = options["SERVER_TIMING"]
+        self.registry = get_registry()
+        self.random = random.random
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _sampled(self):
+        rate = self.sample_rate
+        return rate >= 1 or (rate > 0 and self.random() < rate)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        timing = RequestTiming()
+        request._ops_timing = timing
+        token = set_current_timing(timing)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self._db_wrapper(timing)))
+                response = self.get_response(request)
+        finally:
+            reset_current_timing(token)
+        return self._finish(request, response, timing, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        # Asenkron görünümlerde ORM başka iş parçacığında çalışır; yalnızca süre ölçülür
+        if not self._sampled():
+            return await self.get_response(request)
+        timing = RequestTiming()
+        request._ops_timing = timing
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        return self._finish(request, response, timing, time.perf_counter() - start)
+
+    @staticmethod
+    def _db_wrapper(timing):
+        def wrapper(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                timing.db_time += time.perf_counter() - start
+                timing.queries += 1
+        return wrapper
+
+    def process_template_response(self, request, response):
+        # DRF Response render'ı görünümden sonra, middleware zincirinde yapılır
+        timing = getattr(request, "_ops_timing", None)
+        if timing is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                timing.render_time += time.perf_counter() - start
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def _finish(self, request, response, timing, duration):
+        serializer_time = timing.serializer_time + timing.render_time
+        self.registry.observe(
+            _view_label(request), request.method, response.status_code,
+            duration=duration, db_time=timing.db_time, queries=timing.queries, serializer_time=serializer_time,
+        )
+        if self.server_timing and _exposes_timing(request):
+            response["Server-Timing"] = ", ".join((
+                f'db;dur={timing.db_time * 1000:.2f};desc="{timing.queries} sorgu"',
+                f"ser;dur={timing.serializer_time * 1000:.2f}",
+                f"render;dur={timing.render_time * 1000:.2f}",
+                f"total;dur={duration * 1000:.2f}",
+            ))
+        return response
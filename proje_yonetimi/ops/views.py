@@ -0,0 +1,32 @@
+import json
+
+from django.conf import settings
+from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .metrics import get_registry, render_prometheus
+
+
+class PrometheusTextRenderer(BaseRenderer):
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, str):
+            return data.encode()
+        # Hata yanıtları (403 vb.)
+        return json.dumps(data, ensure_ascii=False).encode()
+
+
+class MetricsView(APIView):
+    """Süreç içi istek ölçümleri, Prometheus metin biçiminde (yalnızca personel)."""
+
+    permission_classes = [IsAdminUser]
+    renderer_classes = [PrometheusTextRenderer]
+
+    def get(self, request):
+        body = render_prometheus(get_registry(), sample_rate=settings.OPS_METRICS["SAMPLE_RATE"])
+        return Response(body, content_type="text/plain; version=0.0.4; charset=utf-8")
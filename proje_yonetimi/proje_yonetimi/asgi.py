@@ -5,6 +5,12 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
+
+/api/events/stream/ (SSE) uzun ömürlü asenkron bir akıştır ve yalnızca bu
+uygulama bir ASGI sunucusuyla sunulduğunda çalışır, ör.:
+    uvicorn proje_yonetimi.asgi:application
+Süreç içi yayıncı kullanıldığı için olaylar yalnızca aynı süreçteki
+abonelere ulaşır; çok işçili kurulumda EVENTS_BROKER değiştirilmelidir.
 """
 
 import os
@@ -12,5 +18,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proje_yonetimi.settings')
+# Kalıcı bağlantılar ASGI altında istek iş parçacıklarında birikir (bkz. proje_yonetimi.database)
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
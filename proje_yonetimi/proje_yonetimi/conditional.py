@@ -0,0 +1,100 @@
+"""Koşullu GET: zayıf ETag, 304 Not Modified.
+
+Doğrulayıcılar yükü üretmeden, tek satırlık tek bir sorguyla hesaplanır: ilgili
+kümelerin ``MAX(updated_at)`` ve ``COUNT(*)`` değerleri (silme sayıdan anlaşılır).
+Kullanım (APIView.get içinde)::
+
+    validators = collection_validators(request, "gantt", tasks=qs, parts=[...])
+    not_modified = not_modified_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+    ...
+    return with_validators(Response(data), validators)
+
+Not: yalnızca satırların kendi değişiklikleri izlenir; örneğin kullanıcının adını
+değiştirmesi ETag'i değiştirmez.
+
+Last-Modified gönderilmez: ``MAX(updated_at)`` silmede ya da satır kümeden
+çıkınca ilerlemez, HTTP tarihi de saniyeye yuvarlanır (aynı saniyedeki iki
+düzenleme). Yalnızca If-Modified-Since gönderen istemci eski kopya için 304
+alırdı; değişikliklerin tamamı ETag'deki sayı ve zaman damgalarında görünür.
+"""
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.db.models import DateTimeField, F, Func, IntegerField, Subquery
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+
+
+def _max_updated(qs, field="updated_at"):
+    return Subquery(
+        qs.order_by().annotate(_v=Func(F(field), function="MAX", output_field=DateTimeField())).values("_v")[:1],
+        output_field=DateTimeField(),
+    )
+
+
+def _count(qs):
+    return Subquery(
+        qs.order_by().annotate(_v=Func(F("pk"), function="COUNT", output_field=IntegerField())).values("_v")[:1],
+        output_field=IntegerField(),
+    )
+
+
+def collection_state(anchor_pk, **querysets):
+    """{ad: queryset} için {ad_changed: datetime|None, ad_count: int} — tek sorgu.
+
+    ``updated_at`` alanı olmayan modeller için değer ``(queryset, "alan")`` verilebilir.
+
+    Alt sorgular tek satırlık bir "çapa" (istek yapan kullanıcının satırı)
+    üzerinde seçilir; ``GROUP BY``'sız MAX/COUNT her biri tek değer döndürür.
+    """
+    annotations = {}
+    for name, qs in querysets.items():
+        qs, field = qs if isinstance(qs, tuple) else (qs, "updated_at")
+        annotations[f"{name}_changed"] = _max_updated(qs, field)
+        annotations[f"{name}_count"] = _count(qs)
+    row = get_user_model().objects.filter(pk=anchor_pk).values(**annotations).first()
+    return row or {key: None for key in annotations}
+
+
+def collection_validators(request, name, *, parts: Iterable = (), daily=False, **querysets) -> Validators:
+    """``querysets`` durumundan zayıf ETag üret.
+
+    ``daily=True``: yük ``today``'e bağlı (dinamik ilerleme), gün değişince
+    ETag de değişir.
+    """
+    state = collection_state(request.user.pk, **querysets)
+    fingerprint = [name, request.user.pk, sorted(request.query_params.items())]
+    fingerprint += list(parts)
+    if daily:
+        fingerprint.append(timezone.localdate().isoformat())
+    fingerprint += [
+        value.isoformat() if isinstance(value, datetime) else value for _, value in sorted(state.items())
+    ]
+    return Validators(etag=weak_etag(fingerprint))
+
+
+def weak_etag(fingerprint) -> str:
+    return 'W/"%s"' % hashlib.sha1(repr(fingerprint).encode()).hexdigest()[:32]
+
+
+def not_modified_response(request, validators: Validators):
+    """İstemcinin kopyası güncelse 304 yanıtı, değilse None."""
+    response = get_conditional_response(request, etag=validators.etag)
+    if response is not None:
+        return with_validators(response, validators)
+    return None
+
+
+def with_validators(response, validators: Validators):
+    response["ETag"] = validators.etag
+    return response
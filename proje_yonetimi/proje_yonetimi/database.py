@@ -0,0 +1,71 @@
+"""Ortam değişkenlerinden ``DATABASES["default"]`` kurulumu.
+
+``DATABASE_URL`` verilmezse proje kökündeki ``db.sqlite3`` kullanılır:
+
+    DATABASE_URL=sqlite:////var/lib/proje/db.sqlite3
+    DATABASE_URL=postgres://kullanici:parola@db:5432/proje?sslmode=require
+
+``DB_CONN_MAX_AGE`` (varsayılan 60 sn) bağlantıyı WSGI işçisinde istekler arasında
+tutar. ASGI altında (olay akışı için gerekli) Django kalıcı bağlantıyı önermez:
+her istek ayrı iş parçacığında çalışır ve bağlantılar birikir. ``asgi.py`` bu
+yüzden değişken verilmemişse 0 kullanır.
+
+PostgreSQL için ``psycopg`` (3.x) kurulu olmalıdır. Sorgu dizesindeki
+parametreler sürücüye ``OPTIONS`` olarak geçer. SQLite pragmaları bağlantı
+açılırken ``ops.db.configure_sqlite`` ile uygulanır (bkz. ``SQLITE_PRAGMAS``).
+"""
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgres": "django.db.backends.postgresql",
+    "postgresql": "django.db.backends.postgresql",
+    "pgsql": "django.db.backends.postgresql",
+}
+
+
+def parse_database_url(url):
+    parts = urlsplit(url)
+    engine = ENGINES.get(parts.scheme)
+    if engine is None:
+        raise ImproperlyConfigured(f"Desteklenmeyen DATABASE_URL şeması: {parts.scheme!r}")
+
+    if parts.scheme == "sqlite":
+        # sqlite:///göreli.sqlite3, sqlite:////mutlak/yol.sqlite3, sqlite://:memory:
+        name = parts.netloc if parts.netloc == ":memory:" else unquote(parts.path[1:])
+        return {"ENGINE": engine, "NAME": name or ":memory:", "OPTIONS": {}}
+
+    return {
+        "ENGINE": engine,
+        "NAME": unquote(parts.path.lstrip("/")),
+        "USER": unquote(parts.username or ""),
+        "PASSWORD": unquote(parts.password or ""),
+        "HOST": parts.hostname or "",
+        "PORT": str(parts.port or ""),
+        "OPTIONS": dict(parse_qsl(parts.query)),
+    }
+
+
+def database_from_env(environ, default_sqlite_path):
+    url = environ.get("DATABASE_URL")
+    config = parse_database_url(url) if url else {
+        "ENGINE": ENGINES["sqlite"], "NAME": default_sqlite_path, "OPTIONS": {},
+    }
+    # Her istekte yeniden bağlanmak yerine bağlantıyı süreç içinde tut; kopmuş
+    # bağlantı istek başında sınanıp yenilenir
+    config["CONN_MAX_AGE"] = int(environ.get("DB_CONN_MAX_AGE", 60))
+    config["CONN_HEALTH_CHECKS"] = environ.get("DB_CONN_HEALTH_CHECKS", "1") == "1"
+
+    if config["ENGINE"] == ENGINES["sqlite"]:
+        # Python sürücüsünün bekleme süresi (sn); busy_timeout pragması da aynısını ayarlar
+        config["OPTIONS"].setdefault("timeout", int(environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)) / 1000)
+        if django.VERSION >= (5, 1):
+            # Yazma kilidi işlem başında alınır: okuma->yazma yükseltmesinde
+            # busy_timeout beklenmeden "database is locked" hatası oluşmaz
+            config["OPTIONS"].setdefault("transaction_mode", "IMMEDIATE")
+    elif "DB_CONNECT_TIMEOUT" in environ:
+        config["OPTIONS"].setdefault("connect_timeout", int(environ["DB_CONNECT_TIMEOUT"]))
+    return config
@@ -0,0 +1,115 @@
+"""NDJSON / CSV akış (streaming) dışa aktarımı.
+
+Satırlar ``QuerySet.iterator(chunk_size=...)`` ile parça parça okunur ve
+yanıta yazılır; tablo ne kadar büyük olursa olsun bellekte yalnızca bir parça
+tutulur. İlişkili adlar (proje, kullanıcı) satır başına değil parça başına
+tek sorguyla çözülmelidir (bkz. ``enrich`` parametresi).
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ";".join(str(v) for v in value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+class NDJSONRenderer(BaseRenderer):
+    """İçerik pazarlığı için; asıl veri ``streaming_export_response`` ile akar."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = data if isinstance(data, list) else [data]
+        return "".join(json.dumps(row, ensure_ascii=False, default=_json_default) + "\n" for row in rows).encode()
+
+
+class CSVRenderer(BaseRenderer):
+    """İçerik pazarlığı için; hata yanıtları gibi küçük veriler de buradan geçer."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = data if isinstance(data, list) else [data]
+        buffer = io.StringIO()
+        if rows and isinstance(rows[0], dict):
+            writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows({k: _csv_value(v) for k, v in row.items()} for row in rows)
+        return buffer.getvalue().encode()
+
+
+EXPORT_RENDERERS = [NDJSONRenderer, CSVRenderer]
+
+
+def iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _encode_ndjson(chunks, columns):
+    for chunk in chunks:
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_json_default) + "\n"
+            for row in chunk
+        ).encode()
+
+
+def _encode_csv(chunks, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for chunk in chunks:
+        writer.writerows([_csv_value(v) for v in row] for row in chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def streaming_export_response(rows, columns, fmt, *, filename, enrich=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """``rows`` (tuple akışı) için NDJSON ya da CSV ``StreamingHttpResponse`` üret.
+
+    ``enrich(chunk) -> chunk`` verilirse her parça yazılmadan önce ona uğrar
+    (ör. parça başına tek sorguyla ad çözümü).
+    """
+    chunks = iter_chunks(rows, chunk_size)
+    if enrich is not None:
+        chunks = (enrich(chunk) for chunk in chunks)
+
+    if fmt == CSVRenderer.format:
+        body, content_type, ext = _encode_csv(chunks, columns), "text/csv; charset=utf-8", "csv"
+    else:
+        body, content_type, ext = _encode_ndjson(chunks, columns), "application/x-ndjson; charset=utf-8", "ndjson"
+
+    response = StreamingHttpResponse(body, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{ext}"'
+    return response
@@ -0,0 +1,119 @@
+"""Liste uçları için serializer'sız okuma yolu.
+
+``ModelSerializer`` her satırın her alanı için ayrı nesne/metot çağrısı yapar;
+binlerce satırlık listelerde CPU süresinin çoğu buraya gider. Hızlı yol satırları
+``values_list()`` tuple'ları olarak okur (ilerleme SQL'de hesaplanmış), bir kez
+derlenen kodlayıcıyla sözlüğe çevirir ve ``orjson`` kuruluysa onunla yazar.
+
+Çıktı serializer'ınkiyle bayt bayt aynıdır: tarih/saat alanları serializer'ın
+kendi DRF alanlarıyla biçimlenir, alan sırası serializer'dan gelir (testler
+ikisini karşılaştırır). Tarayıcıdan gezilebilir API gibi JSON dışı çıktılarda
+ve ``API_FAST_LIST=False`` olduğunda olağan serializer yolu kullanılır.
+"""
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+try:
+    import orjson
+except ImportError:  # isteğe bağlı bağımlılık; yoksa standart json
+    orjson = None
+
+
+def compile_row_encoder(spec, name="encode_row"):
+    """``spec`` -> ``encode(row, context) -> dict`` fonksiyonu.
+
+    ``spec`` öğeleri ``(alan, kaynak)`` ya da ``(alan, kaynak, dönüştürücü)``:
+    kaynak tamsayıysa ``row[kaynak]`` okunur (dönüştürücü yalnızca None olmayan
+    değere uygulanır), çağrılabilir ise ``kaynak(row, context)`` çağrılır.
+    Üretilen kod tek bir sözlük ifadesidir; alan başına döngü ya da arama yoktur.
+    """
+    namespace = {}
+    items = []
+    for position, (field, source, *rest) in enumerate(spec):
+        converter = rest[0] if rest else None
+        if callable(source):
+            namespace[f"s{position}"] = source
+            expression = f"s{position}(row, context)"
+        elif converter is None:
+            expression = f"row[{source}]"
+        else:
+            namespace[f"c{position}"] = converter
+            expression = f"(None if row[{source}] is None else c{position}(row[{source}]))"
+        items.append(f"{field!r}: {expression}")
+    source_code = f"def {name}(row, context=None):\n    return {{{', '.join(items)}}}\n"
+    exec(compile(source_code, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def serializer_row_encoder(serializer_class, columns, sources=None, fields=None):
+    """``serializer_class`` alanlarıyla aynı sıra ve biçimde satır kodlayıcı derle.
+
+    ``columns`` ``values_list`` kolonlarıdır; alan varsayılan olarak aynı adlı
+    kolondan okunur. ``sources`` ile alan başka bir kolon adına ya da
+    ``(row, context)`` alan bir çağrılabilire yönlendirilir. Kaynağı olmayan alan
+    (serializer'a eklenip burada unutulan) ``ImproperlyConfigured`` verir.
+    ``fields`` verilirse yalnızca o alanlar (seyrek alan kümesi) kodlanır.
+    """
+    from django.core.exceptions import ImproperlyConfigured
+    from rest_framework import serializers
+
+    sources = sources or {}
+    spec = []
+    for name, field in serializer_class().fields.items():
+        if field.write_only or (fields is not None and name not in fields):
+            continue
+        source = sources.get(name, name)
+        if callable(source):
+            spec.append((name, source))
+            continue
+        if source not in columns:
+            raise ImproperlyConfigured(f"{serializer_class.__name__}.{name} için hızlı liste kolonu yok")
+        # Tarih/saat biçimi (saat dilimi, 'Z' soneki) serializer alanının kendisinden
+        converter = field.to_representation if isinstance(field, (serializers.DateField, serializers.DateTimeField)) else None
+        spec.append((name, columns.index(source), converter) if converter else (name, columns.index(source)))
+    return compile_row_encoder(spec, name=f"encode_{serializer_class.__name__}")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` ile aynı bayt çıktısı; veri yalnızca JSON ilkel türleri içermeli.
+
+    Girintisiz (varsayılan) çıktıda ``orjson`` kullanılır; girinti istenirse ya
+    da ``orjson`` yoksa üst sınıfa düşer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None or not self.compact or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer gibi U+2028/U+2029 kaçışlanır (JavaScript alt kümesi)
+        return orjson.dumps(data).replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastListMixin:
+    """``list()`` için hızlı yol: alt sınıf ``get_fast_list_queryset`` ve ``encode_rows`` tanımlar.
+
+    ``get_fast_list_queryset`` görünürlük/filtreleri uygulanmış bir
+    ``values_list(..., named=True)`` döndürür (keyset sayfalama son satırın
+    sıralama alanlarını ad ile okur). ``encode_rows(rows, queryset)`` sözlük
+    listesi döndürür; ``queryset`` sayfalanmamış listede satırların sorgusudur
+    (ilişkili veriyi alt sorguyla çekmek için), sayfalı istekte ``None``.
+    """
+
+    def use_fast_list(self, request):
+        # Yalnızca düz JSON: ?format=api (gezilebilir API) vb. olağan yoldan
+        return settings.API_FAST_LIST and type(request.accepted_renderer) is JSONRenderer
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_list(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_fast_list_queryset())
+        page = self.paginate_queryset(queryset)
+        data = self.encode_rows(list(queryset), queryset) if page is None else self.encode_rows(page, None)
+        request.accepted_renderer = FastJSONRenderer()
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
@@ -0,0 +1,142 @@
+"""Keyset (seek) sayfalama.
+
+Sayfalama isteğe bağlıdır: istemci ``?page_size=`` ya da ``?cursor=`` göndermezse
+liste eskisi gibi düz dizi olarak döner. Gönderirse yanıt
+``{"next": <url|null>, "results": [...]}`` biçimindedir.
+
+OFFSET yerine son satırın sıralama anahtarından devam edilir
+(``WHERE (due_date, id) > (:due, :id)``), böylece derin sayfalar da
+indeksten okunur ve süre sabit kalır.
+"""
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """(alan..., id) üzerinde artan sıralı keyset sayfalama; NULL değerler sona gelir.
+
+    Sıralama görünümün ``keyset_ordering`` niteliğinden okunur; son alan
+    benzersiz olmalıdır (genellikle ``id``).
+    """
+
+    ordering = ("id",)
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Geçersiz sayfa imleci."
+
+    @property
+    def default_page_size(self):
+        return settings.REST_FRAMEWORK.get("PAGE_SIZE") or 100
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, "API_MAX_PAGE_SIZE", 1000)
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, "keyset_ordering", None) or self.ordering)
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param], strict=True, cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return min(self.default_page_size, self.max_page_size)
+
+    # ---- imleç ----
+    def encode_cursor(self, values):
+        raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, token, model):
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                None if value is None else model._meta.get_field(name).to_python(value)
+                for name, value in zip(self.ordering, values)
+            ]
+        except (ValueError, TypeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _after(self, values):
+        """Sıralamada (values) anahtarından sonra gelen satırlar (NULL'lar en sonda)."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for name, value in zip(self.ordering, values):
+            if value is None:
+                # NULL'dan sonra yalnızca yine NULL olup sonraki alanda büyük olanlar gelir
+                equal &= Q(**{f"{name}__isnull": True})
+                continue
+            condition |= equal & (Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True}))
+            equal &= Q(**{name: value})
+        return condition
+
+    # ---- BasePagination ----
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.ordering = self.get_ordering(view)
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*(F(name).asc(nulls_last=True) for name in self.ordering))
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            queryset = queryset.filter(self._after(self.decode_cursor(token, queryset.model)))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = None
+        if self.has_next:
+            last = rows[-1]
+            self.next_cursor = self.encode_cursor([getattr(last, name) for name in self.ordering])
+        return rows
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPaginatedListMixin:
+    """APIView'ler için: queryset'i (istenirse) sayfalayıp serileştir."""
+
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
+
+    def list_response(self, queryset, serializer_class, **serializer_kwargs):
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, self.request, view=self)
+        if page is None:
+            return Response(serializer_class(queryset, many=True, **serializer_kwargs).data)
+        return paginator.get_paginated_response(serializer_class(page, many=True, **serializer_kwargs).data)
@@ -14,6 +14,8 @@ from datetime import timedelta
 import os
 from pathlib import Path
 
+from .database import database_from_env
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -40,6 +42,9 @@ INSTALLED_APPS = [
     'projects',
     'tasks',
     'dashboard',
+    'events',
+    'ops',
+    'search',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -70,6 +75,8 @@ ACCOUNT_AUTHENTICATION_METHOD = "email"
 AUTH_USER_MODEL = 'users.User'
 
 MIDDLEWARE = [
+    # En dışta: diğer middleware'lerin süresi de ölçülsün (bkz. OPS_METRICS)
+    "ops.middleware.PerformanceMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -112,11 +119,22 @@ WSGI_APPLICATION = 'proje_yonetimi.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# DATABASE_URL (sqlite:///... | postgres://...), DB_CONN_MAX_AGE (ASGI altında 0), DB_CONN_HEALTH_CHECKS
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_from_env(os.environ, BASE_DIR / 'db.sqlite3'),
+}
+
+# Her SQLite bağlantısında uygulanır (ops.db.configure_sqlite); None olan atlanır.
+# journal_mode dosyaya kalıcı yazılır: yalnızca SQLITE_JOURNAL_MODE=WAL verilen
+# dağıtımlarda açılır, depodaki geliştirme veritabanı değişmez.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE") or None,
+    # WAL ile güvenli (her işlemde fsync yok); geri alma günlüğünde varsayılan FULL kalır
+    "synchronous": "NORMAL" if os.environ.get("SQLITE_JOURNAL_MODE", "").upper() == "WAL" else None,
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    "cache_size": -20000,               # ~20 MB sayfa önbelleği
+    "temp_store": "MEMORY",
 }
 
 
@@ -182,10 +200,69 @@ TOKEN_MODEL = None
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # simplejwt + süreç içi kullanıcı önbelleği (JWT_USER_CACHE)
+        'users.authentication.CachedJWTAuthentication',
     ),
+    # Keyset sayfalama isteğe bağlı: ?page_size= veya ?cursor= verilmezse liste düz döner
+    'DEFAULT_PAGINATION_CLASS': 'proje_yonetimi.pagination.KeysetPagination',
+    'PAGE_SIZE': 100,
+    # ScopedRateThrottle: yalnızca throttle_scope tanımlayan görünümler; sayaçlar CACHES'te
+    'DEFAULT_THROTTLE_RATES': {
+        'user-autocomplete': os.environ.get("USER_AUTOCOMPLETE_RATE", "600/min"),
+        'user-lookup': os.environ.get("USER_LOOKUP_RATE", "60/min"),
+    },
+}
+
+API_MAX_PAGE_SIZE = int(os.environ.get("API_MAX_PAGE_SIZE", 1000))
+
+# Görev/proje listelerinde serializer'sız okuma yolu (proje_yonetimi.fastlist)
+API_FAST_LIST = os.environ.get("API_FAST_LIST", "1") == "1"
+
+# /api/search/: >0 ise yalnızca en yeni bu kadar eşleşme puanlanır (search.backends);
+# çok büyük tablolarda süreyi sınırlar, pencere dışındaki eski eşleşmeler sonuçta yer almaz
+SEARCH_RANK_WINDOW = int(os.environ.get("SEARCH_RANK_WINDOW", 0))
+
+# /api/tasks/bulk/ isteğinde en fazla satır
+API_BULK_MAX_ITEMS = int(os.environ.get("API_BULK_MAX_ITEMS", 1000))
+
+# /api/projects/<id>/burndown/ en geniş aralık (gün)
+BURNDOWN_MAX_DAYS = int(os.environ.get("BURNDOWN_MAX_DAYS", 731))
+
+# /api/tasks/calendar/: en geniş pencere ve .ics aboneliğinin göreli penceresi (gün)
+CALENDAR_MAX_WINDOW_DAYS = int(os.environ.get("CALENDAR_MAX_WINDOW_DAYS", 400))
+CALENDAR_FEED_PAST_DAYS = int(os.environ.get("CALENDAR_FEED_PAST_DAYS", 30))
+CALENDAR_FEED_FUTURE_DAYS = int(os.environ.get("CALENDAR_FEED_FUTURE_DAYS", 365))
+CALENDAR_FEED_MAX_AGE = int(os.environ.get("CALENDAR_FEED_MAX_AGE", 180 * 24 * 3600))  # imzalı bağlantı (saniye)
+
+# Süreç içi önbellek; çok süreçli kurulumda FileBasedCache/Redis ile değiştirilebilir
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "proje-yonetimi",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
 }
 
+# /api/users/autocomplete/: sonuç sınırı ve süreç içi önek önbelleği (users.lookup)
+USER_AUTOCOMPLETE = {
+    "LIMIT": 10,
+    "MAX_LIMIT": 25,
+    "CACHE_SIZE": int(os.environ.get("USER_AUTOCOMPLETE_CACHE_SIZE", 2048)),
+    # Diğer süreçlerdeki kullanıcı değişiklikleri en geç bu sürede görünür (sn)
+    "CACHE_TTL": float(os.environ.get("USER_AUTOCOMPLETE_CACHE_TTL", 30)),
+}
+
+# JWT ile doğrulanan kullanıcı süreç içi önbellekte (users.authentication). Kayıtta bu
+# süreçte hemen silinir; diğer süreçlerde rol/is_active değişikliği en geç TTL sonra
+# görünür (sn). 0 önbelleği kapatır.
+JWT_USER_CACHE = {
+    "MAX_ENTRIES": int(os.environ.get("JWT_USER_CACHE_SIZE", 10000)),
+    "TTL": float(os.environ.get("JWT_USER_CACHE_TTL", 30)),
+}
+
+# Dashboard özetleri sinyallerle geçersiz kılınır; süre yalnızca güvenlik ağı
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get("DASHBOARD_CACHE_TIMEOUT", 300))
+
 SIMPLE_JWT = { "AUTH_HEADER_TYPES": ("Bearer",), "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60) }
 
 CORS_ALLOW_ALL_ORIGINS = True
@@ -193,4 +270,29 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID", "")
 
-TOKEN_MODEL = None
\ No newline at end of file
+TOKEN_MODEL = None
+
+# /api/events/stream/ (SSE); süreç içi yayıncı, harici servis gerektirmez
+EVENTS_BROKER = os.environ.get("EVENTS_BROKER", "events.broker.InMemoryBroker")
+EVENTS_REPLAY_BUFFER = int(os.environ.get("EVENTS_REPLAY_BUFFER", 1000))   # Last-Event-ID ile geri oynatılabilen olay
+EVENTS_QUEUE_SIZE = int(os.environ.get("EVENTS_QUEUE_SIZE", 500))         # abone başına bekleyen olay; taşarsa bağlantı kapanır
+EVENTS_HEARTBEAT = float(os.environ.get("EVENTS_HEARTBEAT", 15))          # saniye
+EVENTS_VISIBILITY_TTL = float(os.environ.get("EVENTS_VISIBILITY_TTL", 30))  # görünür projeleri yenileme (saniye)
+EVENTS_RETRY_MS = 3000
+
+# İstek ölçümleri (ops.middleware) ve /api/ops/metrics/ (Prometheus, yalnızca personel)
+OPS_METRICS = {
+    "ENABLED": os.environ.get("OPS_METRICS_ENABLED", "1") == "1",
+    # Ölçülecek istek oranı (0..1); ölçülmeyen istekte ek maliyet tek bir random() çağrısı
+    "SAMPLE_RATE": float(os.environ.get("OPS_METRICS_SAMPLE_RATE", 1.0)),
+    # Server-Timing başlığı (DB süresi/sorgu sayısı iç bilgidir): açılırsa yalnızca
+    # personele ya da DEBUG'da herkese gönderilir
+    "SERVER_TIMING": os.environ.get("OPS_METRICS_SERVER_TIMING", "0") == "1",
+    # DRF Serializer.data süresini ölç (uygulama açılışında sarmalanır)
+    "SERIALIZER_TIMING": True,
+    # Yüzdelikler için kayan pencere
+    "WINDOW_SECONDS": 300,
+    "WINDOW_SLICES": 10,
+    # En fazla (görünüm, yöntem) etiketi
+    "MAX_ROUTES": 500,
+}
@@ -0,0 +1,97 @@
+"""Seyrek alan kümeleri: ``?fields=id,title,status``.
+
+Yalnızca okuma isteklerinde (GET/HEAD) geçerlidir. İstenen alanlar hem
+serializer'dan budanır hem de sorguya indirilir: model sorgusunda ``.only()`` ve
+yalnızca gereken ``select_related``, hızlı liste yolunda (``fastlist``) daha dar
+bir ``values_list``. İstenmeyen kolon ve join veritabanından hiç okunmaz.
+
+Görünüm ``sparse_columns`` ile her alanın hangi kolon yollarına ihtiyaç
+duyduğunu bildirir (``"assignee__email"`` bir join demektir; annotation adları
+da kullanılabilir). Listede olmayan alan kendi adındaki kolondan okunur.
+"""
+from functools import cache
+
+from rest_framework.exceptions import ValidationError
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+@cache
+def serializer_field_names(serializer_class):
+    """Okunabilir alanlar, serializer sırasıyla."""
+    return tuple(name for name, field in serializer_class().fields.items() if not field.write_only)
+
+
+class SparseFieldsMixin:
+    fields_query_param = "fields"
+    sparse_columns = {}
+    # Her zaman okunur (ör. bağımlılık eşlemesi ve keyset imleci için)
+    sparse_always = ("id",)
+
+    def get_sparse_fields(self):
+        """``None`` (tüm alanlar) ya da istenen alanlar (serializer sırasıyla)."""
+        if not hasattr(self, "_sparse_fields"):
+            self._sparse_fields = self._parse_sparse_fields()
+        return self._sparse_fields
+
+    def _parse_sparse_fields(self):
+        request = getattr(self, "request", None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        raw = request.query_params.get(self.fields_query_param)
+        if not raw:
+            return None
+        requested = {name.strip() for name in raw.split(",") if name.strip()}
+        available = serializer_field_names(self.get_serializer_class())
+        unknown = sorted(requested.difference(available))
+        if unknown:
+            raise ValidationError({self.fields_query_param: f"Bilinmeyen alan: {', '.join(unknown)}"})
+        if not requested:
+            return None
+        return tuple(name for name in available if name in requested)
+
+    def wants_field(self, *names):
+        fields = self.get_sparse_fields()
+        return fields is None or any(name in fields for name in names)
+
+    def sparse_column_paths(self, all_columns):
+        """İstenen alanların kolon yolları (+ her zaman gerekenler); seyrek değilse ``all_columns``."""
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return tuple(all_columns)
+        paths = [*self.sparse_always, *getattr(self, "keyset_ordering", ())]
+        for name in fields:
+            paths.extend(self.sparse_columns.get(name, (name,)))
+        return tuple(dict.fromkeys(paths))
+
+    def project_queryset(self, queryset, select_related=()):
+        """Model sorgusunu istenen alanlara daralt.
+
+        Seyrek değilse yalnızca ``select_related`` uygulanır; seyrekse ilişkiler
+        istenen yollardan türetilir ve kalan kolonlar ``.only()`` ile ertelenir.
+        """
+        if self.get_sparse_fields() is None:
+            return queryset.select_related(*select_related) if select_related else queryset
+
+        annotations = queryset.query.annotations
+        only, related = [], []
+        for path in self.sparse_column_paths(()):
+            if path in annotations:
+                continue
+            if "__" in path:
+                relation = path.split("__", 1)[0]
+                # İlişki hem ertelenip hem select_related ile izlenemez
+                only.append(relation)
+                related.append(relation)
+            only.append(path)
+        queryset = queryset.only(*dict.fromkeys(only))
+        return queryset.select_related(*dict.fromkeys(related)) if related else queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            target = getattr(serializer, "child", serializer)
+            for name in [name for name in target.fields if name not in fields]:
+                target.fields.pop(name)
+        return serializer
@@ -0,0 +1,19 @@
+"""Uygulamaların testlerinde ortak yardımcılar."""
+
+
+def select_columns(sql):
+    """SELECT listesindeki üst düzey kolon ifadeleri (parantez içindeki virgüller sayılmaz)."""
+    body = sql[len("SELECT "):]
+    depth, start, columns = 0, 0, []
+    for index, char in enumerate(body):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and body.startswith(" FROM ", index):
+            columns.append(body[start:index].strip())
+            return columns
+        elif depth == 0 and char == ",":
+            columns.append(body[start:index].strip())
+            start = index + 1
+    raise AssertionError(sql)
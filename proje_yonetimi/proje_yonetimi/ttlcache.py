@@ -0,0 +1,51 @@
+"""Süreç içi, boyutu sınırlı LRU önbellek; girdiler ``ttl`` saniye sonra geçersizdir.
+
+Django önbelleğinin aksine değerler serileştirilmez ve okuma kilit dışında G/Ç
+yapmaz; sık, küçük ve süreç başına tutulabilecek veriler için (kimliği doğrulanan
+kullanıcı, otomatik tamamlama önekleri). Çok süreçli kurulumda her süreç kendi
+kopyasını tutar; başka süreçteki değişikliklerin gecikmesini ``ttl`` sınırlar.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, stored_at = entry
+            if now - stored_at > self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -26,6 +26,9 @@ urlpatterns = [
     path('api/projects/', include('projects.urls')),
     path('api/tasks/', include('tasks.urls')),  
     path("api/dashboard/", include("dashboard.urls", namespace="dashboard")),  
+    path("api/events/", include("events.urls", namespace="events")),  # SSE; ASGI gerekir
+    path("api/ops/", include("ops.urls", namespace="ops")),
+    path("api/search/", include("search.urls", namespace="search")),
     path("accounts/", include("allauth.urls")),          # allauth
     path("api/auth/", include("dj_rest_auth.urls")),     # opsiyonel: REST login
     path("api/auth/registration/", include("dj_rest_auth.registration.urls")),
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.membership import membership_drift, rebuild_memberships
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Proje üyelik (görünürlük) tablosunu sahip ve görev atananlarından doldurur, doğrular veya onarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Sadece sapmaları raporla, yazma.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--project", type=int, action="append", dest="projects", help="Yalnızca bu proje(ler).")
+
+    def handle(self, *args, check=False, batch_size=1000, projects=None, **options):
+        ids = Project.objects.order_by("pk").values_list("pk", flat=True)
+        if projects:
+            ids = ids.filter(pk__in=projects)
+        ids = list(ids)
+
+        changed = 0
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            if check:
+                missing, extra = membership_drift(batch)
+                for project_id, user_id, reason in sorted(missing):
+                    self.stdout.write(f"Proje {project_id}: eksik üyelik kullanıcı={user_id} ({reason})")
+                for project_id, user_id, reason in sorted(extra):
+                    self.stdout.write(f"Proje {project_id}: fazla üyelik kullanıcı={user_id} ({reason})")
+                changed += len(missing) + len(extra)
+            else:
+                changed += rebuild_memberships(batch)
+
+        if check:
+            if changed:
+                raise CommandError(f"{changed} üyelik satırında sapma var.")
+            self.stdout.write(self.style.SUCCESS(f"{len(ids)} proje kontrol edildi, sapma yok."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"{len(ids)} proje tarandı, {changed} üyelik satırı düzeltildi."))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+from projects.utils import find_rollup_drift, refresh_task_rollups
+
+
+class Command(BaseCommand):
+    help = "Proje görev özetlerini (task_count, task_progress_sum, timed_task_count) doğrular veya yeniden hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Sadece sapmaları raporla, yazma.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--project", type=int, action="append", dest="projects", help="Yalnızca bu proje(ler).")
+
+    def handle(self, *args, check=False, batch_size=1000, projects=None, **options):
+        ids = Project.objects.order_by("pk").values_list("pk", flat=True)
+        if projects:
+            ids = ids.filter(pk__in=projects)
+        ids = list(ids)
+
+        drifted = 0
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            if check:
+                for pk, stored, actual in find_rollup_drift(batch):
+                    drifted += 1
+                    self.stdout.write(f"Proje {pk}: saklanan={stored} gerçek={actual}")
+            else:
+                drifted += refresh_task_rollups(batch)
+
+        if check:
+            if drifted:
+                raise CommandError(f"{drifted} projede özet sapması var.")
+            self.stdout.write(self.style.SUCCESS(f"{len(ids)} proje kontrol edildi, sapma yok."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"{len(ids)} proje tarandı, {drifted} özet düzeltildi."))
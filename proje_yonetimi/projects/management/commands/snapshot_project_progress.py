@@ -0,0 +1,32 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from projects.snapshots import take_snapshots
+
+
+class Command(BaseCommand):
+    help = "Projelerin günlük ilerleme görüntüsünü (burndown) yazar; tekrar çalıştırıldığında kaldığı yerden devam eder."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", dest="day", help="YYYY-AA-GG (varsayılan: bugün).")
+        parser.add_argument("--force", action="store_true", help="O güne ait mevcut görüntüleri de yeniden hesapla.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--project", type=int, action="append", dest="projects", help="Yalnızca bu proje(ler).")
+
+    def handle(self, *args, day=None, force=False, batch_size=2000, projects=None, **options):
+        if day is None:
+            day = timezone.localdate()
+        else:
+            try:
+                day = date.fromisoformat(day)
+            except ValueError:
+                raise CommandError("--date YYYY-AA-GG biçiminde olmalıdır.")
+
+        def progress(last_pk, written):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"  proje {last_pk}'e kadar {written} görüntü yazıldı")
+
+        run = take_snapshots(day, batch_size=batch_size, force=force, project_ids=projects, on_batch=progress)
+        self.stdout.write(self.style.SUCCESS(f"{day}: {run.written} proje görüntüsü yazıldı ({run.batches} parti)."))
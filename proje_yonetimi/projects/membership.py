@@ -0,0 +1,90 @@
+"""ProjectMembership tablosunu proje sahibi ve görev atananlarıyla eşitle.
+
+Tek bir kayıt değiştiğinde yalnızca etkilenen (proje, kullanıcı) çiftleri
+yeniden kontrol edilir; toplu değişikliklerde proje bazında yeniden kurulur.
+"""
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+from typing import Iterable, Optional, Set, Tuple
+
+from django.apps import apps
+from django.db.models import Q
+
+from .models import Project, ProjectMembership
+
+Row = Tuple[int, int, str]  # (project_id, user_id, reason)
+
+
+def sync_owner_membership(project_id: int, owner_id: int) -> None:
+    """Projenin "sahip" üyeliğini tek satıra indir: ``owner_id``."""
+    ProjectMembership.objects.filter(project_id=project_id, reason=ProjectMembership.OWNER).exclude(
+        user_id=owner_id
+    ).delete()
+    ProjectMembership.objects.bulk_create(
+        [ProjectMembership(project_id=project_id, user_id=owner_id, reason=ProjectMembership.OWNER)],
+        ignore_conflicts=True,
+    )
+
+
+def refresh_assignee_memberships(pairs: Iterable[Tuple[Optional[int], Optional[int]]]) -> None:
+    """(project_id, user_id) çiftlerinin "atanan" üyeliğini görev tablosuna göre düzelt."""
+    pairs = {(project_id, user_id) for project_id, user_id in pairs if project_id and user_id}
+    if not pairs:
+        return
+    Task = apps.get_model("tasks", "Task")
+    present = set(
+        Task.objects.filter(reduce(or_, (Q(project_id=p, assignee_id=u) for p, u in pairs)))
+        .values_list("project_id", "assignee_id").distinct()
+    )
+    stale = pairs - present
+    if stale:
+        ProjectMembership.objects.filter(reason=ProjectMembership.ASSIGNEE).filter(
+            reduce(or_, (Q(project_id=p, user_id=u) for p, u in stale))
+        ).delete()
+    if present:
+        ProjectMembership.objects.bulk_create(
+            [ProjectMembership(project_id=p, user_id=u, reason=ProjectMembership.ASSIGNEE) for p, u in present],
+            ignore_conflicts=True,
+        )
+
+
+def expected_memberships(project_ids: Iterable[int]) -> Set[Row]:
+    Task = apps.get_model("tasks", "Task")
+    project_ids = list(project_ids)
+    rows = {
+        (pk, owner_id, ProjectMembership.OWNER)
+        for pk, owner_id in Project.objects.filter(pk__in=project_ids).values_list("pk", "owner_id")
+    }
+    rows.update(
+        (project_id, user_id, ProjectMembership.ASSIGNEE)
+        for project_id, user_id in Task.objects.filter(project_id__in=project_ids, assignee__isnull=False)
+        .values_list("project_id", "assignee_id").distinct()
+    )
+    return rows
+
+
+def membership_drift(project_ids: Iterable[int]) -> Tuple[Set[Row], Set[Row]]:
+    """(eksik, fazla) satırlar."""
+    project_ids = list(project_ids)
+    expected = expected_memberships(project_ids)
+    stored = set(
+        ProjectMembership.objects.filter(project_id__in=project_ids).values_list("project_id", "user_id", "reason")
+    )
+    return expected - stored, stored - expected
+
+
+def rebuild_memberships(project_ids: Iterable[int]) -> int:
+    """Projelerin üyeliklerini baştan kur; değişen satır sayısını döndürür."""
+    missing, extra = membership_drift(project_ids)
+    if extra:
+        ProjectMembership.objects.filter(
+            reduce(or_, (Q(project_id=p, user_id=u, reason=r) for p, u, r in extra))
+        ).delete()
+    if missing:
+        ProjectMembership.objects.bulk_create(
+            [ProjectMembership(project_id=p, user_id=u, reason=r) for p, u, r in missing],
+            ignore_conflicts=True, batch_size=1000,
+        )
+    return len(missing) + len(extra)
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.3 on 2026-10-18 14:35
+
+from django.db import migrations, models
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+
+
+def backfill_task_rollups(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    Task = apps.get_model("tasks", "Task")
+
+    progress = Case(
+        When(progress__lt=0, then=Value(0)),
+        When(progress__gt=100, then=Value(100)),
+        default=F("progress"),
+    )
+    timed = Q(start_date__isnull=False) & (Q(due_date__isnull=False) | Q(end_date__isnull=False))
+    rows = (
+        Task.objects.order_by()
+        .values("project")
+        .annotate(count=Count("pk"), progress_sum=Sum(progress), timed=Count("pk", filter=timed))
+    )
+    for row in rows.iterator():
+        Project.objects.filter(pk=row["project"]).update(
+            task_count=row["count"],
+            task_progress_sum=row["progress_sum"] or 0,
+            timed_task_count=row["timed"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_created_at'),
+        ('tasks', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='task_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='task_progress_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='timed_task_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_task_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-18 14:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_task_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['owner', 'created_at'], name='project_owner_created_idx'),
+        ),
+    ]
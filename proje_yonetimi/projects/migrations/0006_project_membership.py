@@ -0,0 +1,48 @@
+# Generated by Django 5.0.3 on 2026-10-18 14:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_memberships(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectMembership = apps.get_model("projects", "ProjectMembership")
+    Task = apps.get_model("tasks", "Task")
+
+    ProjectMembership.objects.bulk_create(
+        (ProjectMembership(project_id=pk, user_id=owner_id, reason="owner")
+         for pk, owner_id in Project.objects.values_list("pk", "owner_id").iterator()),
+        batch_size=1000, ignore_conflicts=True,
+    )
+    pairs = Task.objects.filter(assignee__isnull=False).values_list("project_id", "assignee_id").distinct()
+    ProjectMembership.objects.bulk_create(
+        (ProjectMembership(project_id=project_id, user_id=user_id, reason="assignee")
+         for project_id, user_id in pairs.iterator()),
+        batch_size=1000, ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_owner_created_idx'),
+        ('tasks', '0003_task_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(choices=[('owner', 'Sahip'), ('assignee', 'Atanan')], max_length=10)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'project', 'reason'), name='project_membership_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_memberships, migrations.RunPython.noop),
+    ]
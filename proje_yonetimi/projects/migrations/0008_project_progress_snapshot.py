@@ -0,0 +1,30 @@
+# Generated by Django 5.0.3 on 2026-10-18 15:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_project_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectProgressSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('manual_progress', models.IntegerField()),
+                ('dynamic_progress', models.IntegerField(null=True)),
+                ('effective_progress', models.IntegerField()),
+                ('task_count', models.IntegerField(default=0)),
+                ('status_counts', models.JSONField(default=dict)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='projects.project')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('project', 'day'), name='project_snapshot_unique_day')],
+            },
+        ),
+    ]
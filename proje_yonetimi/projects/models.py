@@ -1,6 +1,24 @@
+from datetime import date
+from typing import Optional
+
 from django.db import models
 from users.models import User
 
+from .utils import project_progress_annotations
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_progress(self, today: Optional[date] = None):
+        """manual_progress / dynamic_progress / effective_progress kolonlarını SQL'de hesapla."""
+        return self.annotate(**project_progress_annotations(today))
+
+    def visible_to(self, user):
+        """Kullanıcının görebildiği projeler: personel hepsini, diğerleri üyelik tablosundakileri."""
+        if user.is_staff:
+            return self
+        return self.filter(pk__in=ProjectMembership.objects.for_user(user))
+
+
 class Project(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
@@ -11,6 +29,91 @@ class Project(models.Model):
     end_date = models.DateField(null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    # Koşullu GET (ETag); görev özeti güncellemeleri bunu değiştirmez
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Görev özeti (tasks.signals tarafından güncel tutulur, rebuild_project_rollups ile onarılır)
+    task_count = models.IntegerField(default=0, editable=False)
+    task_progress_sum = models.IntegerField(default=0, editable=False)
+    timed_task_count = models.IntegerField(default=0, editable=False)
+
+    objects = ProjectQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Sahip kapsamlı sayımlar ve "son projeler" sıralaması
+            models.Index(fields=["owner", "created_at"], name="project_owner_created_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Sahip değişirse eski sahip de bilinsin (dashboard önbelleği, üyelik tablosu)
+        if "owner_id" in field_names:
+            instance._loaded_owner_id = instance.owner_id
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save alıcılarının hepsi eski sahibi gördükten sonra güncelle
+        self._loaded_owner_id = self.owner_id
+
+    def __str__(self):
+        return self.name
+
+class ProjectMembershipQuerySet(models.QuerySet):
+    def for_user(self, user):
+        """``project_id IN (...)`` alt sorgusu için proje id'leri (DISTINCT gerekmez)."""
+        return self.filter(user=user).values("project_id")
+
+
+class ProjectMembership(models.Model):
+    """Görünürlük tablosu: kullanıcı projeyi sahibi olduğu ya da bir görevine atandığı için görür.
+
+    ``projects.membership`` ve sinyallerle güncel tutulur; ``rebuild_project_memberships``
+    komutuyla doğrulanır/onarılır.
+    """
+
+    OWNER = "owner"
+    ASSIGNEE = "assignee"
+    REASON_CHOICES = [(OWNER, "Sahip"), (ASSIGNEE, "Atanan")]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="project_memberships")
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="memberships")
+    reason = models.CharField(max_length=10, choices=REASON_CHOICES)
+
+    objects = ProjectMembershipQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # (user, project) öneki görünürlük alt sorgusunu kapsar
+            models.UniqueConstraint(fields=["user", "project", "reason"], name="project_membership_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.project_id} ({self.reason})"
+
+
+class ProjectProgressSnapshot(models.Model):
+    """Projenin bir gündeki ilerlemesi ve görev durum sayıları (burndown / trend grafikleri).
+
+    ``snapshot_project_progress`` komutuyla günde bir kez yazılır; dinamik ilerleme
+    o güne göre hesaplandığı için sonradan yeniden üretilemez.
+    """
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="progress_snapshots")
+    day = models.DateField()
+    manual_progress = models.IntegerField()
+    dynamic_progress = models.IntegerField(null=True)
+    effective_progress = models.IntegerField()
+    task_count = models.IntegerField(default=0)
+    status_counts = models.JSONField(default=dict)  # {"Tamamlandı": 3, ...}
+
+    class Meta:
+        constraints = [
+            # Tekrar çalıştırmada upsert anahtarı; (project, day) öneki burndown aralık taramasını karşılar
+            models.UniqueConstraint(fields=["project", "day"], name="project_snapshot_unique_day"),
+        ]
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return f"{self.project_id} @ {self.day}: {self.effective_progress}"
@@ -1,7 +1,12 @@
+from functools import cache
+
 from rest_framework import serializers
 
 from .models import Project
-from .utils import project_progress_info
+from proje_yonetimi.fastlist import serializer_row_encoder
+from tasks.utils import clear_progress_annotations
+
+from .utils import ROLLUP_FIELDS, project_progress_from_annotations, project_progress_info
 
 class ProjectSerializer(serializers.ModelSerializer):
     dynamic_progress = serializers.SerializerMethodField(read_only=True)
@@ -9,7 +14,7 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
-        fields = '__all__'
+        exclude = ROLLUP_FIELDS  # iç özet alanları API'de yok
         read_only_fields = ['owner', "created_at"]  # Burası çok önemli!
 
     def validate_progress(self, value):
@@ -17,9 +22,15 @@ class ProjectSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("İlerleme 0-100 arasında olmalıdır.")
         return value
 
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        clear_progress_annotations(instance)
+        return instance
+
     def _progress_payload(self, obj):
         if not hasattr(obj, "_progress_payload"):
-            obj._progress_payload = project_progress_info(obj)
+            # with_progress() ile gelmişse SQL kolonlarını kullan, yoksa Python'da hesapla
+            obj._progress_payload = project_progress_from_annotations(obj) or project_progress_info(obj)
         return obj._progress_payload
 
     def get_dynamic_progress(self, obj):
@@ -28,4 +39,16 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     def get_effective_progress(self, obj):
         payload = self._progress_payload(obj)
-        return payload.effective
\ No newline at end of file
+        return payload.effective
+
+
+# ProjectViewSet.list hızlı yolu (proje_yonetimi.fastlist): ProjectSerializer ile aynı çıktı
+PROJECT_LIST_COLUMNS = (
+    "id", "name", "description", "owner_id", "status", "progress", "start_date", "end_date",
+    "created_at", "updated_at", "dynamic_progress", "effective_progress",
+)
+
+
+@cache
+def project_row_encoder(columns=PROJECT_LIST_COLUMNS, fields=None):
+    return serializer_row_encoder(ProjectSerializer, columns, {"owner": "owner_id"}, fields)
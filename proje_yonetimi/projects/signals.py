@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .membership import sync_owner_membership
+from .models import Project
+
+
+@receiver(post_save, sender=Project)
+def sync_owner_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created or getattr(instance, "_loaded_owner_id", None) != instance.owner_id:
+        sync_owner_membership(instance.pk, instance.owner_id)
@@ -0,0 +1,93 @@
+"""Günlük proje ilerleme anlık görüntüleri (burndown / trend).
+
+Projeler pk sırasıyla partiler halinde işlenir; her parti için ilerleme
+``with_progress(day)`` ile SQL'de, durum sayıları tek GROUP BY sorgusuyla
+hesaplanır ve ``(project, day)`` anahtarıyla tek upsert'te yazılır. Parti başına
+sabit sayıda sorgu çalışır, proje başına Python döngüsünde sorgu yoktur.
+
+Yeniden çalıştırmak güvenlidir (idempotent): o gün için görüntüsü olan projeler
+atlanır, böylece yarıda kesilen çalışma kaldığı yerden devam eder. ``force``
+ile mevcut satırlar yeniden hesaplanıp güncellenir.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Iterable, Optional
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef
+
+from .models import Project, ProjectProgressSnapshot
+
+SNAPSHOT_FIELDS = ("manual_progress", "dynamic_progress", "effective_progress", "task_count", "status_counts")
+
+
+@dataclass
+class SnapshotRun:
+    written: int = 0
+    batches: int = 0
+
+
+def _status_counts(project_ids):
+    Task = apps.get_model("tasks", "Task")
+    counts = {pk: {} for pk in project_ids}
+    rows = (
+        Task.objects.filter(project_id__in=project_ids)
+        .order_by()
+        .values_list("project_id", "status")
+        .annotate(n=Count("pk"))
+    )
+    for project_id, status, n in rows:
+        counts[project_id][status] = n
+    return counts
+
+
+def _snapshot_batch(project_rows, day):
+    counts = _status_counts([row[0] for row in project_rows])
+    snapshots = [
+        ProjectProgressSnapshot(
+            project_id=pk, day=day, manual_progress=manual, dynamic_progress=dynamic,
+            effective_progress=effective, task_count=sum(counts[pk].values()), status_counts=counts[pk],
+        )
+        for pk, manual, dynamic, effective in project_rows
+    ]
+    with transaction.atomic():
+        ProjectProgressSnapshot.objects.bulk_create(
+            snapshots, update_conflicts=True, unique_fields=["project", "day"], update_fields=SNAPSHOT_FIELDS,
+        )
+    return len(snapshots)
+
+
+def take_snapshots(
+    day: date,
+    *,
+    batch_size: int = 2000,
+    force: bool = False,
+    project_ids: Optional[Iterable[int]] = None,
+    on_batch: Optional[Callable[[int, int], None]] = None,
+) -> SnapshotRun:
+    """``day`` için tüm (ya da verilen) projelerin görüntüsünü yaz; ``on_batch(son pk, yazılan)``."""
+    projects = Project.objects.order_by("pk")
+    if project_ids is not None:
+        projects = projects.filter(pk__in=list(project_ids))
+    if not force:
+        # Devam: o güne ait görüntüsü olanlar (project, day) benzersiz indeksinden elenir
+        projects = projects.filter(~Exists(
+            ProjectProgressSnapshot.objects.filter(project=OuterRef("pk"), day=day)
+        ))
+    projects = projects.with_progress(day).values_list(
+        "pk", "manual_progress", "dynamic_progress", "effective_progress",
+    )
+
+    run = SnapshotRun()
+    last_pk = 0
+    while True:
+        rows = list(projects.filter(pk__gt=last_pk)[:batch_size])
+        if not rows:
+            return run
+        last_pk = rows[-1][0]
+        written = _snapshot_batch(rows, day)
+        run.written += written
+        run.batches += 1
+        if on_batch is not None:
+            on_batch(last_pk, written)
@@ -1,3 +1,403 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.db.models import Q
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from proje_yonetimi.testing import select_columns
+from tasks.models import Task
+from users.models import User
+
+from .models import Project, ProjectMembership
+from .utils import project_progress_info
+
+
+class ProjectProgressAnnotationParityTests(TestCase):
+    """`Project.objects.with_progress()` ile `project_progress_info` aynı sonucu vermeli."""
+
+    today = date(2025, 3, 10)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+
+    def _project(self, tasks=(), **kwargs):
+        project = Project.objects.create(name="P", owner=self.owner, **kwargs)
+        for task in tasks:
+            Task.objects.create(project=project, title="t", **task)
+        return project
+
+    def assertParity(self, today):
+        for project in Project.objects.with_progress(today).prefetch_related("tasks"):
+            expected = project_progress_info(project, today=today)
+            actual = (project.manual_progress, project.dynamic_progress, project.effective_progress)
+            self.assertEqual(actual, (expected.manual, expected.dynamic, expected.effective),
+                             msg=f"project={project.pk} today={today}")
+
+    def test_edge_cases(self):
+        d = self.today
+        self._project()                                                          # görev ve tarih yok
+        self._project(progress=130)
+        self._project(start_date=d, end_date=d)                                  # sıfır uzunluk
+        self._project(start_date=d - timedelta(days=4), end_date=d + timedelta(days=4), progress=10)
+        self._project(tasks=[{"progress": 30}, {"progress": 45}])                # 37.5 -> 38
+        self._project(tasks=[{"progress": 25}, {"progress": 0}])                 # 12.5 -> 12
+        self._project(tasks=[{"progress": -10}, {"progress": 200}])
+        self._project(
+            start_date=d - timedelta(days=10), end_date=d + timedelta(days=30), progress=5,
+            tasks=[
+                {"start_date": d - timedelta(days=23), "end_date": d + timedelta(days=17)},
+                {"start_date": d, "end_date": d - timedelta(days=1)},
+                {"due_date": d, "progress": 70},
+            ],
+        )
+
+        for today in (d, d - timedelta(days=400), d + timedelta(days=400), d + timedelta(days=2)):
+            self.assertParity(today)
+
+
+class ProjectListProgressTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/projects/")
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def test_list_does_not_load_tasks(self):
+        project = Project.objects.create(name="A", owner=self.owner)
+        Task.objects.create(project=project, title="t", progress=60)
+        few, _ = self._list_queries()
+
+        for i in range(5):
+            extra = Project.objects.create(name=f"B{i}", owner=self.owner)
+            Task.objects.bulk_create([Task(project=extra, title="t", progress=20) for _ in range(4)])
+        many, data = self._list_queries()
+
+        self.assertEqual(few, many)
+        by_id = {p["id"]: p for p in data}
+        self.assertEqual(by_id[project.id]["effective_progress"], 60)
+        self.assertEqual(by_id[project.id]["dynamic_progress"], 60)
+
+    def test_update_response_is_not_stale(self):
+        project = Project.objects.create(name="A", owner=self.owner)
+        response = self.client.patch(f"/api/projects/{project.id}/", {"progress": 55}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["effective_progress"], 55)
+
+
+class ProjectTaskRollupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+
+    def setUp(self):
+        self.project = Project.objects.create(name="A", owner=self.owner)
+        self.other = Project.objects.create(name="B", owner=self.owner)
+
+    def rollup(self, project):
+        project.refresh_from_db()
+        return project.task_count, project.task_progress_sum, project.timed_task_count
+
+    def test_save_move_and_delete_keep_rollup_in_sync(self):
+        d = date(2025, 1, 1)
+        task = Task.objects.create(project=self.project, title="t", progress=150)
+        Task.objects.create(project=self.project, title="u", progress=20, start_date=d, end_date=d)
+        self.assertEqual(self.rollup(self.project), (2, 120, 1))
+
+        task = Task.objects.get(pk=task.pk)
+        task.progress = 40
+        task.start_date, task.due_date = d, d + timedelta(days=3)
+        task.save()
+        self.assertEqual(self.rollup(self.project), (2, 60, 2))
+
+        task.project = self.other
+        task.save()
+        self.assertEqual(self.rollup(self.project), (1, 20, 1))
+        self.assertEqual(self.rollup(self.other), (1, 40, 1))
+
+        task.delete()
+        self.assertEqual(self.rollup(self.other), (0, 0, 0))
+
+    def test_partial_instance_falls_back_to_recompute(self):
+        task = Task.objects.create(project=self.project, title="t", progress=10)
+        partial = Task.objects.only("id", "title").get(pk=task.pk)
+        partial.progress = 70
+        partial.save()
+        self.assertEqual(self.rollup(self.project), (1, 70, 0))
+
+    def test_bulk_paths_refresh_through_signal(self):
+        from tasks.signals import tasks_bulk_changed
+
+        Task.objects.bulk_create([Task(project=self.project, title="t", progress=30) for _ in range(3)])
+        self.assertEqual(self.rollup(self.project), (0, 0, 0))
+        tasks_bulk_changed.send(sender=Task, project_ids=[self.project.pk])
+        self.assertEqual(self.rollup(self.project), (3, 90, 0))
+
+    def test_rollup_used_without_loading_untimed_tasks(self):
+        Task.objects.create(project=self.project, title="t", progress=30)
+        Task.objects.create(project=self.project, title="u", progress=45)
+        project = Project.objects.get(pk=self.project.pk)
+        with self.assertNumQueries(0):
+            payload = project_progress_info(project, today=date(2025, 1, 1))
+        self.assertEqual(payload.dynamic, 38)
+
+    def test_rebuild_command_repairs_and_verifies(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        Task.objects.create(project=self.project, title="t", progress=30)
+        Project.objects.filter(pk=self.project.pk).update(task_count=7, task_progress_sum=1)
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_project_rollups", "--check", stdout=StringIO())
+        call_command("rebuild_project_rollups", stdout=StringIO())
+        self.assertEqual(self.rollup(self.project), (1, 30, 0))
+        call_command("rebuild_project_rollups", "--check", stdout=StringIO())
+
+    def test_project_delete_does_not_update_rollups_per_task(self):
+        for i in range(5):
+            Task.objects.create(project=self.project, title=f"t{i}")
+        with CaptureQueriesContext(connection) as ctx:
+            self.project.delete()
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('UPDATE "projects_project"')]
+        self.assertEqual(updates, [])
+        self.assertFalse(Task.objects.filter(project_id=self.project.pk).exists())
+
+
+class ProjectPaginationTests(TestCase):
+    def test_created_at_cursor_round_trips(self):
+        owner = User.objects.create_user(email="owner@example.com")
+        for i in range(5):
+            Project.objects.create(name=f"P{i}", owner=owner)
+        client = APIClient()
+        client.force_authenticate(owner)
+
+        ids, url, params = [], "/api/projects/", {"page_size": 2}
+        while url:
+            body = client.get(url, params).json()
+            ids += [row["id"] for row in body["results"]]
+            url, params = body["next"], None
+        self.assertEqual(ids, list(Project.objects.order_by("created_at", "id").values_list("id", flat=True)))
+
+
+class ProjectFastListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.staff = User.objects.create_user(email="staff@example.com", is_staff=True)
+        Project.objects.create(name="Zamanlı ğ \u2028", description="çok\nsatır", owner=cls.owner,
+                               start_date=date(2025, 1, 1), end_date=date(2025, 12, 31), progress=20)
+        Project.objects.create(name="Tarihsiz", owner=cls.owner)
+        other = Project.objects.create(name="Başkası", owner=cls.staff)
+        Task.objects.create(project=other, title="t", assignee=cls.owner, progress=70)
+
+    def test_byte_identical_to_serializer(self):
+        client = APIClient()
+        for user in (self.owner, self.staff):
+            client.force_authenticate(user)
+            for params in ({}, {"page_size": 2}):
+                with self.subTest(user=user.email, params=params):
+                    fast = client.get("/api/projects/", params)
+                    with self.settings(API_FAST_LIST=False):
+                        slow = client.get("/api/projects/", params)
+                    self.assertEqual(fast.status_code, 200)
+                    self.assertEqual(fast.content, slow.content)
+        # created_at mikrosaniyeli; DRF biçimi (…Z) korunmalı
+        self.assertTrue(fast.json()["results"][0]["created_at"].endswith("Z"))
+
+
+class ProjectSparseFieldsTests(TestCase):
+    def test_fields_prune_columns_joins_and_progress(self):
+        owner = User.objects.create_user(email="owner@example.com")
+        project = Project.objects.create(name="Seyrek", description="uzun" * 100, owner=owner)
+        client = APIClient()
+        client.force_authenticate(owner)
+        for fast in (True, False):
+            with self.subTest(fast=fast), self.settings(API_FAST_LIST=fast):
+                widths = []
+                for params in ({}, {"fields": "id,name,effective_progress"}, {"fields": "id,name"}):
+                    with CaptureQueriesContext(connection) as ctx:
+                        response = client.get("/api/projects/", params)
+                    sql = next(q["sql"] for q in ctx.captured_queries if 'FROM "projects_project"' in q["sql"])
+                    widths.append(len(select_columns(sql)))
+                    if params:
+                        self.assertEqual(set(response.json()[0]), set(params["fields"].split(",")))
+                        self.assertNotIn('"description"', sql)
+                        self.assertNotIn('JOIN "users_user"', sql)
+                self.assertGreater(widths[0], widths[1])
+                self.assertGreater(widths[1], widths[2])
+        response = client.get(f"/api/projects/{project.pk}/", {"fields": "name,owner"})
+        self.assertEqual(response.json(), {"name": "Seyrek", "owner": owner.pk})
+
+
+class ProjectMembershipVisibilityTests(TestCase):
+    """Üyelik tablosuyla görünürlük, eski OR-join + DISTINCT filtresiyle birebir aynı olmalı."""
+
+    @classmethod
+    def setUpTestData(cls):
+        import random
+
+        rnd = random.Random(12)
+        cls.users = [User.objects.create_user(email=f"u{i}@example.com") for i in range(6)]
+        cls.projects = [Project.objects.create(name=f"P{i}", owner=rnd.choice(cls.users)) for i in range(8)]
+        cls.tasks = [
+            Task.objects.create(
+                project=rnd.choice(cls.projects), title=f"T{i}",
+                assignee=rnd.choice(cls.users + [None, None]),
+            )
+            for i in range(40)
+        ]
+
+    def assertSameVisibility(self):
+        for user in self.users:
+            legacy_projects = set(
+                Project.objects.filter(Q(owner=user) | Q(tasks__assignee=user)).distinct().values_list("pk", flat=True)
+            )
+            legacy_tasks = set(
+                Task.objects.filter(Q(project__owner=user) | Q(project__tasks__assignee=user))
+                .distinct().values_list("pk", flat=True)
+            )
+            self.assertEqual(set(Project.objects.visible_to(user).values_list("pk", flat=True)), legacy_projects)
+            self.assertEqual(set(Task.objects.visible_to(user).values_list("pk", flat=True)), legacy_tasks)
+
+    def test_visible_rows_match_legacy_filter_through_changes(self):
+        self.assertSameVisibility()
+
+        # yeniden atama, proje taşıma, atananı kaldırma
+        for i, task in enumerate(Task.objects.all()[:15]):
+            task.assignee = self.users[i % len(self.users)] if i % 3 else None
+            if i % 4 == 0:
+                task.project = self.projects[(i + 1) % len(self.projects)]
+            task.save()
+        self.assertSameVisibility()
+
+        # silme ve sahip değişikliği
+        Task.objects.filter(pk__in=[t.pk for t in self.tasks[20:26]]).first().delete()
+        project = Project.objects.get(pk=self.projects[0].pk)
+        project.owner = self.users[-1]
+        project.save()
+        self.projects[1].delete()
+        self.assertSameVisibility()
+
+        # toplu güncelleme + sinyal
+        from tasks.signals import tasks_bulk_changed
+
+        Task.objects.filter(project=self.projects[2]).update(assignee=self.users[0])
+        tasks_bulk_changed.send(sender=Task, project_ids=[self.projects[2].pk])
+        self.assertSameVisibility()
+
+    def test_list_query_has_no_distinct_or_join(self):
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+        with CaptureQueriesContext(connection) as ctx:
+            client.get("/api/tasks/")
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertNotIn("DISTINCT", sql)
+        self.assertIn("projects_projectmembership", sql)
+
+    def test_rebuild_command_backfills_and_checks(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        ProjectMembership.objects.all().delete()
+        with self.assertRaises(CommandError):
+            call_command("rebuild_project_memberships", "--check", stdout=StringIO())
+        call_command("rebuild_project_memberships", stdout=StringIO())
+        call_command("rebuild_project_memberships", "--check", stdout=StringIO())
+        self.assertSameVisibility()
+
+
+class ProjectProgressSnapshotTests(TestCase):
+    day = date(2025, 3, 15)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.other = User.objects.create_user(email="other@example.com")
+        cls.timed = Project.objects.create(
+            name="Zamanlı", owner=cls.owner, progress=10, start_date=date(2025, 3, 1), end_date=date(2025, 3, 31),
+        )
+        cls.plain = Project.objects.create(name="Düz", owner=cls.owner)
+        cls.hidden = Project.objects.create(name="Gizli", owner=cls.other)
+        Task.objects.create(project=cls.plain, title="a", progress=40, status="Tamamlandı")
+        Task.objects.create(project=cls.plain, title="b", progress=20)
+        Task.objects.create(project=cls.plain, title="c", progress=0)
+
+    def snapshot(self, *args):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command("snapshot_project_progress", "--date", self.day.isoformat(), *args, stdout=out)
+        return out.getvalue()
+
+    def test_batched_snapshots_match_live_progress(self):
+        from .models import ProjectProgressSnapshot
+        from .snapshots import take_snapshots
+
+        with CaptureQueriesContext(connection) as ctx:
+            run = take_snapshots(self.day, batch_size=2)
+        self.assertEqual((run.written, run.batches), (3, 2))
+        # Parti başına: projeler + durum sayıları + upsert (+ işlem savepoint'leri)
+        self.assertLessEqual(len(ctx.captured_queries), run.batches * 5 + 1)
+
+        for project in Project.objects.with_progress(self.day):
+            snapshot = ProjectProgressSnapshot.objects.get(project=project, day=self.day)
+            self.assertEqual(
+                (snapshot.manual_progress, snapshot.dynamic_progress, snapshot.effective_progress),
+                (project.manual_progress, project.dynamic_progress, project.effective_progress),
+            )
+        plain = ProjectProgressSnapshot.objects.get(project=self.plain)
+        self.assertEqual((plain.task_count, plain.status_counts), (3, {"Tamamlandı": 1, "Devam Ediyor": 2}))
+
+    def test_command_is_idempotent_and_resumable(self):
+        from .models import ProjectProgressSnapshot
+
+        # Yarıda kalmış çalışma: bir proje zaten yazılmış
+        ProjectProgressSnapshot.objects.create(
+            project=self.plain, day=self.day, manual_progress=0, effective_progress=99,
+        )
+        self.assertIn("2 proje", self.snapshot())
+        self.assertIn("0 proje", self.snapshot())
+        self.assertEqual(ProjectProgressSnapshot.objects.filter(day=self.day).count(), 3)
+        self.assertEqual(ProjectProgressSnapshot.objects.get(project=self.plain).effective_progress, 99)
+
+        self.assertIn("3 proje", self.snapshot("--force"))
+        self.assertEqual(ProjectProgressSnapshot.objects.filter(day=self.day).count(), 3)
+        self.assertEqual(ProjectProgressSnapshot.objects.get(project=self.plain).effective_progress, 20)
+
+    def test_burndown_range(self):
+        from .snapshots import take_snapshots
+
+        for offset in range(3):
+            take_snapshots(self.day + timedelta(days=offset))
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        url = f"/api/projects/{self.timed.pk}/burndown/"
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url, {"from": "2025-03-16", "to": "2025-03-31"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 2)  # görünürlük + aralık taraması
+        body = response.json()
+        self.assertEqual([row["date"] for row in body["snapshots"]], ["2025-03-16", "2025-03-17"])
+        self.assertEqual(body["snapshots"][0]["progress"], 50)
 
-# Create your tests here.
+        self.assertEqual(client.get(url, {"from": "2025-03-31", "to": "2025-03-01"}).status_code, 400)
+        self.assertEqual(client.get(url, {"from": "dün"}).status_code, 400)
+        self.assertEqual(client.get(f"/api/projects/{self.hidden.pk}/burndown/").status_code, 404)
@@ -6,6 +6,7 @@ router = DefaultRouter()
 router.register(r'', ProjectViewSet, basename='project')
 urlpatterns = router.urls
 
-urlpatterns = router.urls + [
+# Router'daki "<pk>/" kalıbı bu yolu yutmasın diye önce gelmeli
+urlpatterns = [
     path('dashboard-summary/', DashboardSummaryView.as_view()),
-]
\ No newline at end of file
+] + router.urls
\ No newline at end of file
@@ -2,11 +2,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from django.apps import apps
+from django.db.models import Case, Count, F, FloatField, Func, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf
 from django.utils import timezone
 
-from tasks.utils import aggregate_task_progress, calculate_time_progress
+from tasks.utils import (
+    aggregate_task_progress,
+    calculate_time_progress,
+    effective_progress_expression,
+    normalized_progress_expression,
+    round_half_even_expression,
+    task_progress_annotations,
+    task_progress_info,
+    time_progress_expression,
+    timed_task_q,
+)
+
+ROLLUP_FIELDS = ("task_count", "task_progress_sum", "timed_task_count")
 
 
 @dataclass(frozen=True)
@@ -32,16 +47,130 @@ def project_progress_info(project, *, today: Optional[date] = None, tasks: Optio
 
     if tasks is None:
         tasks = getattr(project, "_prefetched_objects_cache", {}).get("tasks")
-        if tasks is None:
-            tasks = list(project.tasks.all())
+
+    if tasks is None:
+        # Görevler elde yoksa denormalize özet kullanılır (yalnızca zamana bağlı görevler okunur)
+        task_based = rollup_task_average(project, today=today)
     else:
         tasks = list(tasks)
-
-    task_based = aggregate_task_progress(tasks, today=today) if tasks else None
+        task_based = aggregate_task_progress(tasks, today=today) if tasks else None
     time_based = calculate_time_progress(getattr(project, "start_date", None), getattr(project, "end_date", None), today=today)
 
     candidates = [v for v in (task_based, time_based) if v is not None]
     dynamic = max(candidates) if candidates else None
     effective = max(manual, dynamic if dynamic is not None else 0)
 
-    return ProjectProgress(manual=manual, dynamic=dynamic, effective=effective)
\ No newline at end of file
+    return ProjectProgress(manual=manual, dynamic=dynamic, effective=effective)
+
+
+def project_progress_from_annotations(project) -> Optional[ProjectProgress]:
+    """`with_progress()` ile gelen kolonlar varsa ProjectProgress'e çevir."""
+    if not hasattr(project, "effective_progress"):
+        return None
+    return ProjectProgress(
+        manual=project.manual_progress,
+        dynamic=project.dynamic_progress,
+        effective=project.effective_progress,
+    )
+
+
+def rollup_task_average(project, *, today: Optional[date] = None) -> Optional[int]:
+    """`aggregate_task_progress` sonucu, Project özet alanlarından.
+
+    Zamana bağlı görevi olmayan projeler için sorgu gerektirmez; diğerlerinde
+    yalnızca zamana bağlı görevler okunup manuel değerden farkları eklenir.
+    """
+    if project.pk is None or not project.task_count:
+        return None
+    total = project.task_progress_sum
+    if project.timed_task_count:
+        for task in project.tasks.timed():
+            info = task_progress_info(task, today=today)
+            total += info.effective - info.manual
+    return max(0, min(100, round(total / project.task_count)))
+
+
+def task_average_expression(today: date):
+    """`rollup_task_average` karşılığı SQL ifadesi."""
+    Task = apps.get_model("tasks", "Task")
+    progress = task_progress_annotations(today)
+    # GROUP BY'sız skaler SUM: dış sorgu kolonları (OuterRef) toplamla aynı ifadede kullanılabilsin
+    delta = Func(progress["effective_progress"] - progress["manual_progress"], function="SUM", output_field=IntegerField())
+    timed = (
+        Task.objects.filter(project=OuterRef("pk")).timed()
+        .order_by()
+        .annotate(avg=round_half_even_expression(
+            Cast(OuterRef("task_progress_sum") + Coalesce(delta, 0), FloatField()) / OuterRef("task_count")
+        ))
+        .values("avg")[:1]
+    )
+    return Case(
+        When(task_count=0, then=Value(None)),
+        When(timed_task_count=0, then=round_half_even_expression(
+            Cast(F("task_progress_sum"), FloatField()) / F("task_count")
+        )),
+        default=Subquery(timed, output_field=IntegerField()),
+        output_field=IntegerField(),
+    )
+
+
+def rollup_aggregates() -> dict:
+    """Görev tablosu üzerinden özet alanlarını hesaplayan aggregate sözlüğü."""
+    return {
+        "task_count": Count("pk"),
+        "task_progress_sum": Coalesce(Sum(normalized_progress_expression("progress")), 0),
+        "timed_task_count": Count("pk", filter=timed_task_q()),
+    }
+
+
+def compute_task_rollups(project_ids: Iterable[int]) -> Dict[int, Tuple[int, int, int]]:
+    """Verilen projelerin özetini tek GROUP BY sorgusuyla görevlerden hesapla."""
+    Task = apps.get_model("tasks", "Task")
+    project_ids = set(project_ids)
+    rollups = {pk: (0, 0, 0) for pk in project_ids}
+    rows = (
+        Task.objects.filter(project_id__in=project_ids)
+        .order_by()
+        .values("project")
+        .annotate(**rollup_aggregates())
+    )
+    for row in rows:
+        rollups[row["project"]] = tuple(row[name] for name in ROLLUP_FIELDS)
+    return rollups
+
+
+def find_rollup_drift(project_ids: Iterable[int]) -> List[Tuple[int, tuple, tuple]]:
+    """Saklanan özeti gerçek değerden farklı projeler: (pk, saklanan, gerçek)."""
+    Project = apps.get_model("projects", "Project")
+    actual = compute_task_rollups(project_ids)
+    stored = Project.objects.filter(pk__in=actual).values_list("pk", *ROLLUP_FIELDS)
+    return [(pk, tuple(values), actual[pk]) for pk, *values in stored if tuple(values) != actual[pk]]
+
+
+def refresh_task_rollups(project_ids: Iterable[int]) -> int:
+    """Özetleri görevlerden yeniden hesapla (toplu işlemler ve onarım için). Değişen proje sayısını döndürür."""
+    Project = apps.get_model("projects", "Project")
+    changed = []
+    for pk, _stored, actual in find_rollup_drift(project_ids):
+        changed.append(Project(pk=pk, **dict(zip(ROLLUP_FIELDS, actual))))
+    Project.objects.bulk_update(changed, ROLLUP_FIELDS, batch_size=500)
+    return len(changed)
+
+
+def project_progress_annotations(today: Optional[date] = None) -> dict:
+    """`project_progress_info` alanlarının annotate() sözlüğü."""
+    if today is None:
+        today = timezone.now().date()
+
+    manual = normalized_progress_expression("progress")
+    task_based = task_average_expression(today)
+    time_based = time_progress_expression("start_date", "end_date", today)
+
+    # Greatest() NULL'ları farklı ele alan veritabanları için -1 / 0 nöbetçileri
+    dynamic = NullIf(Greatest(Coalesce(task_based, -1), Coalesce(time_based, -1)), -1)
+    effective = effective_progress_expression(manual, dynamic)
+    return {
+        "manual_progress": manual,
+        "dynamic_progress": dynamic,
+        "effective_progress": effective,
+    }
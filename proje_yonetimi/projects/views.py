@@ -1,48 +1,124 @@
+from datetime import date, timedelta
+
+from django.conf import settings
 from rest_framework import viewsets
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.decorators import action
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models.functions import Coalesce
-from django.db.models import Value
-from datetime import date
-from django.db.models import Q
-from .models import Project
-from .serializers import ProjectSerializer
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from proje_yonetimi.exports import DEFAULT_CHUNK_SIZE, EXPORT_RENDERERS, streaming_export_response
+from proje_yonetimi.fastlist import FastListMixin
+from proje_yonetimi.sparse import SparseFieldsMixin
+from .models import Project, ProjectProgressSnapshot
+from .serializers import PROJECT_LIST_COLUMNS, ProjectSerializer, project_row_encoder
+from .snapshots import SNAPSHOT_FIELDS
 from .permissions import IsOwnerOrReadOnly
-from .utils import project_progress_info
+from .utils import project_progress_from_annotations
+from dashboard.cache import cached_summary
 from tasks.models import Task
-from tasks.utils import task_progress_info
+from tasks.utils import progress_from_annotations
 from users.models import User
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(SparseFieldsMixin, FastListMixin, viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("created_at", "id")
+    export_chunk_size = DEFAULT_CHUNK_SIZE
+    sparse_columns = {"owner": ("owner_id",)}
 
     def get_queryset(self):
-        user = self.request.user
+        # İlerleme SQL'de hesaplanır; görev listesini belleğe almaya gerek yok
+        qs = Project.objects.all()
+        if self.wants_field("dynamic_progress", "effective_progress"):
+            qs = qs.with_progress()
+        return self.filter_for_request(self.project_queryset(qs, select_related=('owner',)))
 
-        base = Project.objects.select_related('owner').prefetch_related('tasks')
+    def get_fast_list_queryset(self):
+        columns = self.sparse_column_paths(PROJECT_LIST_COLUMNS)
+        return self.filter_for_request(Project.objects.with_progress()).values_list(*columns, named=True)
 
-        # Admin ise hepsini görebilsin
-        if user.is_staff:
-            return base.distinct()
+    def encode_rows(self, rows, queryset):
+        encode = project_row_encoder(self.sparse_column_paths(PROJECT_LIST_COLUMNS), self.get_sparse_fields())
+        return [encode(row) for row in rows]
 
-        # Proje sahibi veya projedeki herhangi bir göreve atanmış kullanıcı
-        return (
-            base.filter(
-                Q(owner=user) |
-                Q(tasks__assignee=user)     # Project -> Task (related_name='tasks')
-            )
-            .distinct()
-        )
+    def filter_for_request(self, base):
+        # Admin hepsini, diğerleri sahibi ya da bir görevine atanmış olduğu projeleri görür
+        return base.visible_to(self.request.user)
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
+    @action(detail=False, methods=["get"], url_path="export", renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """Görünür projeleri NDJSON (?format=ndjson, varsayılan) ya da CSV (?format=csv) olarak akıt."""
+        qs = self.filter_for_request(Project.objects.with_progress()).order_by("id")
+        rows = qs.values_list(*PROJECT_EXPORT_COLUMNS).iterator(chunk_size=self.export_chunk_size)
+        return streaming_export_response(
+            rows, PROJECT_EXPORT_COLUMNS, request.accepted_renderer.format, filename="projeler",
+            chunk_size=self.export_chunk_size,
+        )
+
+    @action(detail=True, methods=["get"], url_path="burndown")
+    def burndown(self, request, pk=None):
+        """Günlük görüntüler, ?from=&to= (dahil; varsayılan son 30 gün)."""
+        # get_object() ilerleme kolonlarını hesaplardı; yalnızca görünürlük kontrolü yeterli
+        if not pk.isdigit() or not self.filter_for_request(Project.objects.filter(pk=pk)).exists():
+            raise NotFound("Proje bulunamadı.")
+        pk = int(pk)
+
+        today = timezone.localdate()
+        end = _date_param(request.query_params, "to") or today
+        start = _date_param(request.query_params, "from") or end - timedelta(days=29)
+        if end < start:
+            raise ValidationError({"to": "Bitiş başlangıçtan önce olamaz."})
+        if (end - start).days + 1 > settings.BURNDOWN_MAX_DAYS:
+            raise ValidationError({"to": f"Aralık en fazla {settings.BURNDOWN_MAX_DAYS} gün olabilir."})
+
+        rows = (
+            ProjectProgressSnapshot.objects.filter(project_id=pk, day__range=(start, end))
+            .order_by("day")
+            .values_list("day", *SNAPSHOT_FIELDS)
+        )
+        return Response({
+            "project": pk,
+            "from": start,
+            "to": end,
+            "snapshots": [
+                {"date": day, "progress": effective, "manual_progress": manual, "dynamic_progress": dynamic,
+                 "task_count": task_count, "status_counts": status_counts}
+                for day, manual, dynamic, effective, task_count, status_counts in rows
+            ],
+        })
+
+
+def _date_param(params, name):
+    raw = params.get(name)
+    if raw in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise ValidationError({name: "YYYY-AA-GG biçiminde bir tarih olmalıdır."})
+
+
+# ProjectSerializer ile aynı alanlar
+PROJECT_EXPORT_COLUMNS = (
+    "id", "name", "description", "owner", "status", "progress", "start_date", "end_date",
+    "created_at", "updated_at", "dynamic_progress", "effective_progress",
+)
+
 class DashboardSummaryView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        today = timezone.now().date()
+        data = cached_summary("project-dashboard", request.user, today, lambda: self.build_summary(request, today))
+        return Response(data)
+
+    def build_summary(self, request, today):
         # Kullanıcıya özel özet istersen bunları da owner filtresi ile kısıtlanabilir (diğer eksikleri tamamlayınca denenebilir).
         toplam_proje = Project.objects.filter(owner=request.user).count()
         aktif_gorev = Task.objects.filter(
@@ -57,14 +133,14 @@ class DashboardSummaryView(APIView):
         recent_qs = (
             Project.objects
             .filter(owner=request.user)
-            .annotate(_order=Coalesce("start_date", "created_at"))
+            .annotate(_order=Coalesce("start_date", TruncDate("created_at")))
             .order_by("-_order")
-            .prefetch_related('tasks')[:3]
+            .with_progress(today)[:3]
         )
 
         son_projeler = []
         for project in recent_qs:
-            payload = project_progress_info(project)
+            payload = project_progress_from_annotations(project)
             son_projeler.append({
                 "id": project.id,
                 "name": project.name,
@@ -78,17 +154,17 @@ class DashboardSummaryView(APIView):
             })
 
         # Yaklaşan görevler: due_date dolu ve bugünden büyük/bugün
-        today = date.today()
         upcoming_qs = (
             Task.objects
             .filter(project__owner=request.user, due_date__isnull=False, due_date__gte=today)
             .select_related('project', 'assignee')
+            .with_progress(today)
             .order_by("due_date")[:3]
         )
 
         yaklasan_gorevler = []
         for task in upcoming_qs:
-            payload = task_progress_info(task)
+            payload = progress_from_annotations(task)
             yaklasan_gorevler.append({
                 "id": task.id,
                 "title": task.title,
@@ -106,11 +182,11 @@ class DashboardSummaryView(APIView):
                 "dynamic_progress": payload.dynamic,
             })
 
-        return Response({
+        return {
             "toplam_proje": toplam_proje,
             "aktif_gorev": aktif_gorev,
             "ekip_uyesi": ekip_uyesi,
             "tamamlanan": tamamlanan,
             "son_projeler": son_projeler,
             "yaklasan_gorevler": yaklasan_gorevler,
-        })
\ No newline at end of file
+        }
\ No newline at end of file
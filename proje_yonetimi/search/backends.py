@@ -0,0 +1,142 @@
+"""Sıralı arama sorguları: ``rank(index, terms, limit, scope) -> [(id, skor), ...]``.
+
+Skor büyükse daha iyi eşleşmedir; başlık/ad eşleşmesi açıklamadakinden ağır
+basar. ``scope`` görünürlük kısıtıdır: proje id'leri veren bir alt sorgu
+(``ProjectMembership.objects.for_user``) ya da kısıtsız için ``None``. Kısıt
+sıralama sorgusunun içinde uygulanır; ``LIMIT`` görünmeyen satırlarla dolmaz.
+
+Sözcüklerin hepsi geçmelidir (AND); yazarken arama için yalnızca son sözcük
+önek olarak aranır. Varsayılan olarak tüm eşleşmeler puanlanır.
+``SEARCH_RANK_WINDOW`` > 0 ise sıralama en yeni o kadar eşleşmeyle sınırlanır:
+çok sık geçen bir sözcükte yüz binlerce satırı puanlamak yerine önce id'ye göre
+bir alt sınır bulunur (dizin id sırasında tutulduğu için ucuz), puanlama onun
+üstünde kalır. Bedeli: pencere dışındaki eski görevler, başlıkta tam eşleşse de
+sonuçta yer almaz; bu yüzden açıkça seçilir.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+
+from users.lookup import lookup_key
+
+from .schema import INDEXES, POSTGRES_CONFIG, document_expression
+
+MAX_TERMS = 8
+# Başlık/ad sütunu açıklamadan bu kat ağır (FTS5 bm25 sütun ağırlıkları)
+TITLE_WEIGHT = 10.0
+
+# Her dizinde kısıtın uygulandığı sütun (proje id'si)
+SCOPE_COLUMNS = {"tasks": "project_id", "projects": "id"}
+
+
+def parse_terms(text):
+    """Kullanıcı metni -> dizinle aynı katlanmış sözcükler; FTS sözdizimi (tırnak, OR, NEAR...) yok sayılır.
+
+    ``str.lower`` yetmez: "İstanbul" -> "i̇stanbul" (i + birleşen nokta) iki sözcüğe
+    bölünür, ı ise i'ye dönmez. ``lookup_key``: küçük harf, aksansız, ı -> i.
+    """
+    return re.findall(r"\w+", lookup_key(text))[:MAX_TERMS]
+
+
+def _scope_sql(scope, column):
+    if scope is None:
+        return "", []
+    sql, params = scope.query.sql_with_params()
+    return f" AND {column} IN ({sql})", list(params)
+
+
+def _window_sql(column, cutoff, cutoff_params):
+    """``SEARCH_RANK_WINDOW`` açıksa puanlamayı en yeni eşleşmelerle sınırlayan koşul."""
+    window = settings.SEARCH_RANK_WINDOW
+    if window <= 0:
+        return "", []
+    return f" AND {column} >= coalesce(({cutoff}), 0)", [*cutoff_params, window - 1]
+
+
+class SQLiteBackend:
+    """FTS5 ``MATCH`` ve ``bm25``; sözcükler tırnaklı, FTS sözdizimi olarak yorumlanmaz."""
+
+    def match_expression(self, terms):
+        return " ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+
+    def rank(self, key, terms, limit, scope=None):
+        index = INDEXES[key]
+        fts, table = index.fts_table, index.table
+        scope_sql, scope_params = _scope_sql(scope, f"{table}.{SCOPE_COLUMNS[key]}")
+        weights = ", ".join([str(TITLE_WEIGHT)] + ["1.0"] * (len(index.columns) - 1))
+        matches = f"FROM {fts} JOIN {table} ON {table}.id = {fts}.rowid WHERE {fts} MATCH %s{scope_sql}"
+        match = self.match_expression(terms)
+        window_sql, window_params = _window_sql(
+            f"{fts}.rowid", f"SELECT {fts}.rowid {matches} ORDER BY {fts}.rowid DESC LIMIT 1 OFFSET %s",
+            [match, *scope_params],
+        )
+        sql = (
+            f"SELECT {fts}.rowid, -bm25({fts}, {weights}) AS score {matches}{window_sql}"
+            f" ORDER BY score DESC, {fts}.rowid LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [match, *scope_params, *window_params, limit])
+            return cursor.fetchall()
+
+
+class PostgreSQLBackend:
+    """GIN indeksli ``tsvector`` üzerinde ``to_tsquery`` ve ``ts_rank``."""
+
+    def match_expression(self, terms):
+        # Sözcükler yalnızca \w karakterleri içerir; tsquery işleçleri gelemez
+        return " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+
+    def rank(self, key, terms, limit, scope=None):
+        index = INDEXES[key]
+        table = index.table
+        document = document_expression(index, alias=table)
+        scope_sql, scope_params = _scope_sql(scope, f"{table}.{SCOPE_COLUMNS[key]}")
+        query = f"to_tsquery('{POSTGRES_CONFIG}', %s)"
+        match = self.match_expression(terms)
+        window_sql, window_params = _window_sql(
+            f"{table}.id",
+            f"SELECT {table}.id FROM {table} WHERE {document} @@ {query}{scope_sql}"
+            f" ORDER BY {table}.id DESC LIMIT 1 OFFSET %s",
+            [match, *scope_params],
+        )
+        sql = (
+            f"SELECT {table}.id, ts_rank({document}, query) AS score FROM {table}, {query} query"
+            f" WHERE {document} @@ query{scope_sql}{window_sql}"
+            f" ORDER BY score DESC, {table}.id LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [match, *scope_params, *window_params, limit])
+            return [(pk, float(score)) for pk, score in cursor.fetchall()]
+
+
+class FallbackBackend:
+    """Dizin desteği olmayan veritabanları: ``icontains`` taraması, sıralama yok (en yeni önce).
+
+    Sözcükler katlanmış (aksansız) gelir; aksanlı metinle eşleşme veritabanının
+    aksan duyarsız harmanlamasına (collation) kalır.
+    """
+
+    def rank(self, key, terms, limit, scope=None):
+        from django.db.models import Q
+
+        from projects.models import Project
+        from tasks.models import Task
+
+        model = Task if key == "tasks" else Project
+        queryset = model.objects.all()
+        for term in terms:
+            condition = Q()
+            for column in INDEXES[key].columns:
+                condition |= Q(**{f"{column}__icontains": term})
+            queryset = queryset.filter(condition)
+        if scope is not None:
+            queryset = queryset.filter(**{f"{SCOPE_COLUMNS[key]}__in": scope})
+        return [(pk, 0.0) for pk in queryset.order_by("-pk").values_list("pk", flat=True)[:limit]]
+
+
+BACKENDS = {"sqlite": SQLiteBackend, "postgresql": PostgreSQLBackend}
+
+
+def get_backend():
+    return BACKENDS.get(connection.vendor, FallbackBackend)()
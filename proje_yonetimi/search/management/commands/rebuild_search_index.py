@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from search.schema import ensure, rebuild
+
+
+class Command(BaseCommand):
+    help = "Tam metin arama dizinlerini görev ve proje tablolarından yeniden oluşturur."
+
+    def handle(self, *args, **options):
+        repaired = ensure(connection)
+        for key in repaired:
+            self.stdout.write(f"{key}: eksik tetikleyiciler yeniden kuruldu.")
+        rebuild(connection)
+        self.stdout.write(self.style.SUCCESS("Arama dizinleri yeniden oluşturuldu."))
@@ -0,0 +1,79 @@
+from django.db import migrations
+
+# search.schema'nın bu göç yazıldığı andaki nesneleri, düz SQL olarak: şema kodu
+# sonradan değişse de göç aynı dizinleri kurar (değişiklik yeni bir göçle gelir)
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE search_task_fts USING fts5(title, description,"
+    " content='tasks_task', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER search_task_fts_ai AFTER INSERT ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER search_task_fts_ad AFTER DELETE ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(search_task_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER search_task_fts_au AFTER UPDATE OF title, description ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(search_task_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description);"
+    " INSERT INTO search_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO search_task_fts(search_task_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE search_project_fts USING fts5(name, description,"
+    " content='projects_project', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER search_project_fts_ai AFTER INSERT ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER search_project_fts_ad AFTER DELETE ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(search_project_fts, rowid, name, description)"
+    " VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER search_project_fts_au AFTER UPDATE OF name, description ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(search_project_fts, rowid, name, description)"
+    " VALUES ('delete', old.id, old.name, old.description);"
+    " INSERT INTO search_project_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "INSERT INTO search_project_fts(search_project_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS search_task_fts_ai",
+    "DROP TRIGGER IF EXISTS search_task_fts_ad",
+    "DROP TRIGGER IF EXISTS search_task_fts_au",
+    "DROP TABLE IF EXISTS search_task_fts",
+    "DROP TRIGGER IF EXISTS search_project_fts_ai",
+    "DROP TRIGGER IF EXISTS search_project_fts_ad",
+    "DROP TRIGGER IF EXISTS search_project_fts_au",
+    "DROP TABLE IF EXISTS search_project_fts",
+]
+
+POSTGRES_CREATE = [
+    "CREATE INDEX search_task_fts ON tasks_task USING GIN (("
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')))",
+    "CREATE INDEX search_project_fts ON projects_project USING GIN (("
+    "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')))",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS search_task_fts",
+    "DROP INDEX IF EXISTS search_project_fts",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0008_project_progress_snapshot'),
+        ('tasks', '0005_task_calendar_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"sqlite": SQLITE_CREATE, "postgresql": POSTGRES_CREATE}),
+            _run({"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP}),
+        ),
+    ]
@@ -0,0 +1,118 @@
+from django.db import migrations
+
+# Dizine giren metinde ı -> i (FTS5 tokenizer'ı ayrışımı olmayan ı'yı katlamaz;
+# PostgreSQL'de unaccent varsayılmadan translate). Nesneler düz SQL olarak donduruldu:
+# search.schema sonradan değişse de bu göç aynı tetikleyicileri/indeksleri kurar.
+# Geri alma 0001'in katlamasız nesnelerini kurar.
+SQLITE_DROP_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS search_task_fts_ai",
+    "DROP TRIGGER IF EXISTS search_task_fts_ad",
+    "DROP TRIGGER IF EXISTS search_task_fts_au",
+    "DROP TRIGGER IF EXISTS search_project_fts_ai",
+    "DROP TRIGGER IF EXISTS search_project_fts_ad",
+    "DROP TRIGGER IF EXISTS search_project_fts_au",
+]
+
+SQLITE_FOLDED = SQLITE_DROP_TRIGGERS + [
+    "CREATE TRIGGER search_task_fts_ai AFTER INSERT ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(rowid, title, description)"
+    " VALUES (new.id, replace(new.title, 'ı', 'i'), replace(new.description, 'ı', 'i')); END",
+    "CREATE TRIGGER search_task_fts_ad AFTER DELETE ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(search_task_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, replace(old.title, 'ı', 'i'), replace(old.description, 'ı', 'i')); END",
+    "CREATE TRIGGER search_task_fts_au AFTER UPDATE OF title, description ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(search_task_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, replace(old.title, 'ı', 'i'), replace(old.description, 'ı', 'i'));"
+    " INSERT INTO search_task_fts(rowid, title, description)"
+    " VALUES (new.id, replace(new.title, 'ı', 'i'), replace(new.description, 'ı', 'i')); END",
+    # 'rebuild' asıl tabloyu katlamadan okur; dizin aynı ifadeyle yeniden doldurulur
+    "INSERT INTO search_task_fts(search_task_fts) VALUES ('delete-all')",
+    "INSERT INTO search_task_fts(rowid, title, description)"
+    " SELECT id, replace(title, 'ı', 'i'), replace(description, 'ı', 'i') FROM tasks_task",
+    "CREATE TRIGGER search_project_fts_ai AFTER INSERT ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(rowid, name, description)"
+    " VALUES (new.id, replace(new.name, 'ı', 'i'), replace(new.description, 'ı', 'i')); END",
+    "CREATE TRIGGER search_project_fts_ad AFTER DELETE ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(search_project_fts, rowid, name, description)"
+    " VALUES ('delete', old.id, replace(old.name, 'ı', 'i'), replace(old.description, 'ı', 'i')); END",
+    "CREATE TRIGGER search_project_fts_au AFTER UPDATE OF name, description ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(search_project_fts, rowid, name, description)"
+    " VALUES ('delete', old.id, replace(old.name, 'ı', 'i'), replace(old.description, 'ı', 'i'));"
+    " INSERT INTO search_project_fts(rowid, name, description)"
+    " VALUES (new.id, replace(new.name, 'ı', 'i'), replace(new.description, 'ı', 'i')); END",
+    "INSERT INTO search_project_fts(search_project_fts) VALUES ('delete-all')",
+    "INSERT INTO search_project_fts(rowid, name, description)"
+    " SELECT id, replace(name, 'ı', 'i'), replace(description, 'ı', 'i') FROM projects_project",
+]
+
+SQLITE_PLAIN = SQLITE_DROP_TRIGGERS + [
+    "CREATE TRIGGER search_task_fts_ai AFTER INSERT ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER search_task_fts_ad AFTER DELETE ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(search_task_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER search_task_fts_au AFTER UPDATE OF title, description ON tasks_task BEGIN"
+    " INSERT INTO search_task_fts(search_task_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description);"
+    " INSERT INTO search_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO search_task_fts(search_task_fts) VALUES ('rebuild')",
+    "CREATE TRIGGER search_project_fts_ai AFTER INSERT ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER search_project_fts_ad AFTER DELETE ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(search_project_fts, rowid, name, description)"
+    " VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER search_project_fts_au AFTER UPDATE OF name, description ON projects_project BEGIN"
+    " INSERT INTO search_project_fts(search_project_fts, rowid, name, description)"
+    " VALUES ('delete', old.id, old.name, old.description);"
+    " INSERT INTO search_project_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "INSERT INTO search_project_fts(search_project_fts) VALUES ('rebuild')",
+]
+
+# translate(metin, ACCENTED, PLAIN): karakter karakter eşlenir
+ACCENTED = "çğıöşüâêîôûàáäèéëìíïòóùúñÇĞİÖŞÜÂÊÎÔÛÀÁÄÈÉËÌÍÏÒÓÙÚÑ"
+PLAIN = "cgiosuaeiouaaaeeeiiioouunCGIOSUAEIOUAAAEEEIIIOOUUN"
+
+POSTGRES_FOLDED = [
+    "DROP INDEX IF EXISTS search_task_fts",
+    "CREATE INDEX search_task_fts ON tasks_task USING GIN (("
+    f"setweight(to_tsvector('simple'::regconfig, translate(coalesce(title, ''), '{ACCENTED}', '{PLAIN}')), 'A')"
+    f" || setweight(to_tsvector('simple'::regconfig, translate(coalesce(description, ''), '{ACCENTED}', '{PLAIN}')),"
+    " 'B')))",
+    "DROP INDEX IF EXISTS search_project_fts",
+    "CREATE INDEX search_project_fts ON projects_project USING GIN (("
+    f"setweight(to_tsvector('simple'::regconfig, translate(coalesce(name, ''), '{ACCENTED}', '{PLAIN}')), 'A')"
+    f" || setweight(to_tsvector('simple'::regconfig, translate(coalesce(description, ''), '{ACCENTED}', '{PLAIN}')),"
+    " 'B')))",
+]
+
+POSTGRES_PLAIN = [
+    "DROP INDEX IF EXISTS search_task_fts",
+    "CREATE INDEX search_task_fts ON tasks_task USING GIN (("
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')))",
+    "DROP INDEX IF EXISTS search_project_fts",
+    "CREATE INDEX search_project_fts ON projects_project USING GIN (("
+    "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')))",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"sqlite": SQLITE_FOLDED, "postgresql": POSTGRES_FOLDED}),
+            _run({"sqlite": SQLITE_PLAIN, "postgresql": POSTGRES_PLAIN}),
+        ),
+    ]
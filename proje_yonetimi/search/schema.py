@@ -0,0 +1,155 @@
+"""Tam metin arama dizinlerinin veritabanı nesneleri.
+
+SQLite: asıl tabloya bağlı (``content=``) bir FTS5 sanal tablosu; metin yalnızca
+asıl tabloda durur, dizin tetikleyicilerle güncellenir. Tetikleyiciler sinyallerin
+göremediği ``bulk_create``, ``QuerySet.update()`` ve ham SQL yazımlarını da kapsar.
+``remove_diacritics 2``: "gorev" araması "görev"i bulur.
+
+Metin ve sorgu aynı katlanır: küçük harf, aksansız, ı -> i (sorgu tarafı
+``users.lookup.lookup_key``). Tokenizer ilk ikisini yapar; ayrışımı olmayan
+dotless ı'yı yapmaz ("Işık" -> "isık"), o yüzden dizine giren metinde ı elle
+değiştirilir (``sqlite_fold``). Tetikleyiciler ve yeniden doldurma aynı ifadeyi
+kullanır; FTS5'in kendi 'rebuild' komutu asıl tabloyu katlamadan okuduğu için
+kullanılmaz.
+
+PostgreSQL: ağırlıklı ``tsvector`` ifadesi üzerinde GIN indeksi. İfade indeksi
+satırla birlikte güncellendiği için tetikleyici gerekmez; sorgu aynı ifadeyi
+kullanmalıdır (``document_expression``). ``unaccent`` eklentisi varsayılmaz;
+Türkçe ve yaygın Latin aksanlı harfler ``translate`` ile katlanır.
+
+Django SQLite'ta bazı şema değişikliklerinde tabloyu yeniden kurar (yeni tablo,
+kopyala, eskisini sil); eski tablonun tetikleyicileri de silinir. ``ensure`` her
+``migrate`` sonunda eksik tetikleyicileri kurar ve dizini yeniden oluşturur.
+"""
+from collections import namedtuple
+
+SearchIndex = namedtuple("SearchIndex", "fts_table table columns")
+
+# Sütun sırası ağırlık sırasıdır (ilk sütun başlık/ad)
+INDEXES = {
+    "tasks": SearchIndex("search_task_fts", "tasks_task", ("title", "description")),
+    "projects": SearchIndex("search_project_fts", "projects_project", ("name", "description")),
+}
+
+SQLITE_TOKENIZER = "unicode61 remove_diacritics 2"
+# 2 ve 3 harflik önekler için ayrı dizin: "gö*", "gör*" taramasız
+SQLITE_PREFIX = "2 3"
+POSTGRES_CONFIG = "simple"
+POSTGRES_WEIGHTS = "AB"
+# translate(metin, ACCENTED, PLAIN): karakter karakter eşlenir (uzunluklar eşit)
+POSTGRES_ACCENTED = "çğıöşüâêîôûàáäèéëìíïòóùúñÇĞİÖŞÜÂÊÎÔÛÀÁÄÈÉËÌÍÏÒÓÙÚÑ"
+POSTGRES_PLAIN = "cgiosuaeiouaaaeeeiiioouunCGIOSUAEIOUAAAEEEIIIOOUUN"
+
+
+def sqlite_fold(value):
+    """SQLite: dizine giren sütun ifadesi (tokenizer'ın katlamadığı ı -> i)."""
+    return f"replace({value}, 'ı', 'i')"
+
+
+def document_expression(index, alias=None):
+    """PostgreSQL: indekslenen ve sorgulanan ``tsvector`` ifadesi (ikisi birebir aynı olmalı)."""
+    prefix = f"{alias}." if alias else ""
+    return " || ".join(
+        f"setweight(to_tsvector('{POSTGRES_CONFIG}'::regconfig,"
+        f" translate(coalesce({prefix}{column}, ''), '{POSTGRES_ACCENTED}', '{POSTGRES_PLAIN}')), '{weight}')"
+        for column, weight in zip(index.columns, POSTGRES_WEIGHTS)
+    )
+
+
+def _sqlite_triggers(index):
+    fts, table = index.fts_table, index.table
+    columns = ", ".join(index.columns)
+    new = ", ".join(sqlite_fold(f"new.{column}") for column in index.columns)
+    old = ", ".join(sqlite_fold(f"old.{column}") for column in index.columns)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new});"
+    return {
+        f"{fts}_ai": f"AFTER INSERT ON {table} BEGIN {insert} END",
+        f"{fts}_ad": f"AFTER DELETE ON {table} BEGIN {delete} END",
+        f"{fts}_au": f"AFTER UPDATE OF {columns} ON {table} BEGIN {delete} {insert} END",
+    }
+
+
+def _sqlite_reindex(cursor, index):
+    """Dizini asıl tablodan, tetikleyicilerle aynı katlamayla yeniden doldur."""
+    fts = index.fts_table
+    columns = ", ".join(index.columns)
+    folded = ", ".join(sqlite_fold(column) for column in index.columns)
+    cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('delete-all')")
+    cursor.execute(f"INSERT INTO {fts}(rowid, {columns}) SELECT id, {folded} FROM {index.table}")
+
+
+def _sqlite_objects(cursor, kind):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = %s", [kind])
+    return {row[0] for row in cursor.fetchall()}
+
+
+def install(connection):
+    """Dizinleri ve tetikleyicileri kur, mevcut satırları dizine al."""
+    with connection.cursor() as cursor:
+        for index in INDEXES.values():
+            if connection.vendor == "sqlite":
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE {index.fts_table} USING fts5({', '.join(index.columns)},"
+                    f" content='{index.table}', content_rowid='id',"
+                    f" tokenize='{SQLITE_TOKENIZER}', prefix='{SQLITE_PREFIX}')"
+                )
+                for name, body in _sqlite_triggers(index).items():
+                    cursor.execute(f"CREATE TRIGGER {name} {body}")
+                _sqlite_reindex(cursor, index)
+            elif connection.vendor == "postgresql":
+                cursor.execute(
+                    f"CREATE INDEX {index.fts_table} ON {index.table} USING GIN (({document_expression(index)}))"
+                )
+
+
+def uninstall(connection):
+    with connection.cursor() as cursor:
+        for index in INDEXES.values():
+            if connection.vendor == "sqlite":
+                for name in _sqlite_triggers(index):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+                cursor.execute(f"DROP TABLE IF EXISTS {index.fts_table}")
+            elif connection.vendor == "postgresql":
+                cursor.execute(f"DROP INDEX IF EXISTS {index.fts_table}")
+
+
+def ensure(connection):
+    """SQLite: kayıp tetikleyicileri yeniden kur; onarılan dizinlerin adlarını döndür.
+
+    Dizin tablosu yoksa (göç henüz uygulanmamış ya da geri alınmış) dokunmaz.
+    """
+    if connection.vendor != "sqlite":
+        return []
+    repaired = []
+    with connection.cursor() as cursor:
+        tables, triggers = _sqlite_objects(cursor, "table"), _sqlite_objects(cursor, "trigger")
+        for key, index in INDEXES.items():
+            if index.fts_table not in tables:
+                continue
+            missing = {name: body for name, body in _sqlite_triggers(index).items() if name not in triggers}
+            if not missing:
+                continue
+            for name, body in missing.items():
+                cursor.execute(f"CREATE TRIGGER {name} {body}")
+            # Tetikleyicisiz geçen sürede yazılanlar dizinde yok
+            _sqlite_reindex(cursor, index)
+            repaired.append(key)
+    return repaired
+
+
+def rebuild(connection):
+    """Dizinleri asıl tablolardan yeniden oluştur (SQLite); PostgreSQL'de REINDEX."""
+    with connection.cursor() as cursor:
+        for index in INDEXES.values():
+            if connection.vendor == "sqlite":
+                _sqlite_reindex(cursor, index)
+                cursor.execute(f"INSERT INTO {index.fts_table}({index.fts_table}) VALUES ('optimize')")
+            elif connection.vendor == "postgresql":
+                cursor.execute(f"REINDEX INDEX {index.fts_table}")
+
+
+def ensure_after_migrate(sender, using="default", **kwargs):
+    from django.db import connections
+
+    ensure(connections[using])
@@ -0,0 +1,176 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from projects.models import Project
+from tasks.models import Task
+from users.models import User
+
+from .backends import FallbackBackend, get_backend, parse_terms
+from .schema import INDEXES, ensure
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.stranger = User.objects.create_user(email="stranger@example.com")
+        cls.staff = User.objects.create_user(email="staff@example.com", is_staff=True)
+        cls.project = Project.objects.create(name="Web sitesi", description="Kurumsal tasarım", owner=cls.owner)
+        cls.hidden = Project.objects.create(name="Gizli tasarım", owner=cls.stranger)
+        cls.title_match = Task.objects.create(project=cls.project, title="Tasarım görevi", description="")
+        cls.description_match = Task.objects.create(
+            project=cls.project, title="Toplantı", description="Yeni tasarım gözden geçirilecek",
+        )
+        cls.hidden_task = Task.objects.create(project=cls.hidden, title="Tasarım taslağı")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def search(self, q, **params):
+        response = self.client.get(reverse("search:search"), {"q": q, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def ids(self, data, key="tasks"):
+        return [row["id"] for row in data[key]]
+
+    def test_ranked_results_respect_visibility(self):
+        data = self.search("tasarım")
+        # Başlık eşleşmesi açıklamadakinden önce; başka kullanıcının projesi yok
+        self.assertEqual(self.ids(data), [self.title_match.pk, self.description_match.pk])
+        self.assertEqual(self.ids(data, "projects"), [self.project.pk])
+        first = data["tasks"][0]
+        self.assertEqual(first["project_name"], "Web sitesi")
+        self.assertEqual(set(first), {"id", "title", "project", "project_name", "status", "due_date", "score"})
+        self.assertGreater(first["score"], data["tasks"][1]["score"])
+
+    def test_staff_sees_everything(self):
+        self.client.force_authenticate(self.staff)
+        data = self.search("tasarım")
+        self.assertIn(self.hidden_task.pk, self.ids(data))
+        self.assertEqual(set(self.ids(data, "projects")), {self.project.pk, self.hidden.pk})
+
+    def test_prefix_diacritics_and_all_terms(self):
+        self.assertEqual(self.ids(self.search("tasarım gör")), [self.title_match.pk])
+        # Yalnızca son sözcük önektir
+        self.assertEqual(self.ids(self.search("tasa görevi")), [])
+        self.assertEqual(self.ids(self.search("Tasarım GOREVI")), [self.title_match.pk])
+        self.assertEqual(self.ids(self.search("tasarım bulunmayan")), [])
+
+    def test_query_syntax_is_not_interpreted(self):
+        data = self.search('"tasarım" OR NEAR(toplantı')
+        self.assertEqual(self.ids(data), [])
+        self.assertEqual(self.ids(self.search('tasarım" görevi*')), [self.title_match.pk])
+
+    def test_index_follows_writes(self):
+        task = Task.objects.create(project=self.project, title="Bütçe planı")
+        self.assertEqual(self.ids(self.search("bütçe")), [task.pk])
+
+        task.title = "Maliyet planı"
+        task.save()
+        self.assertEqual(self.ids(self.search("bütçe")), [])
+        self.assertEqual(self.ids(self.search("maliyet")), [task.pk])
+
+        # Sinyal çalıştırmayan toplu yazımlar da dizine yansır
+        Task.objects.filter(pk=task.pk).update(description="Çeyrek sonu raporu")
+        self.assertEqual(self.ids(self.search("çeyrek")), [task.pk])
+        bulk = Task.objects.bulk_create([Task(project=self.project, title="Toplu kayıt")])
+        self.assertEqual(len(self.ids(self.search("toplu"))), len(bulk))
+
+        task.delete()
+        self.assertEqual(self.ids(self.search("maliyet")), [])
+        self.project.delete()
+        self.assertEqual(self.search("tasarım"), {"query": "tasarım", "tasks": [], "projects": []})
+
+    def test_older_title_match_outranks_newer_description_matches(self):
+        newer = Task.objects.bulk_create([
+            Task(project=self.project, title=f"Toplantı notu {i}", description="tasarım") for i in range(5)
+        ])
+        ids = self.ids(self.search("tasarım"))
+        self.assertEqual(ids[0], self.title_match.pk)
+        self.assertEqual(set(ids), {self.title_match.pk, self.description_match.pk, *(t.pk for t in newer)})
+
+    def test_opt_in_rank_window_keeps_newest_matches(self):
+        newer = Task.objects.create(project=self.project, title="Toplantı notu", description="tasarım")
+        with override_settings(SEARCH_RANK_WINDOW=2):
+            ids = self.ids(self.search("tasarım"))
+        # Başlıkta geçen (en yüksek skorlu) ama daha eski görev pencerenin dışında
+        self.assertEqual(set(ids), {self.description_match.pk, newer.pk})
+
+    def test_type_and_limit(self):
+        data = self.search("tasarım", type="projects")
+        self.assertEqual(set(data), {"query", "projects"})
+        self.assertEqual(self.ids(self.search("tasarım", limit=1)), [self.title_match.pk])
+
+    def test_invalid_parameters(self):
+        url = reverse("search:search")
+        for params in ({}, {"q": "  ?! "}, {"q": "a", "limit": "x"}, {"q": "a", "limit": "0"}, {"q": "a", "type": "users"}):
+            self.assertEqual(self.client.get(url, params).status_code, 400, params)
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(url, {"q": "tasarım"}).status_code, 401)
+
+    def test_ranking_query_count(self):
+        # Tür başına bir sıralama ve bir satır sorgusu
+        with self.assertNumQueries(4):
+            self.search("tasarım")
+
+    def test_parse_terms(self):
+        self.assertEqual(parse_terms('  "Tasarım"  görevi* -x '), ["tasarim", "gorevi", "x"])
+        self.assertEqual(parse_terms("İstanbul IŞIK ışık"), ["istanbul", "isik", "isik"])
+        self.assertEqual(len(parse_terms(" ".join(["a"] * 20))), 8)
+
+    def test_turkish_dotted_and_dotless_i(self):
+        istanbul = Project.objects.create(name="İstanbul ofisi", owner=self.owner)
+        lighting = Task.objects.create(project=self.project, title="Işık düzeni")
+        work = Task.objects.create(project=self.project, title="İş planı")
+        self.assertEqual(self.ids(self.search("İstanbul"), "projects"), [istanbul.pk])
+        self.assertEqual(self.ids(self.search("istanbul"), "projects"), [istanbul.pk])
+        for q in ("ışık", "Işık", "IŞIK", "isik", "ışı"):
+            self.assertEqual(self.ids(self.search(q)), [lighting.pk], q)
+        # "iş" ile "ışık" Türkçede ayrı sözcükler; katlamadan sonra önek olarak yine de eşleşir
+        self.assertEqual(set(self.ids(self.search("iş plan"))), {work.pk})
+        self.assertEqual(self.ids(self.search("İŞ")), self.ids(self.search("iş")))
+
+    def test_fallback_backend_matches_index(self):
+        # Katlanmayan (ASCII) sözcük: SQLite icontains aksan duyarlıdır
+        terms = parse_terms("yeni")
+        expected = {pk for pk, _ in get_backend().rank("tasks", terms, 10)}
+        self.assertEqual({pk for pk, _ in FallbackBackend().rank("tasks", terms, 10)}, expected)
+
+
+class SQLiteSearchIndexTests(TestCase):
+    def setUp(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite FTS5 dizini")
+        self.project = Project.objects.create(name="Arşiv", owner=User.objects.create_user(email="a@example.com"))
+
+    def test_migrated_triggers_match_schema(self):
+        # Göçlerdeki donmuş SQL ile ensure()'un kurduğu tetikleyiciler aynı olmalı
+        from .schema import _sqlite_triggers
+
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite tetikleyicileri")
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'search_%'")
+            installed = dict(cursor.fetchall())
+        expected = {
+            name: f"CREATE TRIGGER {name} {body}"
+            for index in INDEXES.values() for name, body in _sqlite_triggers(index).items()
+        }
+        self.assertEqual(installed, expected)
+
+    def test_ensure_restores_dropped_triggers(self):
+        index = INDEXES["tasks"]
+        with connection.cursor() as cursor:
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER {index.fts_table}_{suffix}")
+        task = Task.objects.create(project=self.project, title="Kayıp kayıt")
+        terms = parse_terms("kayıp")
+        self.assertEqual(get_backend().rank("tasks", terms, 10), [])
+
+        self.assertEqual(ensure(connection), ["tasks"])
+        self.assertEqual([pk for pk, _ in get_backend().rank("tasks", terms, 10)], [task.pk])
+        self.assertEqual(ensure(connection), [])
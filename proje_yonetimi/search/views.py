@@ -0,0 +1,71 @@
+"""``/api/search/?q=``: görev ve projelerde sıralı tam metin araması.
+
+Sözcüklerin hepsi geçmelidir, son sözcük önek olarak aranır ("tasarım gör" ->
+"Tasarım görevi"). ``?type=tasks|projects`` tek türle sınırlar, ``?limit=`` tür başına
+sonuç sayısıdır. Sonuçlar görünürlük kurallarına uyar: sıralama sorgusu üyelik
+alt sorgusuyla kısıtlanır, satırlar ayrıca ``visible_to`` ile okunur.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from projects.models import Project, ProjectMembership
+from tasks.models import Task
+
+from .backends import get_backend, parse_terms
+
+RESULT_COLUMNS = {
+    "tasks": ("id", "title", "project", "project__name", "status", "due_date"),
+    "projects": ("id", "name", "status", "progress"),
+}
+RENAMED = {"project__name": "project_name"}
+
+
+class SearchView(APIView):
+    permission_classes = [IsAuthenticated]
+    default_limit = 20
+    max_limit = 50
+
+    def get_limit(self, request):
+        raw = request.query_params.get("limit")
+        if not raw:
+            return self.default_limit
+        try:
+            limit = int(raw)
+        except ValueError:
+            raise ValidationError({"limit": "Tamsayı olmalı."})
+        if limit < 1:
+            raise ValidationError({"limit": "En az 1 olmalı."})
+        return min(limit, self.max_limit)
+
+    def get_types(self, request):
+        raw = request.query_params.get("type")
+        if not raw:
+            return tuple(RESULT_COLUMNS)
+        if raw not in RESULT_COLUMNS:
+            raise ValidationError({"type": f"Geçersiz tür: {raw} (tasks, projects)"})
+        return (raw,)
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        terms = parse_terms(query)
+        if not terms:
+            raise ValidationError({"q": "Arama metni gerekli."})
+        limit, types = self.get_limit(request), self.get_types(request)
+
+        user = request.user
+        scope = None if user.is_staff else ProjectMembership.objects.for_user(user)
+        querysets = {"tasks": Task.objects.visible_to(user), "projects": Project.objects.visible_to(user)}
+        backend = get_backend()
+
+        data = {"query": query}
+        for key in types:
+            ranked = backend.rank(key, terms, limit, scope)
+            rows = querysets[key].filter(pk__in=[pk for pk, _ in ranked]).values(*RESULT_COLUMNS[key])
+            by_id = {row["id"]: row for row in rows}
+            data[key] = [
+                {**{RENAMED.get(name, name): value for name, value in by_id[pk].items()}, "score": score}
+                for pk, score in ranked if pk in by_id
+            ]
+        return Response(data)
@@ -0,0 +1,309 @@
+"""Toplu görev oluşturma / güncelleme / durum geçişi.
+
+Her satır aynı serileştirici örneğiyle doğrulanır (alanlar bir kez kurulur),
+ilişkili id'lerin varlığı tüm liste için birkaç sorguyla kontrol edilir ve
+yazma tek işlemde yapılır. Model sinyalleri çalışmadığından sonunda
+``tasks_bulk_changed`` gönderilir.
+
+Güncelleme ``bulk_update`` kullanmaz: satır başına CASE/WHEN ifadesi kurmak
+1000 satırda yazımın kendisinden pahalıdır. Aynı yeni değerleri alan satırlar
+(durum geçişleri, ortak alan kümeleri) tek ``UPDATE … WHERE id IN (…)`` ile,
+değerleri satırdan satıra değişenler ``UPDATE … FROM (VALUES …)`` ile yazılır;
+hangisi daha az sorgu tutuyorsa o seçilir.
+
+``atomic=True`` iken tek bir hatalı satır hiçbir şey yazılmamasına yol açar;
+``atomic=False`` iken geçerli satırlar yazılır, hatalılar ``errors`` içinde döner.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from projects.models import Project
+from users.models import User
+
+from .graph import CycleError, check_dependency_changes
+from .models import Task
+from .serializers import TaskBulkItemSerializer, TaskStatusItemSerializer
+from .signals import tasks_bulk_changed
+
+# Serileştirici alan adı -> model alanı
+_FK_FIELDS = {"project": "project_id", "assignee": "assignee_id"}
+
+
+@dataclass
+class BulkResult:
+    tasks: List[Optional[Task]]                      # giriş sırasıyla; hatalı satırlar None
+    errors: Dict[int, dict] = field(default_factory=dict)
+    written: bool = False
+
+    @property
+    def saved(self) -> List[Task]:
+        return [task for task in self.tasks if task is not None]
+
+
+def _does_not_exist(pk):
+    return serializers.PrimaryKeyRelatedField.default_error_messages["does_not_exist"].format(pk_value=pk)
+
+
+def _check_items(items):
+    if not isinstance(items, list):
+        raise serializers.ValidationError({api_settings.NON_FIELD_ERRORS_KEY: ["Satır listesi bekleniyor."]})
+    if not items:
+        raise serializers.ValidationError({api_settings.NON_FIELD_ERRORS_KEY: ["Liste boş olamaz."]})
+    limit = settings.API_BULK_MAX_ITEMS
+    if len(items) > limit:
+        raise serializers.ValidationError(
+            {api_settings.NON_FIELD_ERRORS_KEY: [f"Tek istekte en fazla {limit} satır gönderilebilir."]}
+        )
+
+
+class _BulkValidator:
+    def __init__(self, serializer_class, *, partial):
+        # Alanlar ilk erişimde bir kez kurulur; satırlar aynı örnekle doğrulanır
+        self.child = serializer_class(partial=partial)
+        self.errors: Dict[int, dict] = {}
+        self.valid: Dict[int, dict] = {}
+
+    def run(self, index, data, instance=None):
+        if not isinstance(data, dict):
+            self.errors[index] = {api_settings.NON_FIELD_ERRORS_KEY: ["Satır bir nesne olmalıdır."]}
+            return
+        self.child.instance = instance
+        self.child.initial_data = data
+        try:
+            self.valid[index] = self.child.run_validation(data)
+        except serializers.ValidationError as exc:
+            self.errors[index] = exc.detail
+
+    def fail(self, index, name, message):
+        self.valid.pop(index, None)
+        self.errors.setdefault(index, {}).setdefault(name, []).append(message)
+
+    def check_references(self):
+        """project / assignee / dependencies id'lerini tüm liste için toplu doğrula (en çok 3 sorgu)."""
+        wanted = {"project": set(), "assignee": set(), "dependencies": set()}
+        for attrs in self.valid.values():
+            for name in wanted:
+                value = attrs.get(name)
+                if name == "dependencies":
+                    wanted[name].update(value or ())
+                elif value is not None:
+                    wanted[name].add(value)
+
+        existing = {
+            "project": set(Project.objects.filter(pk__in=wanted["project"]).values_list("pk", flat=True))
+            if wanted["project"] else set(),
+            "assignee": set(User.objects.filter(pk__in=wanted["assignee"]).values_list("pk", flat=True))
+            if wanted["assignee"] else set(),
+            "dependencies": set(Task.objects.filter(pk__in=wanted["dependencies"]).values_list("pk", flat=True))
+            if wanted["dependencies"] else set(),
+        }
+        for index, attrs in list(self.valid.items()):
+            for name, found in existing.items():
+                value = attrs.get(name)
+                if name == "dependencies":
+                    values = value or ()
+                else:
+                    values = () if value is None else (value,)
+                missing = next((pk for pk in values if pk not in found), None)
+                if missing is not None:
+                    self.fail(index, name, _does_not_exist(missing))
+
+
+def _apply(task: Task, attrs: dict) -> set:
+    """Alanları göreve yaz; değişen model alanlarını döndür (bağımlılıklar hariç)."""
+    changed = set()
+    for name, value in attrs.items():
+        if name == "dependencies":
+            continue
+        model_name = _FK_FIELDS.get(name, name)
+        setattr(task, model_name, value)
+        changed.add(model_name)
+    return changed
+
+
+def _replace_dependencies(dependency_changes: Dict[int, List[int]]):
+    if not dependency_changes:
+        return
+    through = Task.dependencies.through
+    through.objects.filter(from_task_id__in=list(dependency_changes)).delete()
+    through.objects.bulk_create(
+        [through(from_task_id=pk, to_task_id=dep) for pk, deps in dependency_changes.items() for dep in set(deps)],
+        batch_size=1000,
+    )
+
+
+def _batches(values, size):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _supports_update_from():
+    if connection.vendor == "postgresql":
+        return True
+    return connection.vendor == "sqlite" and connection.Database.sqlite_version_info >= (3, 33, 0)
+
+
+def _update_from_values(tasks, model_fields):
+    """Tek ``UPDATE … FROM (VALUES (id, …), …)`` ile her satıra kendi değerlerini yaz (parti başına)."""
+    quote = connection.ops.quote_name
+    table, pk = quote(Task._meta.db_table), Task._meta.pk
+    # VALUES sütunları iki veritabanında da column1, column2, …; PostgreSQL parametre tiplerini çıkaramaz
+    cast = connection.vendor == "postgresql"
+
+    def source(position, model_field):
+        column = f"v.column{position}"
+        return f"CAST({column} AS {model_field.db_type(connection)})" if cast else column
+
+    assignments = ", ".join(
+        f"{quote(model_field.column)} = {source(position, model_field)}"
+        for position, model_field in enumerate(model_fields, start=2)
+    )
+    row = "(" + ", ".join(["%s"] * (len(model_fields) + 1)) + ")"
+    batch_size = connection.ops.bulk_batch_size([pk, *model_fields], tasks)
+    with connection.cursor() as cursor:
+        for batch in _batches(tasks, batch_size):
+            params = []
+            for task in batch:
+                params.append(task.pk)
+                params.extend(f.get_db_prep_save(getattr(task, f.attname), connection) for f in model_fields)
+            cursor.execute(
+                f"UPDATE {table} SET {assignments} FROM (VALUES {', '.join([row] * len(batch))}) AS v"
+                f" WHERE {table}.{quote(pk.column)} = {source(1, pk)}",
+                params,
+            )
+
+
+def _write_updates(tasks, fields):
+    """``tasks`` üzerindeki ``fields`` değerlerini en az sorguyla yaz."""
+    model_fields = [Task._meta.get_field(name) for name in sorted(fields)]
+    groups = {}
+    for task in tasks:
+        key = tuple(getattr(task, f.attname) for f in model_fields)
+        groups.setdefault(key, []).append(task.pk)
+
+    id_batch = connection.ops.bulk_batch_size([Task._meta.pk], tasks)
+    grouped_queries = sum(ceil(len(pks) / id_batch) for pks in groups.values())
+    row_batch = connection.ops.bulk_batch_size([Task._meta.pk, *model_fields], tasks)
+    if grouped_queries <= ceil(len(tasks) / row_batch):
+        for key, pks in groups.items():
+            values = {f.attname: value for f, value in zip(model_fields, key)}
+            for batch in _batches(pks, id_batch):
+                Task.objects.filter(pk__in=batch).update(**values)
+    elif _supports_update_from():
+        _update_from_values(tasks, model_fields)
+    else:
+        Task.objects.bulk_update(tasks, [f.name for f in model_fields], batch_size=500)
+
+
+def bulk_create_tasks(items, *, atomic=True) -> BulkResult:
+    _check_items(items)
+    validator = _BulkValidator(TaskBulkItemSerializer, partial=False)
+    for index, data in enumerate(items):
+        validator.run(index, data)
+    validator.check_references()
+
+    result = BulkResult(tasks=[None] * len(items), errors=dict(sorted(validator.errors.items())))
+    if result.errors and atomic:
+        return result
+
+    rows = sorted(validator.valid.items())
+    tasks = []
+    for _, attrs in rows:
+        task = Task()
+        _apply(task, attrs)
+        tasks.append(task)
+
+    with transaction.atomic():
+        Task.objects.bulk_create(tasks, batch_size=500)
+        _replace_dependencies({
+            task.pk: attrs["dependencies"] for task, (_, attrs) in zip(tasks, rows) if attrs.get("dependencies")
+        })
+        tasks_bulk_changed.send(sender=Task, project_ids=sorted({task.project_id for task in tasks}))
+
+    for task, (index, _) in zip(tasks, rows):
+        result.tasks[index] = task
+    result.written = bool(tasks)
+    return result
+
+
+def bulk_update_tasks(items, user, *, atomic=True, serializer_class=TaskBulkItemSerializer) -> BulkResult:
+    """``items``: [{"id": ..., <alanlar>}]; yalnızca ``user``'ın görebildiği görevler güncellenir."""
+    _check_items(items)
+    validator = _BulkValidator(serializer_class, partial=True)
+
+    ids, seen = {}, set()
+    for index, data in enumerate(items):
+        pk = data.get("id") if isinstance(data, dict) else None
+        if isinstance(pk, bool) or not isinstance(pk, int):
+            validator.errors[index] = {"id": ["Geçerli bir görev id'si zorunludur."]}
+        elif pk in seen:
+            validator.errors[index] = {"id": ["Aynı görev listede birden fazla kez var."]}
+        else:
+            ids[index] = pk
+            seen.add(pk)
+
+    instances = Task.objects.visible_to(user).in_bulk(list(ids.values()))
+    for index, pk in ids.items():
+        instance = instances.get(pk)
+        if instance is None:
+            validator.errors[index] = {"id": ["Görev bulunamadı."]}
+            continue
+        validator.run(index, {key: value for key, value in items[index].items() if key != "id"}, instance)
+    validator.check_references()
+
+    # Bağımlılık döngüleri: tüm değişiklikler birlikte; döngüdeki satırlar hatalı sayılıp yeniden denenir
+    dependency_changes = {
+        ids[index]: attrs["dependencies"] for index, attrs in validator.valid.items() if "dependencies" in attrs
+    }
+    index_by_pk = {pk: index for index, pk in ids.items()}
+    while dependency_changes:
+        try:
+            check_dependency_changes(dependency_changes)
+            break
+        except CycleError as exc:
+            culprits = [pk for pk in exc.cycle if pk in dependency_changes] or list(dependency_changes)
+            for pk in set(culprits):
+                validator.fail(index_by_pk[pk], "dependencies", str(exc))
+                del dependency_changes[pk]
+
+    result = BulkResult(tasks=[None] * len(items), errors=dict(sorted(validator.errors.items())))
+    if result.errors and atomic:
+        return result
+
+    # Toplu yazım auto_now alanlarını doldurmaz; bağımlılık değişikliği de görevi "değişmiş" sayar
+    now = timezone.now()
+    tasks, fields, project_ids, previous_assignees = [], {"updated_at"}, set(), set()
+    for index, attrs in sorted(validator.valid.items()):
+        task = instances[ids[index]]
+        project_ids.add(task.project_id)  # proje değişirse eskisi de
+        if "assignee" in attrs and task.assignee_id is not None:
+            previous_assignees.add(task.assignee_id)  # yazımdan sonra projelerden okunamaz
+        fields |= _apply(task, attrs)
+        task.updated_at = now
+        project_ids.add(task.project_id)
+        tasks.append(task)
+        result.tasks[index] = task
+
+    if tasks:
+        with transaction.atomic():
+            _write_updates(tasks, fields)
+            _replace_dependencies(dependency_changes)
+            tasks_bulk_changed.send(
+                sender=Task, project_ids=sorted(project_ids), user_ids=sorted(previous_assignees),
+            )
+        result.written = True
+    return result
+
+
+def bulk_update_status(items, user, *, atomic=True) -> BulkResult:
+    """[{"id": ..., "status": ...}] durum geçişleri."""
+    return bulk_update_tasks(items, user, atomic=atomic, serializer_class=TaskStatusItemSerializer)
@@ -0,0 +1,160 @@
+"""Takvim akışı: zaman penceresi, çakışma koşulu ve iCalendar (.ics) çıktısı.
+
+Görev ``[start_date, end_date]`` aralığı pencereyle çakışıyorsa takvimdedir:
+``start_date <= end AND end_date >= start``. Koşul ``task_end_start_idx``
+(personel) ya da üye projeleri başına ``task_project_end_start_idx`` indeksinden
+aralık taramasıyla okunur; taranan satır sayısı pencereden sonra biten
+görevlerle sınırlıdır, tablonun geçmişiyle büyümez.
+Tarihi eksik görevler takvimde yer almaz.
+
+Takvim abonelikleri (Google/Outlook vb.) başlık gönderemez; ``feed_token`` ile
+imzalanmış ``?feed=`` parametresi ``CalendarFeedAuthentication`` ile doğrulanır.
+Bağlantı yalnızca .ics çıktısını açar ve kullanıcının ``calendar_feed_version``
+değerini taşır; ``revoke_feed_tokens`` sürümü artırarak sızan bağlantıları
+``SECRET_KEY`` değiştirmeden geçersiz kılar.
+"""
+from datetime import date, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+
+from proje_yonetimi.exports import DEFAULT_CHUNK_SIZE, iter_chunks
+from users.models import User
+
+from .renderers import ICalendarRenderer
+
+CALENDAR_COLUMNS = ("id", "title", "start_date", "end_date", "assignee_id", "project_id", "status", "updated_at")
+
+_FEED_SALT = "tasks.calendar-feed"
+
+
+def _parse_date(params, name):
+    raw = params.get(name)
+    if raw in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise exceptions.ValidationError({name: "YYYY-AA-GG biçiminde bir tarih olmalıdır."})
+
+
+def parse_window(params, *, default=None):
+    """``?start=&end=`` (ikisi de dahil); verilmezse ``default`` (yoksa zorunlu)."""
+    start, end = _parse_date(params, "start"), _parse_date(params, "end")
+    if start is None and end is None and default is not None:
+        return default
+    errors = {name: "Zorunlu alan." for name, value in (("start", start), ("end", end)) if value is None}
+    if errors:
+        raise exceptions.ValidationError(errors)
+    if end < start:
+        raise exceptions.ValidationError({"end": "Bitiş başlangıçtan önce olamaz."})
+    limit = settings.CALENDAR_MAX_WINDOW_DAYS
+    if (end - start).days + 1 > limit:
+        raise exceptions.ValidationError({"end": f"Pencere en fazla {limit} gün olabilir."})
+    return start, end
+
+
+def feed_window(today=None):
+    """Abonelik akışı için göreli pencere (istemci tarih göndermez)."""
+    today = today or timezone.localdate()
+    return (
+        today - timedelta(days=settings.CALENDAR_FEED_PAST_DAYS),
+        today + timedelta(days=settings.CALENDAR_FEED_FUTURE_DAYS),
+    )
+
+
+def overlapping(qs, start, end):
+    return qs.filter(end_date__gte=start, start_date__lte=end)
+
+
+def feed_token(user):
+    return signing.TimestampSigner(salt=_FEED_SALT).sign(f"{user.pk}:{user.calendar_feed_version}")
+
+
+def revoke_feed_tokens(user):
+    """Kullanıcının verilmiş tüm takvim bağlantılarını geçersiz kıl."""
+    User.objects.filter(pk=user.pk).update(calendar_feed_version=F("calendar_feed_version") + 1)
+    user.refresh_from_db(fields=["calendar_feed_version"])
+
+
+class CalendarFeedAuthentication(BaseAuthentication):
+    """``?feed=<feed_token>`` ile kimlik doğrulama; yalnızca takvim görünümünün .ics çıktısında."""
+
+    def authenticate(self, request):
+        token = request.query_params.get("feed")
+        renderer = getattr(request, "accepted_renderer", None)
+        if not token or renderer is None or renderer.format != ICalendarRenderer.format:
+            return None
+        try:
+            value = signing.TimestampSigner(salt=_FEED_SALT).unsign(token, max_age=settings.CALENDAR_FEED_MAX_AGE)
+        except signing.BadSignature:
+            raise exceptions.AuthenticationFailed("Takvim bağlantısı geçersiz ya da süresi dolmuş.")
+        # Sürümsüz (eski) bağlantılar 0. sürüm sayılır
+        pk, _, version = value.partition(":")
+        user = User.objects.filter(pk=pk, calendar_feed_version=int(version or 0), is_active=True).first()
+        if user is None:
+            raise exceptions.AuthenticationFailed("Takvim bağlantısı geçersiz ya da süresi dolmuş.")
+        return user, None
+
+
+def _escape(text):
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line):
+    """RFC 5545: satırlar 75 oktette katlanır (UTF-8 karakteri bölünmeden)."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], [], 0
+    for char in line:
+        width = len(char.encode())
+        # İlk satır 75, devam satırları baştaki boşlukla birlikte 75 oktet
+        if size + width > (75 if not parts else 74):
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _stamp(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _vevent(row, domain):
+    pk, title, start, end, _assignee_id, project_id, status_, updated_at = row
+    return "".join((
+        "BEGIN:VEVENT\r\n",
+        f"UID:task-{pk}@{domain}\r\n",
+        f"DTSTAMP:{_stamp(updated_at)}\r\n",
+        f"DTSTART;VALUE=DATE:{start:%Y%m%d}\r\n",
+        # Tüm gün etkinliklerinde DTEND hariçtir
+        f"DTEND;VALUE=DATE:{end + timedelta(days=1):%Y%m%d}\r\n",
+        _fold(f"SUMMARY:{_escape(title)}"),
+        _fold(f"CATEGORIES:{_escape(status_)}"),
+        f"X-PROJECT-ID:{project_id}\r\n",
+        "END:VEVENT\r\n",
+    ))
+
+
+def iter_ics(rows, *, domain, name="Görevler", chunk_size=DEFAULT_CHUNK_SIZE):
+    """``CALENDAR_COLUMNS`` sırasındaki satırlardan parça parça VCALENDAR üret."""
+    yield "".join((
+        "BEGIN:VCALENDAR\r\n",
+        "VERSION:2.0\r\n",
+        "PRODID:-//proje_yonetimi//Takvim//TR\r\n",
+        "CALSCALE:GREGORIAN\r\n",
+        _fold(f"X-WR-CALNAME:{_escape(name)}"),
+    )).encode()
+    for chunk in iter_chunks(rows, chunk_size):
+        yield "".join(_vevent(row, domain) for row in chunk).encode()
+    yield b"END:VCALENDAR\r\n"
@@ -0,0 +1,349 @@
+"""Görev bağımlılık grafı: topolojik sıra, döngü tespiti, kritik yol (CPM).
+
+`Task.dependencies` kenarı "görev -> bağımlı olduğu görev" yönündedir; burada
+grafı iş akışı yönünde (önce gelen -> sonra gelen) tutarız. Komşuluk, model
+nesneleri yerine tam sayı dizileriyle (CSR: offset + hedef listesi) saklanır;
+tüm işlemler O(V + E).
+
+Süreler gün cinsindendir: ``(bitiş - başlangıç).days``. Bağımlı görev,
+öncülünün bitiş gününde başlayabilir (bitiş -> başlangıç, gecikmesiz).
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.utils import timezone
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle: Sequence[int]):
+        self.cycle = list(cycle)
+        super().__init__("Görev bağımlılıklarında döngü var: " + " -> ".join(map(str, self.cycle)))
+
+
+def _csr(n: int, sources: Sequence[int], targets: Sequence[int]) -> Tuple[List[int], List[int]]:
+    offsets = [0] * (n + 1)
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    filled = offsets[:-1].copy()
+    adjacency = [0] * len(sources)
+    for s, t in zip(sources, targets):
+        adjacency[filled[s]] = t
+        filled[s] += 1
+    return offsets, adjacency
+
+
+class TaskGraph:
+    """Görev id'leri 0..n-1 indekslerine eşlenmiş yönlü graf."""
+
+    __slots__ = ("ids", "index", "succ_offsets", "succ", "pred_offsets", "pred", "starts", "ends")
+
+    def __init__(self, ids: Sequence[int], edges: Iterable[Tuple[int, int]],
+                 starts: Optional[Sequence[Optional[date]]] = None,
+                 ends: Optional[Sequence[Optional[date]]] = None):
+        """``edges``: (önce gelen id, sonra gelen id). Grafta olmayan uçlar yok sayılır."""
+        self.ids = list(ids)
+        self.index = {pk: i for i, pk in enumerate(self.ids)}
+        self.starts = list(starts) if starts is not None else [None] * len(self.ids)
+        self.ends = list(ends) if ends is not None else [None] * len(self.ids)
+
+        index = self.index
+        sources, targets = [], []
+        for before, after in edges:
+            a, b = index.get(before), index.get(after)
+            if a is not None and b is not None:
+                sources.append(a)
+                targets.append(b)
+        n = len(self.ids)
+        self.succ_offsets, self.succ = _csr(n, sources, targets)
+        self.pred_offsets, self.pred = _csr(n, targets, sources)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.succ)
+
+    def successors(self, i: int) -> List[int]:
+        return self.succ[self.succ_offsets[i]:self.succ_offsets[i + 1]]
+
+    def predecessors(self, i: int) -> List[int]:
+        return self.pred[self.pred_offsets[i]:self.pred_offsets[i + 1]]
+
+    # ---- topolojik sıra ----
+    def topological_order(self) -> List[int]:
+        """Kahn algoritması; indeks listesi döner, döngü varsa CycleError."""
+        n = len(self.ids)
+        succ, offsets = self.succ, self.succ_offsets
+        indegree = [self.pred_offsets[i + 1] - self.pred_offsets[i] for i in range(n)]
+        queue = deque(i for i in range(n) if not indegree[i])
+        order = []
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for k in range(offsets[i], offsets[i + 1]):
+                j = succ[k]
+                indegree[j] -= 1
+                if not indegree[j]:
+                    queue.append(j)
+        if len(order) != n:
+            raise CycleError([self.ids[i] for i in self._find_cycle(indegree)])
+        return order
+
+    def _find_cycle(self, indegree: List[int]) -> List[int]:
+        """Kahn sonrası kalan düğümlerden (indegree > 0) bir döngü çıkar."""
+        remaining = [i for i, d in enumerate(indegree) if d > 0]
+        seen = {}
+        node = remaining[0]
+        path = []
+        # Kalan her düğümün kalan bir öncülü vardır; geriye yürüyünce döngüye gireriz
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(p for p in self.predecessors(node) if indegree[p] > 0)
+        cycle = path[seen[node]:]
+        cycle.reverse()
+        return cycle + [cycle[0]]
+
+    # ---- kritik yol ----
+    def schedule(self, *, origin: Optional[date] = None) -> "Schedule":
+        order = self.topological_order()
+        n = len(self.ids)
+
+        known_starts = [d for d in self.starts if d is not None]
+        if origin is None:
+            origin = min(known_starts) if known_starts else date.today()
+
+        durations = [0] * n
+        release = [0] * n
+        for i, (start, end) in enumerate(zip(self.starts, self.ends)):
+            if start is not None:
+                release[i] = (start - origin).days
+                if end is not None:
+                    durations[i] = max(0, (end - start).days)
+
+        pred, pred_offsets = self.pred, self.pred_offsets
+        succ, succ_offsets = self.succ, self.succ_offsets
+
+        es = [0] * n
+        ef = [0] * n
+        for i in order:
+            start = release[i]
+            for k in range(pred_offsets[i], pred_offsets[i + 1]):
+                if ef[pred[k]] > start:
+                    start = ef[pred[k]]
+            es[i] = start
+            ef[i] = start + durations[i]
+
+        finish = max(ef) if n else 0
+        lf = [finish] * n
+        ls = [0] * n
+        for i in reversed(order):
+            latest = finish
+            for k in range(succ_offsets[i], succ_offsets[i + 1]):
+                if ls[succ[k]] < latest:
+                    latest = ls[succ[k]]
+            lf[i] = latest
+            ls[i] = latest - durations[i]
+
+        return Schedule(self, order, origin, finish, durations, es, ef, ls, lf)
+
+
+@dataclass
+class Schedule:
+    graph: TaskGraph
+    order: List[int]
+    origin: date
+    finish: int
+    durations: List[int]
+    earliest_start: List[int]
+    earliest_finish: List[int]
+    latest_start: List[int]
+    latest_finish: List[int]
+
+    def slack(self, i: int) -> int:
+        return self.latest_start[i] - self.earliest_start[i]
+
+    def critical_path(self) -> List[int]:
+        """Proje bitişini belirleyen görev zinciri (indeksler, baştan sona)."""
+        n = len(self.graph)
+        if not n:
+            return []
+        es, ef = self.earliest_start, self.earliest_finish
+        node = next(i for i in reversed(self.order) if ef[i] == self.finish and self.slack(i) == 0)
+        path = [node]
+        while True:
+            nxt = None
+            for p in self.graph.predecessors(node):
+                if ef[p] == es[node] and self.slack(p) == 0:
+                    nxt = p
+                    break
+            if nxt is None:
+                break
+            path.append(nxt)
+            node = nxt
+        path.reverse()
+        return path
+
+    def day(self, offset: int) -> date:
+        return self.origin + timedelta(days=offset)
+
+
+def load_project_graph(project_id: int) -> TaskGraph:
+    """Projenin tüm grafını iki sorguda yükle: görevler + ara tablo kenarları."""
+    Task = apps.get_model("tasks", "Task")
+    rows = Task.objects.filter(project_id=project_id).order_by("pk").values_list(
+        "pk", "start_date", "end_date", "due_date"
+    )
+    ids, starts, ends = [], [], []
+    for pk, start, end, due in rows:
+        ids.append(pk)
+        starts.append(start)
+        ends.append(end or due)
+
+    # from_task, to_task'a bağımlı: to_task önce gelir
+    edges = Task.dependencies.through.objects.filter(
+        from_task__project_id=project_id, to_task__project_id=project_id,
+    ).values_list("to_task_id", "from_task_id")
+    return TaskGraph(ids, edges, starts, ends)
+
+
+def check_dependencies_acyclic(task, dependency_ids: Iterable[int]) -> None:
+    """``task``'ın bağımlılıkları ``dependency_ids`` olursa döngü oluşur mu? Oluşursa CycleError."""
+    if task.pk is None:
+        # Yeni görevin ardılı olamaz; tek olası döngü kendine bağımlılık
+        return
+    check_dependency_changes({task.pk: list(dependency_ids)})
+
+
+def _upstream_edges(start_ids: Sequence[int], replaced_ids: Sequence[int]) -> List[Tuple[int, int]]:
+    """``start_ids``'den bağımlılık yönünde ulaşılan alt grafın kenarları (önce, sonra); tek özyinelemeli sorgu.
+
+    Proje sınırı yoktur: bağımlılıklar projeler arası olabilir. ``replaced_ids``
+    görevlerinin mevcut kenarları yok sayılır (yerlerine yenileri gelecek).
+    """
+    Task = apps.get_model("tasks", "Task")
+    quote = connection.ops.quote_name
+    table, tasks = quote(Task.dependencies.through._meta.db_table), quote(Task._meta.db_table)
+    starts = ", ".join(["%s"] * len(start_ids))
+    replaced = ", ".join(["%s"] * len(replaced_ids))
+    sql = (
+        "WITH RECURSIVE upstream(id) AS ("
+        f" SELECT id FROM {tasks} WHERE id IN ({starts})"
+        f" UNION SELECT d.to_task_id FROM {table} d JOIN upstream ON d.from_task_id = upstream.id"
+        f" WHERE d.from_task_id NOT IN ({replaced})"
+        f") SELECT to_task_id, from_task_id FROM {table}"
+        f" WHERE from_task_id IN (SELECT id FROM upstream) AND from_task_id NOT IN ({replaced})"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*start_ids, *replaced_ids, *replaced_ids])
+        return cursor.fetchall()
+
+
+def check_dependency_changes(changes: Dict[int, List[int]]) -> None:
+    """Birden çok görevin bağımlılık listesi birlikte değişirse döngü oluşur mu? Oluşursa CycleError.
+
+    ``changes``: {görev id: yeni bağımlılık id'leri}. Yeni bir kenarın kapattığı döngü,
+    yeni bağımlılıklardan başlayıp bağımlılık yönünde ulaşılan alt grafın içindedir;
+    yalnızca o alt graf okunur (``_upstream_edges``).
+    """
+    for pk, dependency_ids in changes.items():
+        if pk in dependency_ids:
+            raise CycleError([pk, pk])
+
+    dependency_ids = sorted({dep for ids in changes.values() for dep in ids})
+    if not dependency_ids:
+        return
+    edges = _upstream_edges(dependency_ids, sorted(changes))
+    edges += [(dep, pk) for pk, ids in changes.items() for dep in ids]
+
+    ids = {pk for edge in edges for pk in edge}
+    TaskGraph(sorted(ids), edges).topological_order()
+
+
+def downstream_task_ids(task_id: int) -> List[int]:
+    """``task_id``'ye doğrudan/dolaylı bağımlı tüm görevler; tek özyinelemeli sorgu.
+
+    UNION tekrarları eler, böylece (olmaması gereken) bir döngüde de sorgu biter.
+    """
+    Task = apps.get_model("tasks", "Task")
+    table = connection.ops.quote_name(Task.dependencies.through._meta.db_table)
+    sql = (
+        "WITH RECURSIVE downstream(id) AS ("
+        f" SELECT from_task_id FROM {table} WHERE to_task_id = %s"
+        f" UNION SELECT d.from_task_id FROM {table} d JOIN downstream ON d.to_task_id = downstream.id"
+        ") SELECT id FROM downstream"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [task_id])
+        return [row[0] for row in cursor.fetchall() if row[0] != task_id]
+
+
+def propagate_schedule(task_id: int, queryset=None) -> List[Tuple[int, date, Optional[date], Optional[date]]]:
+    """``task_id``'nin tarihleri değiştikten sonra ardıl görevleri ileri kaydır.
+
+    Yalnızca aşağı akış alt grafı okunur (ardıllar + onların öncülleri). Bir görev,
+    öncüllerinin en geç bitişinden önce başlıyorsa süresi korunarak o güne kaydırılır;
+    bitiş ve son tarih (varsa) aynı gün sayısı kadar kayar, böylece yalnızca son
+    tarihi olan görevin ardılları da yeni tarihi görür. Hiçbir görev geri çekilmez.
+    Değişenler tek ``bulk_update`` ile yazılır.
+    ``queryset`` verilirse (ör. ``Task.objects.visible_to(user)``) yalnızca içindeki
+    ardıllar kaydırılır; dışındakiler yerinde kalır ve ardılları için sabit öncüldür.
+    Dönen liste: (id, yeni başlangıç, yeni bitiş, yeni son tarih), topolojik sırada.
+    """
+    from .signals import tasks_bulk_changed
+
+    Task = apps.get_model("tasks", "Task")
+    affected = set(downstream_task_ids(task_id))
+    if affected and queryset is not None:
+        affected = set(queryset.filter(pk__in=affected).values_list("pk", flat=True))
+    if not affected:
+        return []
+
+    edges = list(
+        Task.dependencies.through.objects.filter(from_task_id__in=affected).values_list("to_task_id", "from_task_id")
+    )
+    rows = {
+        pk: [start, end, due, project_id]
+        for pk, start, end, due, project_id in Task.objects.filter(
+            pk__in=affected | {before for before, _ in edges}
+        ).values_list("pk", "start_date", "end_date", "due_date", "project_id")
+    }
+    graph = TaskGraph(sorted(rows), edges)
+
+    changed = []
+    for i in graph.topological_order():
+        pk = graph.ids[i]
+        start, end, due = rows[pk][0], rows[pk][1], rows[pk][2]
+        if pk not in affected or start is None:
+            continue
+        finishes = [rows[p][1] or rows[p][2] for p in (graph.ids[j] for j in graph.predecessors(i))]
+        required = max((d for d in finishes if d is not None), default=None)
+        if required is None or required <= start:
+            continue
+        shift = required - start
+        rows[pk][0] = required
+        rows[pk][1] = end + shift if end is not None else None
+        rows[pk][2] = due + shift if due is not None else None
+        changed.append(pk)
+
+    if changed:
+        with transaction.atomic():
+            now = timezone.now()
+            Task.objects.bulk_update(
+                [
+                    Task(pk=pk, start_date=rows[pk][0], end_date=rows[pk][1], due_date=rows[pk][2], updated_at=now)
+                    for pk in changed
+                ],
+                ["start_date", "end_date", "due_date", "updated_at"], batch_size=500,
+            )
+            tasks_bulk_changed.send(sender=Task, project_ids=sorted({rows[pk][3] for pk in changed}))
+    return [(pk, rows[pk][0], rows[pk][1], rows[pk][2]) for pk in changed]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.3 on 2026-10-18 15:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['end_date', 'start_date'], name='task_end_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'end_date', 'start_date'], name='task_project_end_start_idx'),
+        ),
+    ]
@@ -1,7 +1,46 @@
+from datetime import date
+from typing import Optional
+
 from django.db import models
-from projects.models import Project
+from projects.models import Project, ProjectMembership
 from users.models import User
 
+from .utils import task_progress_annotations, task_rollup_contribution, timed_task_q
+
+# Proje özetini (Project.task_count vb.) etkileyen alanlar
+ROLLUP_FIELDS = {"project_id", "progress", "start_date", "end_date", "due_date"}
+
+
+class TaskQuerySet(models.QuerySet):
+    def with_progress(self, today: Optional[date] = None):
+        """manual_progress / dynamic_progress / effective_progress kolonlarını SQL'de hesapla."""
+        return self.annotate(**task_progress_annotations(today))
+
+    def with_dependencies(self):
+        """Bağımlılıkları id sırasıyla önceden yükle (``dependency_map`` ile aynı sıra)."""
+        return self.prefetch_related(models.Prefetch("dependencies", queryset=self.model.objects.order_by("pk")))
+
+    def dependency_map(self):
+        """{görev id: [bağımlı olduğu görev id'leri]}; ara tablodan tek sorgu, id sırasıyla."""
+        through = self.model.dependencies.through.objects.filter(
+            from_task__in=self.order_by().values("pk")
+        ).order_by("from_task_id", "to_task_id")
+        dependencies = {}
+        for from_id, to_id in through.values_list("from_task_id", "to_task_id"):
+            dependencies.setdefault(from_id, []).append(to_id)
+        return dependencies
+
+    def timed(self):
+        """Dinamik ilerlemesi tarihe bağlı görevler."""
+        return self.filter(timed_task_q())
+
+    def visible_to(self, user):
+        """Personel her şeyi, diğerleri sahibi/atananı olduğu projelerin görevlerini görür."""
+        if user.is_staff:
+            return self
+        return self.filter(project_id__in=ProjectMembership.objects.for_user(user))
+
+
 class Task(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='tasks')
     title = models.CharField(max_length=100)
@@ -13,3 +52,47 @@ class Task(models.Model):
     status = models.CharField(max_length=20, default='Devam Ediyor')
     progress = models.IntegerField(default=0)
     dependencies = models.ManyToManyField("self", symmetrical=False, blank=True)
+    # Koşullu GET (ETag); toplu yazım yollarında elle set edilmeli
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Rapor durum kırılımı (kapsayan indeks), tamamlanan listesi + due_date sıralaması
+            models.Index(fields=["status", "due_date"], name="task_status_idx"),
+            # Keyset sıralaması (due_date, id) ve tarih aralığı filtreleri
+            models.Index(fields=["due_date", "id"], name="task_due_date_idx"),
+            # Proje/atanan kapsamlı durum sayıları (dashboard, raporlar)
+            models.Index(fields=["project", "status"], name="task_project_status_idx"),
+            models.Index(fields=["assignee", "status"], name="task_assignee_status_idx"),
+            # TasksByDateView: start_date >= ? AND end_date <= ?
+            models.Index(fields=["start_date", "end_date"], name="task_start_end_idx"),
+            # Takvim çakışma koşulu: end_date >= ? AND start_date <= ? (personel / üye projeleri başına)
+            models.Index(fields=["end_date", "start_date"], name="task_end_start_idx"),
+            models.Index(fields=["project", "end_date", "start_date"], name="task_project_end_start_idx"),
+            # Yaklaşan/aktif görevler; kısmi indeksi desteklemeyen veritabanında atlanır
+            models.Index(
+                fields=["due_date"], condition=~models.Q(status="Tamamlandı"), name="task_open_due_date_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kaydetme/silmede proje özetini fark (delta) ile güncelleyebilmek için
+        if ROLLUP_FIELDS.issubset(field_names):
+            instance._rollup_state = (instance.project_id, *task_rollup_contribution(instance))
+        # Değişiklikte eski proje/atanan da bilinsin (dashboard önbelleği, üyelik tablosu)
+        if "project_id" in field_names and "assignee_id" in field_names:
+            instance._loaded_links = (instance.project_id, instance.assignee_id)
+        # Durum geçişi olayı (events) için
+        if "status" in field_names:
+            instance._loaded_status = instance.status
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save alıcılarının hepsi eski değerleri gördükten sonra güncelle
+        self._loaded_links = (self.project_id, self.assignee_id)
+        self._loaded_status = self.status
@@ -0,0 +1,21 @@
+import json
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """`?format=columnar` ile seçilir; çıktı yine JSON, yalnızca görünüm sütun düzeninde veri üretir."""
+
+    format = "columnar"
+
+
+class ICalendarRenderer(BaseRenderer):
+    """`?format=ics` içerik pazarlığı için; takvim verisi ``tasks.calendar.iter_ics`` ile akar."""
+
+    media_type = "text/calendar"
+    format = "ics"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Yalnızca hata yanıtları buraya düşer
+        return json.dumps(data, ensure_ascii=False).encode()
@@ -1,7 +1,20 @@
+from functools import cache
+
 from rest_framework import serializers
 
+from proje_yonetimi.fastlist import serializer_row_encoder
+
+from .graph import CycleError, check_dependencies_acyclic
 from .models import Task
-from .utils import task_progress_info
+from .utils import clear_progress_annotations, progress_from_annotations, task_progress_info
+
+def validate_date_order(attrs, instance=None):
+    # start <= end kontrolü (kısmi güncellemede eksik alan mevcut kayıttan)
+    start = attrs.get('start_date', getattr(instance, 'start_date', None))
+    end = attrs.get('end_date', getattr(instance, 'end_date', None))
+    if start and end and start > end:
+        raise serializers.ValidationError("Başlangıç tarihi, bitiş tarihinden büyük olamaz.")
+
 
 class TaskSerializer(serializers.ModelSerializer):
     project_name = serializers.SerializerMethodField(read_only=True)
@@ -38,7 +51,8 @@ class TaskSerializer(serializers.ModelSerializer):
 
     def _progress_payload(self, obj):
         if not hasattr(obj, "_progress_payload"):
-            obj._progress_payload = task_progress_info(obj)
+            # with_progress() ile gelmişse SQL kolonlarını kullan, yoksa Python'da hesapla
+            obj._progress_payload = progress_from_annotations(obj) or task_progress_info(obj)
         return obj._progress_payload
 
     def get_dynamic_progress(self, obj):
@@ -49,10 +63,83 @@ class TaskSerializer(serializers.ModelSerializer):
         payload = self._progress_payload(obj)
         return payload.effective
 
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        clear_progress_annotations(instance)
+        return instance
+
+    def validate(self, attrs):
+        validate_date_order(attrs, self.instance)
+
+        # bağımlılık döngüsü kontrolü (yeni görevin ardılı olmadığından yalnızca güncellemede)
+        dependencies = attrs.get('dependencies')
+        if dependencies is not None and self.instance is not None:
+            try:
+                check_dependencies_acyclic(self.instance, [dep.pk for dep in dependencies])
+            except CycleError as exc:
+                raise serializers.ValidationError({"dependencies": str(exc)})
+        return attrs
+
+# TaskViewSet.list hızlı yolu (proje_yonetimi.fastlist): TaskSerializer ile aynı çıktı
+TASK_LIST_COLUMNS = (
+    "id", "project_id", "title", "description", "assignee_id",
+    "start_date", "end_date", "due_date", "status", "progress",
+    "project__name", "assignee__first_name", "assignee__last_name", "assignee__email",
+    "dynamic_progress", "effective_progress",
+)
+
+
+def _list_assignee_name(row, context):
+    if row.assignee_id is None:
+        return None
+    return f"{row.assignee__first_name} {row.assignee__last_name}".strip() or row.assignee__email
+
+
+def _list_dependencies(row, dependencies):
+    return dependencies.get(row.id, [])
+
+
+@cache
+def task_row_encoder(columns=TASK_LIST_COLUMNS, fields=None):
+    """``encode(row, dependency_map) -> dict``; satırlar ``columns`` sırasında."""
+    return serializer_row_encoder(TaskSerializer, columns, {
+        "project": "project_id",
+        "assignee": "assignee_id",
+        "project_name": "project__name",
+        "assignee_name": _list_assignee_name,
+        "dependencies": _list_dependencies,
+    }, fields)
+
+
+class TaskBulkItemSerializer(serializers.ModelSerializer):
+    """Toplu oluşturma/güncelleme satırı.
+
+    İlişkiler satır başına sorgu atılmasın diye düz id olarak alınır; varlıkları
+    ``tasks.bulk`` içinde tüm liste için birlikte kontrol edilir.
+    """
+
+    project = serializers.IntegerField(min_value=1)
+    assignee = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    dependencies = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+
+    class Meta:
+        model = Task
+        fields = [
+            'project', 'title', 'description', 'assignee',
+            'start_date', 'end_date', 'due_date',
+            'status', 'progress', 'dependencies',
+        ]
+        extra_kwargs = TaskSerializer.Meta.extra_kwargs
+
     def validate(self, attrs):
-        # start <= end kontrolü
-        start = attrs.get('start_date', getattr(self.instance, 'start_date', None))
-        end = attrs.get('end_date', getattr(self.instance, 'end_date', None))
-        if start and end and start > end:
-            raise serializers.ValidationError("Başlangıç tarihi, bitiş tarihinden büyük olamaz.")
-        return attrs
\ No newline at end of file
+        validate_date_order(attrs, self.instance)
+        return attrs
+
+
+class TaskStatusItemSerializer(serializers.ModelSerializer):
+    """Toplu durum geçişi satırı: yalnızca ``status``."""
+
+    class Meta:
+        model = Task
+        fields = ['status']
+        extra_kwargs = {'status': {'required': True}}
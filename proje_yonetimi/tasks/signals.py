@@ -0,0 +1,93 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from projects.membership import rebuild_memberships, refresh_assignee_memberships
+from projects.models import Project
+from projects.utils import refresh_task_rollups
+
+from .models import Task
+from .utils import task_rollup_contribution
+
+# bulk_create / bulk_update / QuerySet.update model sinyali üretmez.
+# Bu yolları kullanan kod, etkilenen projelerle bu sinyali göndermeli:
+#     tasks_bulk_changed.send(sender=Task, project_ids=[...])
+# Yazımdan sonra projelerden okunamayan etkilenen kullanıcılar (ör. değiştirilen
+# eski atananlar) isteğe bağlı ``user_ids=[...]`` ile eklenir.
+tasks_bulk_changed = Signal()
+
+
+def _apply_rollup_delta(project_id, count, progress, timed):
+    if project_id is None or not (count or progress or timed):
+        return
+    Project.objects.filter(pk=project_id).update(
+        task_count=F("task_count") + count,
+        task_progress_sum=F("task_progress_sum") + progress,
+        timed_task_count=F("timed_task_count") + timed,
+    )
+
+
+@receiver(post_save, sender=Task)
+def update_rollup_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    progress, timed = task_rollup_contribution(instance)
+    previous = getattr(instance, "_rollup_state", None)
+
+    if created:
+        _apply_rollup_delta(instance.project_id, 1, progress, timed)
+    elif previous is None:
+        # Önceki değerler bilinmiyor (ör. .only() ile yüklenmiş): projeyi baştan hesapla
+        refresh_task_rollups([instance.project_id])
+    else:
+        old_project, old_progress, old_timed = previous
+        if old_project == instance.project_id:
+            _apply_rollup_delta(instance.project_id, 0, progress - old_progress, timed - old_timed)
+        else:
+            _apply_rollup_delta(old_project, -1, -old_progress, -old_timed)
+            _apply_rollup_delta(instance.project_id, 1, progress, timed)
+
+    instance._rollup_state = (instance.project_id, progress, timed)
+
+
+@receiver(post_delete, sender=Task)
+def update_rollup_on_delete(sender, instance, origin=None, **kwargs):
+    # Proje silinirken görevleri de silinir; özeti güncellemeye gerek yok
+    if isinstance(origin, Project) or getattr(origin, "model", None) is Project:
+        return
+    previous = getattr(instance, "_rollup_state", None)
+    if previous is None:
+        previous = (instance.project_id, *task_rollup_contribution(instance))
+    project_id, progress, timed = previous
+    _apply_rollup_delta(project_id, -1, -progress, -timed)
+
+
+@receiver(tasks_bulk_changed)
+def refresh_rollups_after_bulk(sender, project_ids, **kwargs):
+    refresh_task_rollups(project_ids)
+
+
+@receiver(post_save, sender=Task)
+def update_membership_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    current = (instance.project_id, instance.assignee_id)
+    previous = getattr(instance, "_loaded_links", None)
+    if created or previous != current:
+        refresh_assignee_memberships({current, previous or current})
+
+
+@receiver(post_delete, sender=Task)
+def update_membership_on_delete(sender, instance, origin=None, **kwargs):
+    # Proje silinirken üyelikleri de CASCADE ile gider
+    if isinstance(origin, Project) or getattr(origin, "model", None) is Project:
+        return
+    refresh_assignee_memberships({
+        (instance.project_id, instance.assignee_id),
+        getattr(instance, "_loaded_links", None) or (None, None),
+    })
+
+
+@receiver(tasks_bulk_changed)
+def rebuild_memberships_after_bulk(sender, project_ids, **kwargs):
+    rebuild_memberships(project_ids)
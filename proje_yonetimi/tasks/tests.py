@@ -1,3 +1,1054 @@
+import os
+from datetime import date, timedelta
+from unittest import skipIf
+from urllib.parse import parse_qs, urlsplit
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from proje_yonetimi.testing import select_columns
+from projects.models import Project
+from users.models import User
+
+from .models import Task
+from .utils import task_progress_info
+
+
+class ReportsSummaryViewTests(TestCase):
+    url = "/api/tasks/reports/summary/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", is_staff=True)
+        cls.project = Project.objects.create(name="Rapor", owner=cls.admin)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _add_users(self, count, tasks_each=2, done_each=1):
+        for i in range(count):
+            user = User.objects.create_user(email=f"u{User.objects.count()}-{i}@example.com")
+            for j in range(tasks_each):
+                Task.objects.create(
+                    project=self.project, title=f"t{j}", assignee=user,
+                    status="Tamamlandı" if j < done_each else "Devam Ediyor",
+                )
+
+    def _query_count(self, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def test_query_count_is_constant_in_number_of_users(self):
+        self._add_users(3)
+        small, _ = self._query_count()
+        self._add_users(30)
+        large, data = self._query_count()
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 3)  # koşullu GET doğrulayıcısı + durumlar + kullanıcılar
+        self.assertEqual(len(data["users"]), User.objects.count())
+
+    def test_breakdown_and_ordering(self):
+        busy = User.objects.create_user(email="busy@example.com", first_name="Ada", last_name="Y")
+        idle = User.objects.create_user(email="idle@example.com")
+        for i in range(3):
+            Task.objects.create(project=self.project, title=f"b{i}", assignee=busy,
+                                status="Tamamlandı" if i else "Beklemede")
+
+        _, data = self._query_count()
+        self.assertEqual(data["status_counts"], {"Tamamlandı": 2, "Devam Ediyor": 0, "Beklemede": 1})
+        first = data["users"][0]
+        self.assertEqual(first, {"id": busy.id, "name": "Ada Y", "total": 3, "done": 2, "rate": 67})
+        self.assertIn({"id": idle.id, "name": "idle@example.com", "total": 0, "done": 0, "rate": 0}, data["users"])
+
+    def test_min_total_and_limit_filter_in_database(self):
+        self._add_users(4, tasks_each=1)
+        _, data = self._query_count({"min_total": 1})
+        self.assertEqual(len(data["users"]), 4)
+        self.assertTrue(all(u["total"] >= 1 for u in data["users"]))
+
+        _, data = self._query_count({"min_total": 1, "limit": 2})
+        self.assertEqual(len(data["users"]), 2)
+
+    def test_invalid_params_are_rejected(self):
+        response = self.client.get(self.url, {"limit": "abc"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(self.url, {"limit": 0})
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskProgressAnnotationParityTests(TestCase):
+    """`Task.objects.with_progress()` ile `task_progress_info` aynı sonucu vermeli."""
+
+    today = date(2025, 3, 10)
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create_user(email="owner@example.com")
+        cls.project = Project.objects.create(name="P", owner=owner)
+
+    def _create(self, **kwargs):
+        return Task.objects.create(project=self.project, title="t", **kwargs)
+
+    def assertParity(self, today):
+        for task in Task.objects.with_progress(today):
+            expected = task_progress_info(task, today=today)
+            actual = (task.manual_progress, task.dynamic_progress, task.effective_progress)
+            self.assertEqual(actual, (expected.manual, expected.dynamic, expected.effective),
+                             msg=f"start={task.start_date} end={task.end_date} due={task.due_date} today={today}")
+
+    def test_edge_cases(self):
+        d = self.today
+        self._create()                                                  # tarih yok
+        self._create(start_date=d)                                      # bitiş yok
+        self._create(end_date=d, progress=40)                           # başlangıç yok
+        self._create(start_date=d, end_date=d)                          # sıfır uzunluk, bugün
+        self._create(start_date=d + timedelta(days=3), end_date=d + timedelta(days=3))
+        self._create(start_date=d, end_date=d - timedelta(days=5))      # ters aralık
+        self._create(start_date=d - timedelta(days=23), end_date=d + timedelta(days=17))  # 23/40 yuvarlama
+        self._create(start_date=d - timedelta(days=1), end_date=d + timedelta(days=7))    # 12.5 -> 12
+        self._create(start_date=d - timedelta(days=3), end_date=d + timedelta(days=5))    # 37.5 -> 38
+        self._create(start_date=d - timedelta(days=5), end_date=d + timedelta(days=5),
+                     due_date=d + timedelta(days=1))                    # due_date öncelikli
+        self._create(progress=-20)
+        self._create(progress=250, start_date=d - timedelta(days=2), end_date=d + timedelta(days=2))
+        self._create(progress=90, start_date=d - timedelta(days=1), end_date=d + timedelta(days=9))
+
+        for today in (d, d - timedelta(days=400), d + timedelta(days=400), d - timedelta(days=1), d + timedelta(days=3)):
+            self.assertParity(today)
+
+    def test_dense_span_grid(self):
+        d = self.today
+        Task.objects.bulk_create([
+            Task(project=self.project, title="g", start_date=d - timedelta(days=elapsed),
+                 end_date=d - timedelta(days=elapsed) + timedelta(days=span))
+            for span in range(1, 60)
+            for elapsed in range(-1, span + 2)
+        ])
+        self.assertParity(d)
+
+    def test_patch_response_recomputes_progress(self):
+        task = self._create(progress=10)
+        client = APIClient()
+        client.force_authenticate(self.project.owner)
+        response = client.patch(f"/api/tasks/{task.id}/", {"progress": 80}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["effective_progress"], 80)
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        project = Project.objects.create(name="P", owner=cls.owner)
+        d = date(2025, 1, 1)
+        dues = [None, d, d, d + timedelta(days=1), None, d - timedelta(days=3), d, None, d + timedelta(days=9)]
+        Task.objects.bulk_create([
+            Task(project=project, title=f"t{i}", due_date=due, status="Tamamlandı" if i % 2 else "Beklemede")
+            for i, due in enumerate(dues * 3)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _walk(self, url, page_size):
+        ids, pages = [], 0
+        response = self.client.get(url, {"page_size": page_size})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body["results"]), page_size)
+            ids += [row["id"] for row in body["results"]]
+            pages += 1
+            if not body["next"]:
+                return ids, pages
+            response = self.client.get(body["next"])
+
+    def _expected(self, qs):
+        # due_date artan, NULL'lar sonda, eşitlikte id
+        rows = list(qs.values_list("id", "due_date"))
+        return [pk for pk, _ in sorted(rows, key=lambda r: (r[1] is None, r[1] or date.min, r[0]))]
+
+    def test_walks_every_row_once_in_stable_order(self):
+        for size in (1, 4, 7, 100):
+            ids, pages = self._walk("/api/tasks/", size)
+            self.assertEqual(ids, self._expected(Task.objects.all()))
+
+    def test_report_views_use_the_same_paginator(self):
+        ids, pages = self._walk("/api/tasks/reports/completed/", 2)
+        self.assertEqual(ids, self._expected(Task.objects.filter(status="Tamamlandı")))
+        self.assertGreater(pages, 1)
+
+    def test_unpaginated_shape_is_unchanged(self):
+        response = self.client.get("/api/tasks/")
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), Task.objects.count())
+        response = self.client.get("/api/tasks/reports/active/")
+        self.assertIsInstance(response.json(), list)
+
+    def test_page_size_is_capped_and_cursor_validated(self):
+        with self.settings(API_MAX_PAGE_SIZE=5):
+            body = self.client.get("/api/tasks/", {"page_size": 500}).json()
+        self.assertEqual(len(body["results"]), 5)
+        self.assertEqual(self.client.get("/api/tasks/", {"cursor": "bozuk"}).status_code, 404)
+
+    def test_deep_page_uses_keyset_predicate_not_offset(self):
+        body = self.client.get("/api/tasks/", {"page_size": 3}).json()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(body["next"])
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn("OFFSET", sql)
+
+
+class TaskExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com", first_name="Ece", last_name="K")
+        cls.stranger = User.objects.create_user(email="stranger@example.com")
+        cls.project = Project.objects.create(name="Görünür", owner=cls.owner)
+        hidden = Project.objects.create(name="Gizli", owner=cls.stranger)
+        first = Task.objects.create(project=cls.project, title="İlk", assignee=cls.owner, progress=30,
+                                    start_date=date(2025, 1, 1), end_date=date(2025, 1, 5))
+        second = Task.objects.create(project=cls.project, title="İkinci, virgüllü", description="a\nb")
+        second.dependencies.add(first)
+        Task.objects.create(project=hidden, title="gizli")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _body(self, response):
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_matches_serializer_and_visibility(self):
+        import json
+
+        response = self.client.get("/api/tasks/export/")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        expected = self.client.get("/api/tasks/").json()
+        self.assertEqual(sorted(rows, key=lambda r: r["id"]), sorted(expected, key=lambda r: r["id"]))
+        self.assertNotIn("gizli", {r["title"] for r in rows})
+
+    def test_csv_output(self):
+        import csv
+        import io
+
+        response = self.client.get("/api/tasks/export/", {"format": "csv"})
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.DictReader(io.StringIO(self._body(response))))
+        self.assertEqual([r["title"] for r in rows], ["İlk", "İkinci, virgüllü"])
+        self.assertEqual(rows[0]["assignee_name"], "Ece K")
+        self.assertEqual(rows[1]["dependencies"], str(rows[0]["id"]))
+        self.assertEqual(rows[1]["description"], "a\nb")
+
+    def test_names_resolved_per_chunk(self):
+        from unittest import mock
+
+        from .views import TaskViewSet
+
+        Task.objects.bulk_create([Task(project=self.project, title=f"x{i}", assignee=self.owner) for i in range(50)])
+
+        def count_queries(chunk_size):
+            with mock.patch.object(TaskViewSet, "export_chunk_size", chunk_size):
+                with CaptureQueriesContext(connection) as ctx:
+                    lines = self._body(self.client.get("/api/tasks/export/")).splitlines()
+            self.assertEqual(len(lines), 52)
+            return len(ctx.captured_queries)
+
+        # 1 ana sorgu + parça başına 3 çözümleme sorgusu (proje, atanan, bağımlılık)
+        self.assertEqual(count_queries(2000), 1 + 3)
+        self.assertEqual(count_queries(10), 1 + 3 * 6)
+
+    def test_project_export(self):
+        import json
+
+        response = self.client.get("/api/projects/export/")
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual([r["name"] for r in rows], ["Görünür"])
+        self.assertIn("effective_progress", rows[0])
+
+
+class TaskFastListTests(TestCase):
+    """Hızlı liste yolu serializer yoluyla bayt bayt aynı çıktı vermeli."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com", first_name="Ece", last_name="K")
+        cls.staff = User.objects.create_user(email="staff@example.com", is_staff=True)
+        nameless = User.objects.create_user(email="adsiz@example.com")
+        project = Project.objects.create(name="Ünicode \u2028 \"tırnak\"", owner=cls.owner)
+        other = Project.objects.create(name="Diğer", owner=cls.staff)
+        tasks = [
+            Task.objects.create(project=project, title="İlk\ttab", assignee=cls.owner, progress=30,
+                                start_date=date(2025, 1, 1), end_date=date(2025, 1, 5), due_date=date(2025, 1, 5)),
+            Task.objects.create(project=project, title="emoji 🚀 \u2029", description="a\nb\x01", assignee=nameless),
+            Task.objects.create(project=project, title="tarihsiz", due_date=date(2024, 12, 1)),
+            Task.objects.create(project=other, title="başka", start_date=date(2025, 2, 1), due_date=date(2025, 3, 1)),
+        ]
+        # Bağımlılıklar id sırasının tersine eklenir
+        tasks[2].dependencies.add(tasks[1])
+        tasks[2].dependencies.add(tasks[0])
+        tasks[3].dependencies.add(tasks[2])
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def _both(self, user, params=None):
+        self.client.force_authenticate(user)
+        fast = self.client.get("/api/tasks/", params or {})
+        with self.settings(API_FAST_LIST=False):
+            slow = self.client.get("/api/tasks/", params or {})
+        self.assertEqual((fast.status_code, slow.status_code), (200, 200))
+        return fast, slow
+
+    def test_byte_identical_to_serializer(self):
+        for user in (self.owner, self.staff):
+            for params in ({}, {"page_size": 2}, {"status": "Devam Ediyor"}, {"page_size": 50}):
+                with self.subTest(user=user.email, params=params):
+                    fast, slow = self._both(user, params)
+                    self.assertEqual(fast.content, slow.content)
+                    self.assertEqual(fast["Content-Type"], slow["Content-Type"])
+
+    def test_next_cursor_walks_the_same_rows(self):
+        fast, slow = self._both(self.staff, {"page_size": 3})
+        self.assertIsNotNone(fast.json()["next"])
+        self.assertEqual(fast.json()["next"], slow.json()["next"])
+        query = parse_qs(urlsplit(fast.json()["next"]).query)
+        fast, slow = self._both(self.staff, {"page_size": 3, "cursor": query["cursor"][0]})
+        self.assertEqual(fast.content, slow.content)
+
+    def test_query_count_is_constant(self):
+        self.client.force_authenticate(self.staff)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/tasks/")
+        self.assertEqual(len(ctx.captured_queries), 2)  # satırlar + bağımlılıklar
+
+    def test_renderer_matches_drf_escaping(self):
+        from unittest import mock
+
+        from rest_framework.renderers import JSONRenderer
+
+        from proje_yonetimi.fastlist import FastJSONRenderer
+
+        data = [{"s": "".join(map(chr, range(128))) + "\u2028\u2029ğ🚀", "n": None, "i": -5, "l": [1, 2]}]
+        expected = JSONRenderer().render(data)
+        self.assertEqual(FastJSONRenderer().render(data), expected)
+        with mock.patch("proje_yonetimi.fastlist.orjson", None):
+            self.assertEqual(FastJSONRenderer().render(data), expected)
+        self.assertEqual(FastJSONRenderer().render(data, "application/json; indent=2"),
+                         JSONRenderer().render(data, "application/json; indent=2"))
+
+    def test_browsable_api_uses_serializer(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.get("/api/tasks/", {"format": "api"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"<html", response.content.lower())
+
+
+class TaskSparseFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com", first_name="Ece")
+        project = Project.objects.create(name="Seyrek", owner=cls.owner)
+        first = Task.objects.create(project=project, title="a", description="uzun" * 100, assignee=cls.owner,
+                                    start_date=date(2025, 1, 1), due_date=date(2025, 2, 1))
+        second = Task.objects.create(project=project, title="b")
+        second.dependencies.add(first)
+        cls.task = first
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _get(self, url, params):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        task_sql = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT") and 'FROM "tasks_task"' in q["sql"]]
+        return response, task_sql
+
+    def test_select_list_shrinks_as_fields_are_removed(self):
+        for fast in (True, False):
+            with self.subTest(fast=fast), self.settings(API_FAST_LIST=fast):
+                widths = []
+                for fields in (None, "id,title,status,due_date,assignee_name", "id,title,status,due_date", "id,title"):
+                    response, sql = self._get("/api/tasks/", {"fields": fields} if fields else {})
+                    widths.append(len(select_columns(sql[0])))
+                    if fields:
+                        self.assertEqual(set(response.json()[0]), set(fields.split(",")))
+                        self.assertNotIn('"description"', sql[0])
+                        self.assertEqual(len(sql), 1)  # bağımlılık sorgusu yok
+                self.assertEqual(widths, sorted(widths, reverse=True))
+                self.assertEqual(len(set(widths)), len(widths))
+
+    def test_joins_only_for_requested_related_names(self):
+        for fast in (True, False):
+            with self.subTest(fast=fast), self.settings(API_FAST_LIST=fast):
+                _, sql = self._get("/api/tasks/", {"fields": "id,title,due_date"})
+                self.assertNotIn('"users_user"', sql[0].split(" WHERE ")[0])
+                self.assertNotIn('JOIN "projects_project"', sql[0])
+                response, sql = self._get("/api/tasks/", {"fields": "id,assignee_name,project_name"})
+                self.assertIn('JOIN "users_user"', sql[0])
+                self.assertIn('JOIN "projects_project"', sql[0])
+                row = next(r for r in response.json() if r["id"] == self.task.pk)
+                self.assertEqual(row, {"id": self.task.pk, "project_name": "Seyrek", "assignee_name": "Ece"})
+
+    def test_sparse_fast_path_matches_serializer_bytes(self):
+        for params in ({"fields": "title,dependencies,effective_progress"}, {"fields": "id,due_date", "page_size": 1}):
+            fast = self.client.get("/api/tasks/", params)
+            with self.settings(API_FAST_LIST=False):
+                slow = self.client.get("/api/tasks/", params)
+            self.assertEqual(fast.content, slow.content)
+
+    def test_retrieve_defers_unrequested_columns(self):
+        response, sql = self._get(f"/api/tasks/{self.task.pk}/", {"fields": "id,title"})
+        self.assertEqual(response.json(), {"id": self.task.pk, "title": "a"})
+        self.assertNotIn('"description"', sql[0])
+        self.assertEqual(len(sql), 1)
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get("/api/tasks/", {"fields": "id,parola"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("parola", response.json()["fields"])
+
+    def test_writes_ignore_fields_param(self):
+        response = self.client.patch(f"/api/tasks/{self.task.pk}/?fields=id", {"progress": 40}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["progress"], 40)
+        self.assertIn("description", response.json())
+
+
+def _rss_bytes():
+    """Sürecin şu anki yerleşik bellek (RSS) boyutu; /proc olmayan sistemlerde ``None``."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+@skipIf(_rss_bytes() is None, "RSS ölçümü /proc/self/statm gerektirir (Linux)")
+class TaskExportMemoryTests(TestCase):
+    """Dışa aktarma akarken süreç RSS'inin artışı sabit bir bütçede kalmalı.
+
+    RSS tracemalloc'un göremediği C tarafı ayırmaları da (sqlite3 tamponları,
+    yanıt nesneleri) kapsar. Artış, akış başlamadan önceki değere göre her
+    ``sample_every`` parçada bir örneklenir; 200k satır belleğe alınsaydı bütçe
+    birkaç kat aşılırdı.
+    """
+    rows = 200_000
+    budget_bytes = 32 * 1024 * 1024
+    sample_every = 100
+
+    def test_large_export_stays_within_rss_budget(self):
+        owner = User.objects.create_user(email="bulk@example.com", is_staff=True)
+        project = Project.objects.create(name="Büyük", owner=owner)
+        batch = 20_000
+        for start in range(0, self.rows, batch):
+            Task.objects.bulk_create(
+                [Task(project=project, title=f"görev {i}", description="x" * 40, progress=i % 101,
+                      start_date=date(2025, 1, 1), end_date=date(2025, 3, 1))
+                 for i in range(start, start + batch)],
+                batch_size=batch,
+            )
+        client = APIClient()
+        client.force_authenticate(owner)
+
+        response = client.get("/api/tasks/export/", {"format": "csv"})
+        lines = 0
+        baseline = peak = _rss_bytes()
+        for number, piece in enumerate(response.streaming_content):
+            lines += piece.count(b"\n")
+            if number % self.sample_every == 0:
+                peak = max(peak, _rss_bytes())
+        peak = max(peak, _rss_bytes())
+
+        self.assertEqual(lines, self.rows + 1)  # + başlık satırı
+        self.assertLess(peak - baseline, self.budget_bytes)
+
+
+class GanttChartTasksViewTests(TestCase):
+    url = "/api/tasks/gantt/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com", first_name="Can")
+        cls.project = Project.objects.create(name="Gantt", owner=cls.owner)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _chain(self, count):
+        tasks = Task.objects.bulk_create([
+            Task(project=self.project, title=f"g{i}", start_date=date(2025, 1, 1), end_date=date(2025, 1, 10))
+            for i in range(count)
+        ])
+        through = Task.dependencies.through
+        through.objects.bulk_create([
+            through(from_task_id=b.pk, to_task_id=a.pk) for a, b in zip(tasks, tasks[1:])
+        ])
+        return tasks
+
+    def _get(self, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"project_id": self.project.pk, **(params or {})})
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def test_dependency_lists_do_not_scale_queries(self):
+        self._chain(3)
+        few, _ = self._get()
+        self._chain(40)
+        many, data = self._get()
+        self.assertEqual(few, many)
+        self.assertEqual(many, 3)  # koşullu GET doğrulayıcısı + görevler + bağımlılıklar
+        by_id = {row["id"]: row for row in data}
+        chained = [row for row in data if row["dependencies"]]
+        self.assertEqual(len(chained), 2 + 39)
+        for row in chained:
+            self.assertEqual(len(row["dependencies"]), 1)
+            self.assertIn(row["dependencies"][0], by_id)
+
+    def test_columnar_mode_matches_rows(self):
+        tasks = self._chain(4)
+        tasks[0].assignee = self.owner
+        tasks[0].save()
+        _, rows = self._get()
+        _, columns = self._get({"format": "columnar"})
+
+        self.assertEqual(columns["ids"], [row["id"] for row in rows])
+        self.assertEqual(columns["starts"], [row["start"] for row in rows])
+        self.assertEqual(columns["ends"], [row["end"] for row in rows])
+        self.assertEqual(columns["progress"], [row["progress"] for row in rows])
+        self.assertEqual(columns["deps"], [row["dependencies"] for row in rows])
+        self.assertEqual(columns["projects"], {str(self.project.pk): "Gantt"})
+        self.assertEqual(columns["users"], {str(self.owner.pk): {"email": "owner@example.com", "name": "Can"}})
+        names = [columns["users"][str(a)]["name"] if a else None for a in columns["assignee_ids"]]
+        self.assertEqual(names, [row["assignee_name"] for row in rows])
+
+
+class TaskGraphTests(TestCase):
+    def test_topological_order_and_cycle_detection(self):
+        from .graph import CycleError, TaskGraph
+
+        graph = TaskGraph([10, 20, 30, 40], [(10, 20), (20, 30), (10, 40), (40, 30), (99, 10)])
+        order = [graph.ids[i] for i in graph.topological_order()]
+        self.assertEqual(order[0], 10)
+        self.assertEqual(order[-1], 30)
+        self.assertEqual(graph.edge_count, 4)
+
+        with self.assertRaises(CycleError) as ctx:
+            TaskGraph([1, 2, 3, 4], [(1, 2), (2, 3), (3, 1), (3, 4)]).topological_order()
+        cycle = ctx.exception.cycle
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(set(cycle), {1, 2, 3})
+
+    def test_schedule_and_critical_path(self):
+        from .graph import TaskGraph
+
+        d = date(2025, 1, 1)
+        # A(3g) -> B(5g) -> D(1g); A -> C(2g) -> D
+        starts = [d, d, d, d]
+        ends = [d + timedelta(days=n) for n in (3, 5, 2, 1)]
+        graph = TaskGraph([1, 2, 3, 4], [(1, 2), (1, 3), (2, 4), (3, 4)], starts, ends)
+        schedule = graph.schedule()
+
+        self.assertEqual(schedule.finish, 9)
+        self.assertEqual([graph.ids[i] for i in schedule.critical_path()], [1, 2, 4])
+        c = graph.index[3]
+        self.assertEqual((schedule.earliest_start[c], schedule.latest_start[c], schedule.slack(c)), (3, 6, 3))
+
+    def test_large_graph_runs_well_under_a_second(self):
+        import random
+        import time
+
+        from .graph import TaskGraph
+
+        rnd = random.Random(7)
+        n, m = 10_000, 50_000
+        edges = set()
+        while len(edges) < m:
+            a, b = rnd.randrange(n), rnd.randrange(n)
+            if a != b:
+                edges.add((min(a, b), max(a, b)))
+        d = date(2025, 1, 1)
+        started = time.perf_counter()
+        graph = TaskGraph(range(n), edges, [d] * n, [d + timedelta(days=i % 7) for i in range(n)])
+        schedule = graph.schedule()
+        schedule.critical_path()
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(len(schedule.order), n)
+
+
+class CriticalPathViewTests(TestCase):
+    url = "/api/tasks/gantt/critical-path/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.project = Project.objects.create(name="CPM", owner=cls.owner)
+        d = date(2025, 1, 1)
+        cls.a = Task.objects.create(project=cls.project, title="A", start_date=d, end_date=d + timedelta(days=2))
+        cls.b = Task.objects.create(project=cls.project, title="B", start_date=d, end_date=d + timedelta(days=4))
+        cls.c = Task.objects.create(project=cls.project, title="C", start_date=d, end_date=d + timedelta(days=1))
+        cls.b.dependencies.add(cls.a)
+        cls.c.dependencies.add(cls.a)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_critical_path_payload_in_two_graph_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"project_id": self.project.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 3)  # erişim kontrolü + görevler + kenarlar
+        body = response.json()
+        self.assertEqual(body["critical_path"], [self.a.pk, self.b.pk])
+        self.assertEqual(body["finish"], "2025-01-07")
+        self.assertEqual(body["order"][0], self.a.pk)
+
+    def test_visibility_and_validation(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        stranger = User.objects.create_user(email="s@example.com")
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self.client.get(self.url, {"project_id": self.project.pk}).status_code, 404)
+
+    def test_serializer_rejects_cycles_on_write(self):
+        response = self.client.patch(f"/api/tasks/{self.a.pk}/", {"dependencies": [self.c.pk]}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("dependencies", response.json())
+        response = self.client.patch(f"/api/tasks/{self.a.pk}/", {"dependencies": [self.a.pk]}, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.patch(f"/api/tasks/{self.c.pk}/", {"dependencies": [self.a.pk, self.b.pk]}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+    def test_cycle_through_other_projects_is_rejected(self):
+        # B (P2) -> C (P3) -> A (P1); A'yı B'ye bağlamak döngüyü üçüncü proje üzerinden kapatır
+        other = Project.objects.create(name="P2", owner=self.owner)
+        third = Project.objects.create(name="P3", owner=self.owner)
+        b = Task.objects.create(project=other, title="B2")
+        c = Task.objects.create(project=third, title="C3")
+        b.dependencies.add(c)
+        c.dependencies.add(self.a)
+        response = self.client.patch(f"/api/tasks/{self.a.pk}/", {"dependencies": [b.pk]}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("dependencies", response.json())
+        self.assertFalse(self.a.dependencies.exists())
+
+
+class SchedulePropagationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.project = Project.objects.create(name="Takvim", owner=cls.owner)
+        d = date(2025, 1, 1)
+
+        def task(title, start, days):
+            return Task.objects.create(
+                project=cls.project, title=title,
+                start_date=d + timedelta(days=start), end_date=d + timedelta(days=start + days),
+            )
+
+        # A -> B -> C ; A -> S (bolluklu) ; X bağımsız
+        cls.a = task("A", 0, 2)
+        cls.b = task("B", 2, 3)
+        cls.c = task("C", 5, 1)
+        cls.s = task("S", 10, 1)
+        cls.x = task("X", 0, 1)
+        cls.b.dependencies.add(cls.a)
+        cls.c.dependencies.add(cls.b)
+        cls.s.dependencies.add(cls.a)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def patch(self, task, data, **params):
+        query = "?" + "&".join(f"{k}={v}" for k, v in params.items()) if params else ""
+        return self.client.patch(f"/api/tasks/{task.pk}/{query}", data, format="json")
+
+    def test_propagate_shifts_only_dependents_that_would_start_too_early(self):
+        response = self.patch(self.a, {"end_date": "2025-01-06"}, propagate=1)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["changed_task_ids"], [self.b.pk, self.c.pk])
+        self.assertEqual(
+            body["changed_tasks"][0],
+            {"id": self.b.pk, "start_date": "2025-01-06", "end_date": "2025-01-09", "due_date": None},
+        )
+
+        self.c.refresh_from_db()
+        self.s.refresh_from_db()
+        self.x.refresh_from_db()
+        self.assertEqual((self.c.start_date, self.c.end_date), (date(2025, 1, 9), date(2025, 1, 10)))
+        self.assertEqual(self.s.start_date, date(2025, 1, 11))
+        self.assertEqual(self.x.start_date, date(2025, 1, 1))
+
+    def test_due_date_shifts_with_start_and_feeds_successors(self):
+        # Yalnızca son tarihi olan ara görev: öncülün bitişi olarak son tarih kullanılır
+        due_only = Task.objects.create(project=self.project, title="D", start_date=date(2025, 1, 3),
+                                       due_date=date(2025, 1, 5))
+        due_only.dependencies.add(self.a)
+        after = Task.objects.create(project=self.project, title="E", start_date=date(2025, 1, 5),
+                                    end_date=date(2025, 1, 6))
+        after.dependencies.add(due_only)
+
+        response = self.patch(self.a, {"end_date": "2025-01-06"}, propagate=1)
+        self.assertEqual(response.status_code, 200)
+        changed = {t["id"]: t for t in response.json()["changed_tasks"]}
+        self.assertEqual(changed[due_only.pk], {"id": due_only.pk, "start_date": "2025-01-06", "end_date": None,
+                                                "due_date": "2025-01-08"})
+        self.assertEqual((changed[after.pk]["start_date"], changed[after.pk]["end_date"]), ("2025-01-08", "2025-01-09"))
+
+        due_only.refresh_from_db()
+        self.assertEqual((due_only.start_date, due_only.due_date), (date(2025, 1, 6), date(2025, 1, 8)))
+
+    def test_invisible_dependents_are_neither_moved_nor_revealed(self):
+        stranger = User.objects.create_user(email="stranger@example.com")
+        foreign = Project.objects.create(name="Başkası", owner=stranger)
+        hidden = Task.objects.create(project=foreign, title="Gizli",
+                                     start_date=date(2025, 1, 3), end_date=date(2025, 1, 4))
+        hidden.dependencies.add(self.a)
+        # Gizli görevin görünen ardılı: gizli görev yerinde kaldığı için ona göre kaydırılmaz
+        after_hidden = Task.objects.create(project=self.project, title="D",
+                                           start_date=date(2025, 1, 4), end_date=date(2025, 1, 5))
+        after_hidden.dependencies.add(hidden)
+
+        response = self.patch(self.a, {"end_date": "2025-01-06"}, propagate=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(hidden.pk, response.json()["changed_task_ids"])
+        self.assertNotIn(hidden.pk, [t["id"] for t in response.json()["changed_tasks"]])
+        self.assertNotIn(after_hidden.pk, response.json()["changed_task_ids"])
+        hidden.refresh_from_db()
+        self.assertEqual(hidden.start_date, date(2025, 1, 3))
+
+    def test_without_flag_dependents_are_untouched(self):
+        response = self.patch(self.a, {"end_date": "2025-01-06"})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("changed_task_ids", response.json())
+        self.b.refresh_from_db()
+        self.assertEqual(self.b.start_date, date(2025, 1, 3))
+
+    def test_query_count_does_not_grow_with_chain_length(self):
+        from .graph import propagate_schedule
+
+        def queries_for_chain(length):
+            chain = [self.a]
+            for i in range(length):
+                t = Task.objects.create(project=self.project, title=f"z{i}",
+                                        start_date=date(2025, 1, 1), end_date=date(2025, 1, 2))
+                t.dependencies.add(chain[-1])
+                chain.append(t)
+            with CaptureQueriesContext(connection) as ctx:
+                changed = propagate_schedule(self.a.pk)
+            self.assertTrue(set(t.pk for t in chain[1:]) <= {pk for pk, *_ in changed})
+            Task.objects.filter(pk__in=[t.pk for t in chain[1:]]).delete()
+            return len(ctx.captured_queries)
+
+        self.assertEqual(queries_for_chain(3), queries_for_chain(40))
+
+
+class TaskBulkApiTests(TestCase):
+    url = "/api/tasks/bulk/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.stranger = User.objects.create_user(email="stranger@example.com")
+        cls.project = Project.objects.create(name="Toplu", owner=cls.owner)
+        cls.foreign = Project.objects.create(name="Başkası", owner=cls.stranger)
+        cls.hidden = Task.objects.create(project=cls.foreign, title="Gizli")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_bulk_create_writes_and_updates_rollups(self):
+        items = [
+            {"project": self.project.pk, "title": f"T{i}", "progress": 10 * i, "assignee": self.owner.pk}
+            for i in range(5)
+        ]
+        response = self.client.post(self.url, items, format="json")
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual([t["title"] for t in body["results"]], [f"T{i}" for i in range(5)])
+        self.assertEqual(body["errors"], [])
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.task_count, self.project.task_progress_sum), (5, 100))
+
+    def test_atomic_batch_rejects_everything_on_one_error(self):
+        items = [
+            {"project": self.project.pk, "title": "ok"},
+            {"project": self.project.pk, "title": "tarih", "start_date": "2025-02-02", "end_date": "2025-02-01"},
+            {"project": 999999, "title": "proje yok"},
+        ]
+        response = self.client.post(self.url, items, format="json")
+        self.assertEqual(response.status_code, 400)
+        errors = {e["index"]: e["errors"] for e in response.json()["errors"]}
+        self.assertEqual(set(errors), {1, 2})
+        self.assertIn("non_field_errors", errors[1])
+        self.assertIn("project", errors[2])
+        self.assertFalse(Task.objects.filter(project=self.project).exists())
+
+    def test_non_atomic_update_reports_per_item_errors(self):
+        a = Task.objects.create(project=self.project, title="A")
+        b = Task.objects.create(project=self.project, title="B")
+        c = Task.objects.create(project=self.project, title="C")
+        c.dependencies.add(b)
+        items = [
+            {"id": a.pk, "title": "A2", "progress": 50},
+            {"id": self.hidden.pk, "title": "izin yok"},
+            {"id": b.pk, "dependencies": [c.pk]},  # döngü
+            {"id": c.pk, "start_date": "2025-03-05", "end_date": "2025-03-01"},
+            {"title": "id yok"},
+        ]
+        response = self.client.patch(self.url + "?atomic=false", items, format="json")
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([t["id"] for t in body["results"]], [a.pk])
+        self.assertEqual([e["index"] for e in body["errors"]], [1, 2, 3, 4])
+        self.assertIn("dependencies", body["errors"][1]["errors"])
+
+        a.refresh_from_db()
+        self.hidden.refresh_from_db()
+        self.assertEqual((a.title, a.progress), ("A2", 50))
+        self.assertEqual(self.hidden.title, "Gizli")
+        self.assertFalse(b.dependencies.exists())
+
+    def test_status_transition_and_dependencies_replace(self):
+        tasks = [Task.objects.create(project=self.project, title=f"S{i}") for i in range(3)]
+        response = self.client.post(
+            self.url + "status/", [{"id": t.pk, "status": "Tamamlandı"} for t in tasks], format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Task.objects.filter(status="Tamamlandı").count(), 3)
+
+        response = self.client.patch(self.url, [{"id": tasks[2].pk, "dependencies": [tasks[0].pk, tasks[1].pk]}], format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(response.json()["results"][0]["dependencies"]), [tasks[0].pk, tasks[1].pk])
+
+    def test_thousand_updates_in_constant_queries(self):
+        # Süre makineye bağlı; ölçümü: python -m benchmarks.bulk
+        Task.objects.bulk_create([Task(project=self.project, title=f"B{i}") for i in range(1000)])
+        ids = list(Task.objects.filter(project=self.project).values_list("pk", flat=True))
+        items = [{"id": pk, "status": "Beklemede", "progress": i % 100, "due_date": "2025-05-01"} for i, pk in enumerate(ids)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(self.url, items, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 1000)
+        self.assertLess(len(ctx.captured_queries), 25)
+        self.assertEqual(Task.objects.filter(project=self.project, status="Beklemede").count(), 1000)
+        written = dict(Task.objects.filter(project=self.project).values_list("pk", "progress"))
+        self.assertEqual(written, {pk: i % 100 for i, pk in enumerate(ids)})
+
+    def test_shared_values_are_written_as_one_update(self):
+        Task.objects.bulk_create([Task(project=self.project, title=f"S{i}") for i in range(300)])
+        ids = list(Task.objects.filter(project=self.project).values_list("pk", flat=True))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                self.url + "status/", [{"id": pk, "status": "Tamamlandı"} for pk in ids], format="json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('UPDATE "tasks_task"')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn("CASE", updates[0])
+        self.assertEqual(Task.objects.filter(project=self.project, status="Tamamlandı").count(), 300)
+
+
+class ConditionalGetTests(TestCase):
+    gantt_url = "/api/tasks/gantt/"
+    reports_url = "/api/tasks/reports/summary/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.project = Project.objects.create(name="ETag", owner=cls.owner)
+        cls.task = Task.objects.create(project=cls.project, title="A", start_date=date(2025, 1, 1))
+        Task.objects.create(project=cls.project, title="B")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def assertNotModifiedCheaply(self, url, **headers):
+        from unittest import mock
+
+        from rest_framework.renderers import JSONRenderer
+
+        with mock.patch.object(JSONRenderer, "render", side_effect=AssertionError("serileştirildi")), \
+                CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, headers=headers)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertLessEqual(len(ctx.captured_queries), 1)
+        return response
+
+    def test_gantt_revalidation(self):
+        first = self.client.get(self.gantt_url)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        self.assertNotModifiedCheaply(self.gantt_url, if_none_match=etag)
+
+        # Temsil (format) ETag'e dahil
+        columnar = self.client.get(self.gantt_url, {"format": "columnar"}, headers={"if-none-match": etag})
+        self.assertEqual(columnar.status_code, 200)
+
+    def test_changes_produce_new_etag(self):
+        etag = self.client.get(self.gantt_url)["ETag"]
+
+        self.task.title = "A2"
+        self.task.save()
+        changed = self.client.get(self.gantt_url, headers={"if-none-match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+
+        etag = changed["ETag"]
+        Task.objects.filter(title="B").delete()
+        self.assertNotEqual(self.client.get(self.gantt_url)["ETag"], etag)
+
+        etag = self.client.get(self.gantt_url)["ETag"]
+        response = self.client.patch("/api/tasks/bulk/", [{"id": self.task.pk, "status": "Beklemede"}], format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(self.client.get(self.gantt_url)["ETag"], etag)
+
+    def test_no_last_modified_so_deletes_are_never_hidden(self):
+        from django.utils.http import http_date
+
+        first = self.client.get(self.gantt_url)
+        self.assertNotIn("Last-Modified", first)
+
+        # MAX(updated_at) silmede ilerlemez; If-Modified-Since tek başına 304 üretmemeli
+        Task.objects.filter(title="B").delete()
+        response = self.client.get(self.gantt_url, headers={"if-modified-since": http_date()})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t["title"] for t in response.json()], ["A"])
+
+    def test_project_rename_produces_new_gantt_etag(self):
+        for params in ({}, {"project_id": self.project.pk}):
+            etag = self.client.get(self.gantt_url, params)["ETag"]
+            response = self.client.patch(
+                f"/api/projects/{self.project.pk}/", {"name": f"Yeni ad {len(params)}"}, format="json"
+            )
+            self.assertEqual(response.status_code, 200)
+            fresh = self.client.get(self.gantt_url, params, headers={"if-none-match": etag})
+            self.assertEqual(fresh.status_code, 200)
+            self.assertEqual(fresh.json()[0]["project_name"], f"Yeni ad {len(params)}")
+
+    def test_reports_summary_revalidation(self):
+        first = self.client.get(self.reports_url)
+        self.assertNotModifiedCheaply(self.reports_url, if_none_match=first["ETag"])
+
+        User.objects.create_user(email="new@example.com")
+        self.assertEqual(self.client.get(self.reports_url, headers={"if-none-match": first["ETag"]}).status_code, 200)
+
+
+class CalendarTasksViewTests(TestCase):
+    url = "/api/tasks/calendar/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(email="owner@example.com")
+        cls.other = User.objects.create_user(email="other@example.com")
+        cls.project = Project.objects.create(name="Takvim", owner=cls.owner)
+        hidden = Project.objects.create(name="Gizli", owner=cls.other)
+
+        def task(title, start, end, project=None):
+            return Task.objects.create(project=project or cls.project, title=title, start_date=start, end_date=end)
+
+        cls.inside = task("İçeride", date(2025, 3, 10), date(2025, 3, 12))
+        cls.inside.assignee = cls.owner
+        cls.inside.save()
+        cls.spanning = task("Kapsayan", date(2025, 2, 1), date(2025, 4, 30))
+        cls.ends_on_start = task("Başta biten", date(2025, 2, 20), date(2025, 3, 1))
+        task("Önce", date(2025, 1, 1), date(2025, 2, 28))
+        task("Sonra", date(2025, 4, 1), date(2025, 4, 2))
+        task("Tarihsiz", None, None)
+        task("Gizli", date(2025, 3, 5), date(2025, 3, 6), project=hidden)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_requires_valid_window(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"start": "2025-03-01"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"start": "2025-03-31", "end": "2025-03-01"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"start": "2020-01-01", "end": "2025-01-01"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"start": "dün", "end": "2025-01-01"}).status_code, 400)
+
+    def test_returns_visible_tasks_overlapping_window_in_one_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"start": "2025-03-01", "end": "2025-03-31"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        body = response.json()
+        self.assertEqual([row["id"] for row in body], [self.spanning.pk, self.ends_on_start.pk, self.inside.pk])
+        self.assertEqual(body[2], {
+            "id": self.inside.pk, "title": "İçeride", "start": "2025-03-10", "end": "2025-03-12",
+            "assignee": self.owner.pk, "project": self.project.pk,
+        })
+
+    def test_overlap_predicate_uses_range_index(self):
+        qs = Task.objects.filter(end_date__gte=date(2025, 3, 1), start_date__lte=date(2025, 3, 31))
+        plan = qs.explain()
+        self.assertIn("task_end_start_idx", plan)
+
+    def test_ics_stream_and_feed_link(self):
+        response = self.client.get(self.url, {"start": "2025-03-01", "end": "2025-03-31", "format": "ics"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("text/calendar"))
+        body = b"".join(response.streaming_content).decode()
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), 3)
+        self.assertIn(f"UID:task-{self.inside.pk}@testserver\r\n", body)
+        self.assertIn("DTSTART;VALUE=DATE:20250310\r\nDTEND;VALUE=DATE:20250313\r\n", body)
+        self.assertTrue(all(len(line.encode()) <= 75 for line in body.split("\r\n")))
+
+        # Abonelik adresi başlıksız çalışır; pencere göreli olarak varsayılır
+        feed_url = self.client.get("/api/tasks/calendar/feed/").json()["url"]
+        anonymous = APIClient()
+        response = anonymous.get(feed_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("BEGIN:VCALENDAR", b"".join(response.streaming_content).decode())
+        self.assertEqual(anonymous.get(self.url, {"format": "ics", "feed": "bozuk"}).status_code, 401)
+
+    def test_feed_link_opens_only_ics_and_can_be_revoked(self):
+        from urllib.parse import parse_qs, urlsplit
+
+        feed_url = self.client.get("/api/tasks/calendar/feed/").json()["url"]
+        token = parse_qs(urlsplit(feed_url).query)["feed"][0]
+        anonymous = APIClient()
+        window = {"start": "2025-03-01", "end": "2025-03-31", "feed": token}
+        self.assertEqual(anonymous.get(self.url, window).status_code, 401)
+        self.assertEqual(anonymous.get(self.url, {**window, "format": "ics"}).status_code, 200)
+
+        response = self.client.post("/api/tasks/calendar/feed/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.json()["url"], feed_url)
+        self.assertEqual(anonymous.get(feed_url).status_code, 401)
+        self.assertEqual(anonymous.get(response.json()["url"]).status_code, 200)
+
+    def test_ics_folds_long_utf8_lines(self):
+        from .calendar import _fold
 
-# Create your tests here.
+        folded = _fold("SUMMARY:" + "ğ" * 60)
+        lines = folded.rstrip("\r\n").split("\r\n")
+        self.assertTrue(all(len(line.encode()) <= 75 for line in lines))
+        self.assertEqual("".join(line[1:] if i else line for i, line in enumerate(lines)), "SUMMARY:" + "ğ" * 60)
@@ -3,7 +3,9 @@ from django.urls import path
 from .views import (
     TaskViewSet,
     GanttChartTasksView,
+    CriticalPathView,
     CalendarTasksView,
+    CalendarFeedView,
     CompletedTasksView,
     ActiveTasksView,
     TasksByUserView,
@@ -16,7 +18,9 @@ router.register(r'', TaskViewSet, basename='task')
 
 urlpatterns = [
     path('gantt/', GanttChartTasksView.as_view(), name='gantt-tasks'),
+    path('gantt/critical-path/', CriticalPathView.as_view(), name='gantt-critical-path'),
     path('calendar/', CalendarTasksView.as_view(), name='calendar-tasks'),
+    path('calendar/feed/', CalendarFeedView.as_view(), name='calendar-feed'),
     path('reports/completed/', CompletedTasksView.as_view(), name='completed-tasks'),
     path('reports/active/', ActiveTasksView.as_view(), name='active-tasks'),
     path('reports/by-user/<int:user_id>/', TasksByUserView.as_view(), name='tasks-by-user'),
@@ -4,6 +4,9 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Iterable, Optional
 
+from django.db.models import Case, DateField, F, FloatField, Func, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.lookups import Exact, GreaterThan, GreaterThanOrEqual, IsNull, LessThan, LessThanOrEqual
 from django.utils import timezone
 
 
@@ -54,9 +57,153 @@ def task_progress_info(task, *, today: Optional[date] = None) -> ProgressInfo:
     return ProgressInfo(manual=manual, dynamic=dynamic, effective=effective)
 
 
+def is_timed_task(task) -> bool:
+    """Dinamik ilerlemesi tarihe bağlı olan (başlangıç + bitiş/termin dolu) görev mi?"""
+    return bool(getattr(task, "start_date", None) and (getattr(task, "due_date", None) or getattr(task, "end_date", None)))
+
+
+def task_rollup_contribution(task) -> tuple:
+    """Görevin proje özetine katkısı: (manuel ilerleme, zamana bağlı mı 0/1)."""
+    return _normalize_progress_value(getattr(task, "progress", 0)), int(is_timed_task(task))
+
+
 def aggregate_task_progress(tasks: Iterable, *, today: Optional[date] = None) -> Optional[int]:
     """Görevlerin ortalama etkin ilerleme yüzdesi."""
     values = [task_progress_info(task, today=today).effective for task in tasks]
     if not values:
         return None
-    return max(0, min(100, round(sum(values) / len(values))))
\ No newline at end of file
+    return max(0, min(100, round(sum(values) / len(values))))
+
+
+def progress_from_annotations(obj) -> Optional[ProgressInfo]:
+    """`with_progress()` ile gelen kolonlar varsa ProgressInfo'ya çevir."""
+    if not hasattr(obj, "effective_progress"):
+        return None
+    return ProgressInfo(
+        manual=obj.manual_progress,
+        dynamic=obj.dynamic_progress,
+        effective=obj.effective_progress,
+    )
+
+
+PROGRESS_ANNOTATIONS = ("manual_progress", "dynamic_progress", "effective_progress", "_progress_payload")
+
+
+def clear_progress_annotations(obj) -> None:
+    """Kayıt güncellendikten sonra bayatlamış ilerleme kolonlarını temizle."""
+    for attr in PROGRESS_ANNOTATIONS:
+        obj.__dict__.pop(attr, None)
+
+
+# ---- Veritabanı tarafı karşılıklar ----
+# Aşağıdaki ifadeler yukarıdaki Python fonksiyonlarıyla birebir aynı sonucu
+# üretir (Python'un round() davranışı dahil: float bölme + yarıyı çifte yuvarlama).
+
+
+class DateDiff(Func):
+    """`end - start` gün farkı (float)."""
+
+    arity = 2
+    output_field = FloatField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection,
+            template="CAST((%(expressions)s) AS double precision)", arg_joiner=" - ",
+            **extra_context,
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection,
+            template="(julianday(%(expressions)s))", arg_joiner=") - julianday(",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, function="DATEDIFF", arg_joiner=", ", **extra_context,
+        )
+
+
+class _Floor(Func):
+    """Negatif olmayan sayılar için tam sayıya aşağı yuvarlama."""
+
+    arity = 1
+    output_field = IntegerField()
+    template = "CAST(FLOOR(%(expressions)s) AS integer)"
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, template="CAST(%(expressions)s AS integer)", **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, template="FLOOR(%(expressions)s)", **extra_context)
+
+
+def round_half_even_expression(value):
+    """Python `round()` eşdeğeri (value >= 0 varsayılır): floor(x + 0.5), tam yarıda çifte çek."""
+    shifted = value + Value(0.5)
+    rounded = _Floor(shifted)
+    return rounded - Case(
+        When(Exact(shifted, rounded), then=rounded % 2),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def normalized_progress_expression(field="progress"):
+    """`_normalize_progress_value` karşılığı: 0-100 aralığına sıkıştır."""
+    value = F(field)
+    return Case(
+        When(IsNull(value, True), then=Value(0)),
+        When(LessThan(value, 0), then=Value(0)),
+        When(GreaterThan(value, 100), then=Value(100)),
+        default=value,
+        output_field=IntegerField(),
+    )
+
+
+def time_progress_expression(start, end, today: date):
+    """`calculate_time_progress` karşılığı; start/end ifade ya da alan adı olabilir."""
+    start = F(start) if isinstance(start, str) else start
+    end = F(end) if isinstance(end, str) else end
+    today = Value(today, output_field=DateField())
+    ratio = DateDiff(today, start) / DateDiff(end, start) * Value(100.0)
+    return Case(
+        When(IsNull(start, True), then=Value(None)),
+        When(IsNull(end, True), then=Value(None)),
+        When(
+            LessThanOrEqual(end, start),
+            then=Case(When(GreaterThanOrEqual(today, end), then=Value(100)), default=Value(0)),
+        ),
+        When(LessThanOrEqual(today, start), then=Value(0)),
+        When(GreaterThanOrEqual(today, end), then=Value(100)),
+        default=round_half_even_expression(ratio),
+        output_field=IntegerField(),
+    )
+
+
+def effective_progress_expression(manual, dynamic):
+    """max(manual, dynamic or 0)."""
+    return Greatest(manual, Coalesce(dynamic, Value(0)), output_field=IntegerField())
+
+
+def timed_task_q(prefix: str = "") -> Q:
+    """`is_timed_task` karşılığı filtre."""
+    return Q(**{f"{prefix}start_date__isnull": False}) & (
+        Q(**{f"{prefix}due_date__isnull": False}) | Q(**{f"{prefix}end_date__isnull": False})
+    )
+
+
+def task_progress_annotations(today: Optional[date] = None) -> dict:
+    """`task_progress_info` alanlarının annotate() sözlüğü."""
+    if today is None:
+        today = timezone.now().date()
+    manual = normalized_progress_expression("progress")
+    due = Coalesce("due_date", "end_date")
+    dynamic = time_progress_expression("start_date", due, today)
+    return {
+        "manual_progress": manual,
+        "dynamic_progress": dynamic,
+        "effective_progress": effective_progress_expression(manual, dynamic),
+    }
@@ -1,32 +1,98 @@
+from urllib.parse import urlencode
+
+from django.db import transaction
 from django.db.models import Count, Q
-from rest_framework import viewsets
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from proje_yonetimi.conditional import collection_validators, not_modified_response, with_validators
+from proje_yonetimi.exports import DEFAULT_CHUNK_SIZE, EXPORT_RENDERERS, streaming_export_response
+from proje_yonetimi.fastlist import FastListMixin
+from proje_yonetimi.pagination import KeysetPaginatedListMixin
+from proje_yonetimi.sparse import SparseFieldsMixin
+from projects.models import Project
+from .bulk import bulk_create_tasks, bulk_update_status, bulk_update_tasks
+from .graph import CycleError, load_project_graph, propagate_schedule
 from .models import Task
+from .calendar import (
+    CALENDAR_COLUMNS, CalendarFeedAuthentication, feed_token, feed_window, iter_ics, overlapping, parse_window,
+    revoke_feed_tokens,
+)
+from .renderers import ColumnarJSONRenderer, ICalendarRenderer
 from users.models import User
-from .serializers import TaskSerializer
-from .utils import task_progress_info
+from .serializers import TASK_LIST_COLUMNS, TaskSerializer, task_row_encoder
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
+
+
+def _int_param(params, name, default=None, minimum=0):
+    raw = params.get(name)
+    if raw in (None, ""):
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise ValidationError({name: "Tam sayı olmalıdır."})
+    if value < minimum:
+        raise ValidationError({name: f"En az {minimum} olmalıdır."})
+    return value
+
+
+def _flag_param(params, name, default=False):
+    raw = params.get(name)
+    if raw in (None, ""):
+        return default
+    return raw.lower() in ("1", "true", "yes", "on")
+
 
 """class TaskViewSet(viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]"""
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(SparseFieldsMixin, FastListMixin, viewsets.ModelViewSet):
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("due_date", "id")
+    export_chunk_size = DEFAULT_CHUNK_SIZE
+    # ?fields= için alan -> okunacak kolon yolları
+    sparse_columns = {
+        "project": ("project_id",),
+        "assignee": ("assignee_id",),
+        "project_name": ("project__name",),
+        "assignee_name": ("assignee_id", "assignee__first_name", "assignee__last_name", "assignee__email"),
+        "dependencies": (),
+    }
 
     def get_queryset(self):
-        user = self.request.user
-        qs = Task.objects.select_related('project', 'assignee').prefetch_related('dependencies')
+        qs = Task.objects.all()
+        if self.wants_field("dependencies"):
+            qs = qs.with_dependencies()
+        if self.wants_field("dynamic_progress", "effective_progress"):
+            qs = qs.with_progress()
+        return self.filter_for_request(self.project_queryset(qs, select_related=('project', 'assignee')))
+
+    def get_fast_list_queryset(self):
+        columns = self.sparse_column_paths(TASK_LIST_COLUMNS)
+        return self.filter_for_request(Task.objects.with_progress()).values_list(*columns, named=True)
+
+    def encode_rows(self, rows, queryset):
+        dependencies = {}
+        if rows and self.wants_field("dependencies"):
+            # Tek sorgu: sayfada id listesiyle, tam listede alt sorguyla
+            scope = queryset if queryset is not None else Task.objects.filter(pk__in=[row.id for row in rows])
+            dependencies = scope.dependency_map()
+        encode = task_row_encoder(self.sparse_column_paths(TASK_LIST_COLUMNS), self.get_sparse_fields())
+        return [encode(row, dependencies) for row in rows]
 
+    def filter_for_request(self, qs):
+        """Görünürlük + ?project/?status/?assignee filtreleri (liste ve dışa aktarım ortak)."""
         # Admin her şeyi görsün, aksi halde proje sahibi veya o projedeki herhangi bir göreve atanmış olanlar
-        if not user.is_staff:
-            qs = qs.filter(
-                Q(project__owner=user) |
-                Q(project__tasks__assignee=user)
-            )
+        qs = qs.visible_to(self.request.user)
 
         # İsteğe bağlı ek filtreler (mevcut koddaki gibi)
         project_id = self.request.query_params.get('project')
@@ -40,7 +106,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         if assignee_id:
             qs = qs.filter(assignee_id=assignee_id)
 
-        return qs.distinct()
+        return qs
 
     # silmeyi kapalı tut:
     # def destroy(self, request, *args, **kwargs):
@@ -51,93 +117,325 @@ class TaskViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         return Response({"detail": "Silme devre dışı."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
+    def partial_update(self, request, *args, **kwargs):
+        """?propagate=1 ile ardıl görevler de ileri kaydırılır; yanıt değişen görevleri listeler.
+
+        Yalnızca kullanıcının görebildiği ardıllar kaydırılır ve yanıtta yer alır.
+        """
+        if not _flag_param(request.query_params, "propagate"):
+            return super().partial_update(request, *args, **kwargs)
+
+        with transaction.atomic():
+            response = super().partial_update(request, *args, **kwargs)
+            changed = propagate_schedule(response.data["id"], Task.objects.visible_to(request.user))
+        response.data["changed_task_ids"] = [pk for pk, *_ in changed]
+        response.data["changed_tasks"] = [
+            {"id": pk, "start_date": start, "end_date": end, "due_date": due} for pk, start, end, due in changed
+        ]
+        return response
+
+    @action(detail=False, methods=["post", "patch"], url_path="bulk")
+    def bulk(self, request):
+        """POST: toplu oluşturma, PATCH: toplu kısmi güncelleme ([{"id": ..., ...}]).
+
+        ?atomic=false ile hatalı satırlar işi durdurmaz, ``errors`` içinde döner.
+        """
+        atomic = _flag_param(request.query_params, "atomic", default=True)
+        if request.method == "POST":
+            return self._bulk_response(bulk_create_tasks(request.data, atomic=atomic), created=True)
+        return self._bulk_response(bulk_update_tasks(request.data, request.user, atomic=atomic))
+
+    @action(detail=False, methods=["post"], url_path="bulk/status")
+    def bulk_status(self, request):
+        """Toplu durum geçişi: [{"id": ..., "status": ...}]."""
+        atomic = _flag_param(request.query_params, "atomic", default=True)
+        return self._bulk_response(bulk_update_status(request.data, request.user, atomic=atomic))
+
+    def _bulk_response(self, result, created=False):
+        errors = [{"index": index, "errors": detail} for index, detail in result.errors.items()]
+        if not result.written:
+            code = status.HTTP_400_BAD_REQUEST if errors else status.HTTP_200_OK
+            return Response({"results": [], "errors": errors}, status=code)
+
+        # Yanıt için kayıtlar tek sorguda (ilerleme SQL'de) yeniden okunur
+        ids = [task.pk for task in result.saved]
+        fresh = (
+            Task.objects.filter(pk__in=ids).select_related('project', 'assignee')
+            .with_dependencies().with_progress().in_bulk()
+        )
+        data = TaskSerializer([fresh[pk] for pk in ids], many=True).data
+        code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        return Response({"results": data, "errors": errors}, status=code)
+
+    @action(detail=False, methods=["get"], url_path="export", renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """Görünür görevleri NDJSON (?format=ndjson, varsayılan) ya da CSV (?format=csv) olarak akıt."""
+        qs = self.filter_for_request(Task.objects.with_progress()).order_by("id")
+        rows = qs.values_list(*TASK_EXPORT_QUERY_COLUMNS).iterator(chunk_size=self.export_chunk_size)
+        return streaming_export_response(
+            rows, TASK_EXPORT_COLUMNS, request.accepted_renderer.format,
+            filename="gorevler", enrich=_enrich_task_export_chunk, chunk_size=self.export_chunk_size,
+        )
+
+
+# TaskSerializer ile aynı alanlar/sıra
+TASK_EXPORT_COLUMNS = (
+    "id", "project", "project_name", "title", "description", "assignee", "assignee_name",
+    "start_date", "end_date", "due_date", "status", "progress", "dependencies",
+    "dynamic_progress", "effective_progress",
+)
+TASK_EXPORT_QUERY_COLUMNS = (
+    "id", "project_id", "title", "description", "assignee_id",
+    "start_date", "end_date", "due_date", "status", "progress",
+    "dynamic_progress", "effective_progress",
+)
+
+
+def _enrich_task_export_chunk(chunk):
+    """Parça başına üç sorgu: proje adları, atanan adları, bağımlılıklar."""
+    task_ids = [row[0] for row in chunk]
+    project_names = dict(
+        Project.objects.filter(pk__in={row[1] for row in chunk}).values_list("pk", "name")
+    )
+    assignee_names = {
+        pk: f"{first} {last}".strip() or email
+        for pk, first, last, email in User.objects.filter(
+            pk__in={row[4] for row in chunk if row[4] is not None}
+        ).values_list("pk", "first_name", "last_name", "email")
+    }
+    dependencies = Task.objects.filter(pk__in=task_ids).dependency_map()
+
+    enriched = []
+    for pk, project_id, title, description, assignee_id, start, end, due, status_, progress, dynamic, effective in chunk:
+        enriched.append((
+            pk, project_id, project_names.get(project_id), title, description,
+            assignee_id, assignee_names.get(assignee_id),
+            start, end, due, status_, progress, dependencies.get(pk, []),
+            dynamic, effective,
+        ))
+    return enriched
+
+
+
+GANTT_QUERY_COLUMNS = (
+    "id", "title", "start_date", "end_date", "status",
+    "manual_progress", "dynamic_progress", "effective_progress",
+    "project_id", "project__name",
+    "assignee_id", "assignee__email", "assignee__first_name", "assignee__last_name",
+)
 
 
 class GanttChartTasksView(APIView):
     permission_classes = [IsAuthenticated]
+    # ?format=columnar -> paralel diziler (büyük projeler için küçük yük)
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
 
     def get(self, request):
-        user = request.user
-        qs = Task.objects.select_related('project','assignee').prefetch_related('dependencies')
-
-        if not user.is_staff:
-            qs = qs.filter(
-                Q(project__owner=user) |
-                Q(project__tasks__assignee=user)
-            )
+        qs = Task.objects.visible_to(request.user)
+        projects = Project.objects.visible_to(request.user)
 
         project_id = request.query_params.get('project_id')
         if project_id:
             qs = qs.filter(project_id=project_id)
+            projects = projects.filter(pk=project_id)
 
-        qs = qs.distinct()
-
-        data = []
-        for t in qs:
-            progress = task_progress_info(t)
-            data.append({
-                "id": t.id,
-                "title": t.title,
-                "start": t.start_date,
-                "end": t.end_date,
-                "progress": progress.effective,
-                "manual_progress": progress.manual,
-                "dynamic_progress": progress.dynamic,
-                "status": t.status,
-                "assignee": getattr(t.assignee, "email", None),
-                "dependencies": list(t.dependencies.values_list("id", flat=True)),
-                "project_name": getattr(t.project, "name", None),
-                "assignee_name": (
-                    (f"{t.assignee.first_name} {t.assignee.last_name}".strip() if t.assignee else None)
-                    or (t.assignee.email if t.assignee else None)
-                ),
-            })
-        return Response(data)
+        # Yük üretilmeden önce: görevler ve (project_name için) projeler değişmediyse 304.
+        # Atananın ad/e-posta değişikliği izlenmez (User'da updated_at yok); görev
+        # değişene ya da gün dönene kadar eski ad dönebilir.
+        validators = collection_validators(
+            request, "gantt", tasks=qs, projects=projects, parts=[request.accepted_renderer.format], daily=True,
+        )
+        not_modified = not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+        qs = qs.with_progress()
+
+        rows = list(qs.values_list(*GANTT_QUERY_COLUMNS))
+        # Bağımlılıklar görev başına değil, ara tablodan tek sorguyla
+        dependencies = qs.dependency_map()
+
+        if request.accepted_renderer.format == ColumnarJSONRenderer.format:
+            return with_validators(Response(self._columnar(rows, dependencies)), validators)
+        return with_validators(Response([self._row(row, dependencies) for row in rows]), validators)
+
+    @staticmethod
+    def _assignee_name(email, first_name, last_name):
+        return f"{first_name or ''} {last_name or ''}".strip() or email
+
+    def _row(self, row, dependencies):
+        (pk, title, start, end, status_, manual, dynamic, effective,
+         _project_id, project_name, assignee_id, email, first_name, last_name) = row
+        return {
+            "id": pk,
+            "title": title,
+            "start": start,
+            "end": end,
+            "progress": effective,
+            "manual_progress": manual,
+            "dynamic_progress": dynamic,
+            "status": status_,
+            "assignee": email,
+            "dependencies": dependencies.get(pk, []),
+            "project_name": project_name,
+            "assignee_name": self._assignee_name(email, first_name, last_name) if assignee_id else None,
+        }
+
+    def _columnar(self, rows, dependencies):
+        """Satır yerine sütun dizileri; proje ve kullanıcı bilgileri sözlükle bir kez gönderilir."""
+        columns = list(zip(*rows)) or [()] * len(GANTT_QUERY_COLUMNS)
+        (ids, titles, starts, ends, statuses, manual, dynamic, effective,
+         project_ids, project_names, assignee_ids, emails, first_names, last_names) = columns
+        projects = dict(zip(project_ids, project_names))
+        users = {
+            pk: {"email": email, "name": self._assignee_name(email, first, last)}
+            for pk, email, first, last in zip(assignee_ids, emails, first_names, last_names)
+            if pk is not None
+        }
+        return {
+            "ids": ids,
+            "titles": titles,
+            "starts": starts,
+            "ends": ends,
+            "progress": effective,
+            "manual_progress": manual,
+            "dynamic_progress": dynamic,
+            "statuses": statuses,
+            "project_ids": project_ids,
+            "assignee_ids": assignee_ids,
+            "deps": [dependencies.get(pk, []) for pk in ids],
+            "projects": projects,
+            "users": users,
+        }
+
+
+class CriticalPathView(APIView):
+    """Projenin bağımlılık grafı üzerinde topolojik sıra, en erken/en geç başlangıç ve kritik yol."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        project_id = _int_param(request.query_params, "project_id", minimum=1)
+        if project_id is None:
+            raise ValidationError({"project_id": "Zorunlu alan."})
+
+        if not Project.objects.filter(pk=project_id).visible_to(request.user).exists():
+            raise NotFound("Proje bulunamadı.")
+
+        graph = load_project_graph(project_id)
+        try:
+            schedule = graph.schedule()
+        except CycleError as exc:
+            return Response({"detail": str(exc), "cycle": exc.cycle}, status=status.HTTP_409_CONFLICT)
+
+        ids = graph.ids
+        return Response({
+            "project_id": project_id,
+            "start": schedule.day(0),
+            "finish": schedule.day(schedule.finish),
+            "duration_days": schedule.finish,
+            "order": [ids[i] for i in schedule.order],
+            "critical_path": [ids[i] for i in schedule.critical_path()],
+            "tasks": [
+                {
+                    "id": ids[i],
+                    "duration": schedule.durations[i],
+                    "earliest_start": schedule.day(schedule.earliest_start[i]),
+                    "earliest_finish": schedule.day(schedule.earliest_finish[i]),
+                    "latest_start": schedule.day(schedule.latest_start[i]),
+                    "latest_finish": schedule.day(schedule.latest_finish[i]),
+                    "slack": schedule.slack(i),
+                    "critical": schedule.slack(i) == 0,
+                }
+                for i in schedule.order
+            ],
+        })
 
 
 class CalendarTasksView(APIView):
+    """?start=&end= penceresiyle çakışan görünür görevler; ?format=ics ile iCalendar akışı."""
+
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [*api_settings.DEFAULT_AUTHENTICATION_CLASSES, CalendarFeedAuthentication]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ICalendarRenderer]
+    export_chunk_size = DEFAULT_CHUNK_SIZE
+
     def get(self, request):
-        tasks = Task.objects.all()
-        data = [
-            {
-                "id": task.id,
-                "title": task.title,
-                "start": task.start_date,
-                "end": task.end_date,
-                "assignee": task.assignee.id if task.assignee else None,
-                "project": task.project.id if task.project else None,
-            }
-            for task in tasks
-        ]
-        return Response(data)
+        ics = request.accepted_renderer.format == ICalendarRenderer.format
+        # Abonelik istemcileri tarih göndermez; .ics için göreli pencere varsayılır
+        start, end = parse_window(request.query_params, default=feed_window() if ics else None)
+
+        qs = overlapping(Task.objects.visible_to(request.user), start, end)
+        project_id = _int_param(request.query_params, "project", minimum=1)
+        if project_id is not None:
+            qs = qs.filter(project_id=project_id)
+        assignee_id = _int_param(request.query_params, "assignee", minimum=1)
+        if assignee_id is not None:
+            qs = qs.filter(assignee_id=assignee_id)
+        rows = qs.order_by("start_date", "id").values_list(*CALENDAR_COLUMNS)
+
+        if ics:
+            response = StreamingHttpResponse(
+                iter_ics(rows.iterator(chunk_size=self.export_chunk_size), domain=request.get_host().split(":")[0],
+                         chunk_size=self.export_chunk_size),
+                content_type="text/calendar; charset=utf-8",
+            )
+            response["Content-Disposition"] = 'inline; filename="gorevler.ics"'
+            return response
+
+        return Response([
+            {"id": pk, "title": title, "start": start_date, "end": end_date, "assignee": assignee, "project": project}
+            for pk, title, start_date, end_date, assignee, project, _status, _updated in rows
+        ])
+
+
+class CalendarFeedView(APIView):
+    """Takvim aboneliği için imzalı .ics adresi; POST eski adresleri geçersiz kılıp yenisini verir."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = urlencode({"format": ICalendarRenderer.format, "feed": feed_token(request.user)})
+        return Response({"url": request.build_absolute_uri(f"{reverse('calendar-tasks')}?{query}")})
+
+    def post(self, request):
+        revoke_feed_tokens(request.user)
+        return self.get(request)
 
 #tamamlanan görevler 
-class CompletedTasksView(APIView):
+class CompletedTasksView(KeysetPaginatedListMixin, APIView):
+    keyset_ordering = ("due_date", "id")
+
     def get(self, request):
-        completed = Task.objects.filter(status="Tamamlandı")
-        serializer = TaskSerializer(completed, many=True)
-        return Response(serializer.data)
+        completed = Task.objects.filter(status="Tamamlandı").select_related('project', 'assignee').with_progress()
+        return self.list_response(completed, TaskSerializer)
 
 #aktif görevler
-class ActiveTasksView(APIView):
+class ActiveTasksView(KeysetPaginatedListMixin, APIView):
+    keyset_ordering = ("due_date", "id")
+
     def get(self, request):
-        active = Task.objects.exclude(status="Tamamlandı")
-        serializer = TaskSerializer(active, many=True)
-        return Response(serializer.data)
+        active = Task.objects.exclude(status="Tamamlandı").select_related('project', 'assignee').with_progress()
+        return self.list_response(active, TaskSerializer)
+
+class TasksByUserView(KeysetPaginatedListMixin, APIView):
+    keyset_ordering = ("due_date", "id")
 
-class TasksByUserView(APIView):
     def get(self, request, user_id):
-        tasks = Task.objects.filter(assignee_id=user_id)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data)
+        tasks = Task.objects.filter(assignee_id=user_id).select_related('project', 'assignee').with_progress()
+        return self.list_response(tasks, TaskSerializer)
+
+class TasksByDateView(KeysetPaginatedListMixin, APIView):
+    keyset_ordering = ("due_date", "id")
 
-class TasksByDateView(APIView):
     def get(self, request):
         start = request.query_params.get("start")
         end = request.query_params.get("end")
-        tasks = Task.objects.filter(start_date__gte=start, end_date__lte=end)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data)
+        tasks = (
+            Task.objects.filter(start_date__gte=start, end_date__lte=end)
+            .select_related('project', 'assignee')
+            .with_progress()
+        )
+        return self.list_response(tasks, TaskSerializer)
     
 #raporlar paneli için
 class ReportsSummaryView(APIView):
@@ -146,6 +444,14 @@ class ReportsSummaryView(APIView):
     def get(self, request):
         qs = Task.objects.all()
 
+        # Tüm görevler ve kullanıcılar üzerinden (rapor kullanıcıya özel değil)
+        validators = collection_validators(
+            request, "reports-summary", tasks=qs, users=(User.objects.all(), "date_joined"),
+        )
+        not_modified = not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
         # Durum kırılımı
         raw = dict(
             qs.values_list('status').annotate(cnt=Count('id'))
@@ -157,27 +463,40 @@ class ReportsSummaryView(APIView):
             "Beklemede": raw.get("Beklemede", 0),
         }
 
-        # Kullanıcı performansı
+        # Kullanıcı performansı: tek GROUP BY sorgusu (kullanıcı başına COUNT yok)
+        # ?min_total=1 -> görevi olmayan kullanıcılar veritabanında elenir
+        # ?limit=N     -> ilk N kullanıcı
+        limit = _int_param(request.query_params, "limit", minimum=1)
+        min_total = _int_param(request.query_params, "min_total", default=0)
+
+        users = (
+            User.objects
+            .annotate(
+                total=Count('task'),
+                done=Count('task', filter=Q(task__status="Tamamlandı")),
+            )
+            .values('id', 'first_name', 'last_name', 'email', 'total', 'done')
+        )
+        if min_total:
+            users = users.filter(total__gte=min_total)
+
+        # toplamı/azalan sıralı gösterelim (aynı toplamda oran sırası = tamamlanan sırası)
+        users = users.order_by('-total', '-done', 'id')
+        if limit:
+            users = users[:limit]
+
         users_data = []
-        # Sadece en az 1 görevi olan kullanıcıları göstermek istersen:
-        # users = User.objects.filter(task__isnull=False).distinct()
-        users = User.objects.all()
         for u in users:
-            total = qs.filter(assignee=u).count()
-            done = qs.filter(assignee=u, status="Tamamlandı").count()
-            rate = round(100 * done / total) if total else 0
+            total, done = u["total"], u["done"]
             users_data.append({
-                "id": u.id,
-                "name": (f"{u.first_name} {u.last_name}").strip() or u.email,
+                "id": u["id"],
+                "name": (f"{u['first_name']} {u['last_name']}").strip() or u["email"],
                 "total": total,
                 "done": done,
-                "rate": rate,
+                "rate": round(100 * done / total) if total else 0,
             })
 
-        # toplamı/azalan sıralı gösterelim
-        users_data.sort(key=lambda x: (x["total"], x["rate"]), reverse=True)
-
-        return Response({
+        return with_validators(Response({
             "status_counts": status_counts,
             "users": users_data,
-        })
\ No newline at end of file
+        }), validators)
@@ -0,0 +1,72 @@
+"""JWT kimlik doğrulama; çözülen kullanıcı süreç içi TTL önbellekte.
+
+simplejwt her istekte kullanıcı satırını okur. Burada belirteç doğrulaması
+(imza, süre, tür) aynen yapılır; yalnızca kullanıcı satırının ``CACHED_FIELDS``
+alanları ``JWT_USER_CACHE["TTL"]`` saniye saklanır. Önbellekten gelen kullanıcı
+``User.from_db`` ile kurulur: saklanmayan alanlar (parola, tarihler) ertelenmiştir
+ve erişilirse veritabanından okunur, yanlış değer dönmez.
+
+Geçersiz kılma: kullanıcı kaydedilince/silinince bu sürecin girdisi silinir
+(users.signals); rol değişikliği ya da pasifleştirme sonraki istekte görünür.
+Sinyal çalıştırmayan yazımlar (``QuerySet.update``, ham SQL) ve diğer süreçler
+için üst sınır TTL'dir. ``CHECK_REVOKE_TOKEN`` açıksa parola özeti gerektiği için
+önbellek kullanılmaz.
+"""
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from proje_yonetimi.ttlcache import TTLCache
+
+# Görünümlerin ve serializer'ların request.user üzerinde okuduğu alanlar
+CACHED_FIELDS = ("id", "email", "first_name", "last_name", "role", "is_active", "is_staff", "is_superuser")
+
+_cache = None
+
+
+@cache
+def _cached_attnames():
+    """``CACHED_FIELDS``, modeldeki sütun sırasıyla (``Model.from_db`` değerleri bu sırada bekler)."""
+    return tuple(f.attname for f in get_user_model()._meta.concrete_fields if f.attname in CACHED_FIELDS)
+
+
+def get_user_cache():
+    global _cache
+    if _cache is None:
+        options = settings.JWT_USER_CACHE
+        _cache = TTLCache(options["MAX_ENTRIES"], options["TTL"])
+    return _cache
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or settings.JWT_USER_CACHE["TTL"] <= 0:
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        user_cache, attnames = get_user_cache(), _cached_attnames()
+        # Belirteçteki değer JSON'dan gelir; kayıt sinyalindeki alan değeriyle aynı anahtar için str
+        key = str(user_id)
+        values = user_cache.get(key)
+        if values is None:
+            user = super().get_user(validated_token)
+            user_cache.set(key, tuple(getattr(user, name) for name in attnames))
+            return user
+
+        user = get_user_model().from_db(DEFAULT_DB_ALIAS, attnames, values)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+
+def evict_user(pk):
+    if _cache is not None:
+        _cache.delete(str(pk))
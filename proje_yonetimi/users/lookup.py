@@ -0,0 +1,146 @@
+"""Kullanıcı arama: normalize anahtarlar, önek otomatik tamamlama ve süreç içi LRU.
+
+Anahtarlar (``email_key``, ``name_key``, ``last_name_key``) küçük harfli ve
+aksansızdır ("Şule İnce" -> "sule ince"); ``User.save()`` ve
+``User.objects.bulk_create`` doldurur. Önek araması ``LIKE`` yerine indeksli
+aralık sorgusudur (``anahtar >= önek AND anahtar < önek + U+10FFFF``): SQLite'ın
+büyük/küçük harf duyarsız ``LIKE``'ı ikili (BINARY) indeksi kullanamaz. Üç grup
+tek bir ``UNION ALL`` sorgusunda okunur.
+
+Aralık ikili (kod noktası) sıralama varsayar. SQLite'ta varsayılan BINARY
+harmanlama budur; PostgreSQL'de veritabanı harmanlaması (ör. tr_TR) önekleri
+bir arada tutmaz, bu yüzden orada ``text_pattern_ops`` indeksinin bayt sıralı
+işleçleri (``~>=~``, ``~<~``) kullanılır.
+
+Sıralama: e-posta eşleşmeleri, sonra ad(+soyad), sonra soyad; her grupta anahtar
+sırası (tam eşleşme en kısa anahtar olduğu için önce gelir). Her grup en fazla
+``MAX_LIMIT`` satır okur. Bir önekin bütün eşleşmeleri okunduysa (hiçbir grup
+sınıra dayanmadıysa) sonuç "tam"dır ve aynı önekle başlayan sonraki tuş
+vuruşları veritabanına gitmeden bundan süzülür.
+"""
+import unicodedata
+from collections import namedtuple
+from functools import cache
+
+from django.conf import settings
+
+from proje_yonetimi.ttlcache import TTLCache
+
+# Tüm geçerli karakterlerden büyük: önek aralığının üst sınırı
+PREFIX_END = "\U0010ffff"
+KEY_COLUMNS = ("email_key", "name_key", "last_name_key")
+RESULT_COLUMNS = ("id", "email", "first_name", "last_name")
+
+Candidate = namedtuple("Candidate", KEY_COLUMNS + RESULT_COLUMNS)
+
+
+def lookup_key(value):
+    """Küçük harf, aksansız, tek boşluklu anahtar (Türkçe ı/İ dahil -> i)."""
+    folded = unicodedata.normalize("NFKD", (value or "").casefold())
+    stripped = "".join(char for char in folded if not unicodedata.combining(char))
+    return " ".join(stripped.replace("ı", "i").split())
+
+
+def user_lookup_keys(email, first_name, last_name):
+    return {
+        "email_key": lookup_key(email),
+        "name_key": lookup_key(f"{first_name} {last_name}"),
+        "last_name_key": lookup_key(last_name),
+    }
+
+
+def rank(candidates, prefix, limit):
+    """Önekle eşleşen adaylar, alaka sırasıyla (veritabanı yolu ile aynı sıra)."""
+    ranked = {}
+    for group, column in enumerate(KEY_COLUMNS):
+        for candidate in candidates:
+            key = getattr(candidate, column)
+            if key.startswith(prefix) and candidate.id not in ranked:
+                ranked[candidate.id] = (group, key, candidate.id, candidate)
+    ordered = sorted(ranked.values(), key=lambda item: item[:3])
+    return [{name: getattr(item[3], name) for name in RESULT_COLUMNS} for item in ordered[:limit]]
+
+
+@cache
+def _candidates_sql():
+    """Grup başına sıralı + sınırlı üç indeksli aralık sorgusu, tek ``UNION ALL`` ifadesinde.
+
+    ORM dilimlenmiş sorguları birleşik ifadeye koyamadığı (SQLite) için SQL bir kez
+    model meta verisinden kurulur; istek başına tek gidiş-dönüş.
+    """
+    from django.db import connection
+
+    from .models import User
+
+    quote = connection.ops.quote_name
+    table = quote(User._meta.db_table)
+    columns = ", ".join(quote(User._meta.get_field(name).column) for name in Candidate._fields)
+    active, pk = quote(User._meta.get_field("is_active").column), quote(User._meta.pk.column)
+    if connection.vendor == "postgresql":
+        at_least, below, order = "~>=~", "~<~", " USING ~<~"
+    else:
+        at_least, below, order = ">=", "<", ""
+    parts = [
+        f"SELECT * FROM (SELECT {group}, {columns} FROM {table} WHERE {active} = %s"
+        f" AND {quote(key)} {at_least} %s AND {quote(key)} {below} %s"
+        f" ORDER BY {quote(key)}{order}, {pk} LIMIT %s) AS group_{group}"
+        for group, key in enumerate(KEY_COLUMNS)
+    ]
+    return " UNION ALL ".join(parts)
+
+
+def fetch_candidates(prefix, per_group):
+    """Her anahtar grubundan en fazla ``per_group`` aday; ``(adaylar, tam_mı)``."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(_candidates_sql(), [True, prefix, prefix + PREFIX_END, per_group] * len(KEY_COLUMNS))
+        rows = cursor.fetchall()
+    counts = [0] * len(KEY_COLUMNS)
+    candidates = {}
+    for group, *row in rows:
+        counts[group] += 1
+        candidates.setdefault(row[3], Candidate(*row))
+    # Bir grup sınıra dayandıysa bu önekin bütün eşleşmeleri okunmamış olabilir
+    return list(candidates.values()), all(count < per_group for count in counts)
+
+
+class PrefixCache(TTLCache):
+    """Önek -> (adaylar, tam_mı). ``clear()`` kullanıcı değişince çağrılır (users.signals)."""
+
+    def find(self, prefix):
+        """Önekin kendisi ya da tam sonuçlu kısa bir öneki; yoksa ``None``."""
+        entry = self.get(prefix)
+        if entry is not None:
+            return entry[0]
+        for length in range(len(prefix) - 1, 0, -1):
+            entry = self.get(prefix[:length])
+            if entry is not None and entry[1]:
+                return entry[0]
+        return None
+
+    def put(self, prefix, candidates, complete):
+        self.set(prefix, (candidates, complete))
+
+
+_cache = None
+
+
+def get_prefix_cache():
+    global _cache
+    if _cache is None:
+        options = settings.USER_AUTOCOMPLETE
+        _cache = PrefixCache(options["CACHE_SIZE"], options["CACHE_TTL"])
+    return _cache
+
+
+def autocomplete(query, limit):
+    prefix = lookup_key(query)
+    if not prefix:
+        return []
+    prefix_cache = get_prefix_cache()
+    candidates = prefix_cache.find(prefix)
+    if candidates is None:
+        candidates, complete = fetch_candidates(prefix, settings.USER_AUTOCOMPLETE["MAX_LIMIT"])
+        prefix_cache.put(prefix, candidates, complete)
+    return rank(candidates, prefix, limit)
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:18
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+# users.lookup.lookup_key / user_lookup_keys'in bu göç yazıldığı andaki kopyası: katlama
+# kuralları sonradan değişse de göç aynı anahtarları üretir (değişiklik yeni bir göçle gelir)
+def lookup_key(value):
+    folded = unicodedata.normalize("NFKD", (value or "").casefold())
+    stripped = "".join(char for char in folded if not unicodedata.combining(char))
+    return " ".join(stripped.replace("ı", "i").split())
+
+
+def user_lookup_keys(email, first_name, last_name):
+    return {
+        "email_key": lookup_key(email),
+        "name_key": lookup_key(f"{first_name} {last_name}"),
+        "last_name_key": lookup_key(last_name),
+    }
+
+
+def backfill_lookup_keys(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    users = []
+    for user in User.objects.only("email", "first_name", "last_name").iterator(chunk_size=2000):
+        for name, value in user_lookup_keys(user.email, user.first_name, user.last_name).items():
+            setattr(user, name, value)
+        users.append(user)
+        if len(users) >= 2000:
+            User.objects.bulk_update(users, ["email_key", "name_key", "last_name_key"])
+            users = []
+    if users:
+        User.objects.bulk_update(users, ["email_key", "name_key", "last_name_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_key',
+            field=models.CharField(default='', editable=False, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='last_name_key',
+            field=models.CharField(default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='name_key',
+            field=models.CharField(default='', editable=False, max_length=128),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['email_key'], name='user_email_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['name_key'], name='user_name_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['last_name_key'], name='user_last_name_key_idx'),
+        ),
+        migrations.RunPython(backfill_lookup_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0003_user_calendar_feed_version'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_email_key_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_name_key_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_last_name_key_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['email_key'], name='user_email_key_idx', opclasses=['text_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['name_key'], name='user_name_key_idx', opclasses=['text_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['last_name_key'], name='user_last_name_key_idx', opclasses=['text_pattern_ops']),
+        ),
+    ]
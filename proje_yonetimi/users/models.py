@@ -1,6 +1,8 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.db import models
 
+from .lookup import get_prefix_cache, user_lookup_keys
+
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
         if not email:
@@ -16,6 +18,15 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault('is_superuser', True)
         return self.create_user(email, password, **extra_fields)
 
+    def bulk_create(self, objs, *args, **kwargs):
+        # save() ve sinyaller çalışmaz; arama anahtarları ve önbellek burada
+        objs = list(objs)
+        for user in objs:
+            user.fill_lookup_keys()
+        created = super().bulk_create(objs, *args, **kwargs)
+        get_prefix_cache().clear()
+        return created
+
 class User(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=30, blank=True)
@@ -24,11 +35,36 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(auto_now_add=True)
+    # Otomatik tamamlama için küçük harfli/aksansız anahtarlar (users.lookup)
+    email_key = models.CharField(max_length=254, editable=False, default="")
+    name_key = models.CharField(max_length=128, editable=False, default="")
+    last_name_key = models.CharField(max_length=64, editable=False, default="")
+    # Takvim aboneliği bağlantısının sürümü (tasks.calendar); artınca eski bağlantılar geçersiz
+    calendar_feed_version = models.PositiveIntegerField(editable=False, default=0)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
     objects = UserManager()
 
+    class Meta:
+        indexes = [
+            # PostgreSQL: önek aralığı bayt sırasıyla (users.lookup); diğerlerinde opclasses yok sayılır
+            models.Index(fields=["email_key"], name="user_email_key_idx", opclasses=["text_pattern_ops"]),
+            models.Index(fields=["name_key"], name="user_name_key_idx", opclasses=["text_pattern_ops"]),
+            models.Index(fields=["last_name_key"], name="user_last_name_key_idx", opclasses=["text_pattern_ops"]),
+        ]
+
     def __str__(self):
         return self.email
+
+    def fill_lookup_keys(self):
+        for name, value in user_lookup_keys(self.email, self.first_name, self.last_name).items():
+            setattr(self, name, value)
+
+    def save(self, *args, **kwargs):
+        self.fill_lookup_keys()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"email", "first_name", "last_name"}.intersection(update_fields):
+            kwargs["update_fields"] = {*update_fields, "email_key", "name_key", "last_name_key"}
+        super().save(*args, **kwargs)
@@ -0,0 +1,33 @@
+"""Kullanıcı eklenince/değişince/silinince bu sürecin önbelleklerini güncelle.
+
+Otomatik tamamlama: yalnızca sonucu etkileyen alanlar; girişte ``last_login``
+güncellemesi önek önbelleğine dokunmaz. JWT kullanıcı önbelleği: her kayıtta o
+kullanıcının girdisi silinir (rol, yetki, ``is_active`` sonraki istekte görünür).
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import evict_user
+
+from .lookup import get_prefix_cache
+from .models import User
+
+LOOKUP_FIELDS = {"email", "first_name", "last_name", "is_active"}
+
+
+@receiver(post_save, sender=User)
+def clear_autocomplete_cache_on_save(sender, created=False, update_fields=None, **kwargs):
+    if created or update_fields is None or LOOKUP_FIELDS.intersection(update_fields):
+        get_prefix_cache().clear()
+
+
+@receiver(post_delete, sender=User)
+def clear_autocomplete_cache_on_delete(sender, **kwargs):
+    get_prefix_cache().clear()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def evict_authenticated_user(sender, instance, **kwargs):
+    evict_user(getattr(instance, api_settings.USER_ID_FIELD))
@@ -1,3 +1,259 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework_simplejwt.tokens import AccessToken
+
+from proje_yonetimi.testing import select_columns
+from proje_yonetimi.ttlcache import TTLCache
+
+from .authentication import get_user_cache
+from .lookup import get_prefix_cache, lookup_key
+from .models import User
+
+
+class UserSparseFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ece@example.com", first_name="Ece", password="gizli-parola")
+        User.objects.create_user(email="ali@example.com")
+
+    def _list_sql(self, params):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/users/", params)
+        self.assertEqual(response.status_code, 200)
+        sql = [q["sql"] for q in ctx.captured_queries if 'FROM "users_user"' in q["sql"]]
+        return response.json(), sql[-1]
+
+    def test_only_requested_columns_are_read(self):
+        _, full = self._list_sql({})
+        rows, sparse = self._list_sql({"fields": "id,email"})
+        self.assertEqual({tuple(row) for row in rows}, {("id", "email")})
+        self.assertLess(len(select_columns(sparse)), len(select_columns(full)))
+        self.assertNotIn('"password"', sparse)
+        self.assertNotIn('"first_name"', sparse)
+
+    def test_keyset_cursor_columns_stay_loaded(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            body = client.get("/api/users/", {"fields": "email", "page_size": 1}).json()
+        self.assertIsNotNone(body["next"])
+        self.assertEqual(body["results"], [{"email": "ece@example.com"}])
+        # imleç için ertelenmiş alan okunmaz (ek sorgu yok)
+        self.assertEqual(sum('FROM "users_user"' in q["sql"] for q in ctx.captured_queries), 1)
+
+
+class UserAutocompleteTests(TestCase):
+    url = "/api/users/autocomplete/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create_user(email="ben@example.com")
+        cls.ali = User.objects.create_user(email="Ali@example.com", first_name="Ali", last_name="Kaya")
+        cls.alican = User.objects.create_user(email="alican@example.com", first_name="Can", last_name="Er")
+        cls.alize = User.objects.create_user(email="zeynep@example.com", first_name="Alize", last_name="Yılmaz")
+        cls.mert = User.objects.create_user(email="mert@example.com", first_name="Mert", last_name="Alioğlu")
+        cls.sule = User.objects.create_user(email="sule@example.com", first_name="Şule", last_name="Işık")
+        User.objects.create_user(email="alipasif@example.com", is_active=False)
+
+    def setUp(self):
+        cache.clear()  # throttle sayaçları
+        get_prefix_cache().clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.me)
+
+    def complete(self, q, **params):
+        response = self.client.get(self.url, {"q": q, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return [row["id"] for row in response.json()]
+
+    def test_lookup_key_normalisation(self):
+        self.assertEqual(lookup_key("  Şule   İNCE "), "sule ince")
+        self.assertEqual(lookup_key("IŞIK"), "isik")
+        self.assertEqual(lookup_key("Işık"), "isik")
+        self.assertEqual(
+            (self.sule.email_key, self.sule.name_key, self.sule.last_name_key),
+            ("sule@example.com", "sule isik", "isik"),
+        )
+
+    def test_keys_follow_writes(self):
+        self.mert.first_name = "Ömer"
+        self.mert.save(update_fields=["first_name"])
+        self.mert.refresh_from_db()
+        self.assertEqual(self.mert.name_key, "omer alioglu")
+        bulk, = User.objects.bulk_create([User(email="Toplu@Example.com", first_name="Çağla")])
+        self.assertEqual(User.objects.get(email="Toplu@Example.com").name_key, "cagla")
+
+    def test_relevance_order_and_response(self):
+        # E-posta, sonra ad(+soyad), sonra soyad eşleşmeleri; pasif kullanıcı yok
+        self.assertEqual(self.complete("ali"), [self.ali.pk, self.alican.pk, self.alize.pk, self.mert.pk])
+        response = self.client.get(self.url, {"q": "ali", "limit": 1})
+        self.assertEqual(response.json(), [{"id": self.ali.pk, "email": "Ali@example.com", "first_name": "Ali", "last_name": "Kaya"}])
+
+    def test_case_diacritics_and_full_name(self):
+        self.assertEqual(self.complete("ŞU"), [self.sule.pk])
+        self.assertEqual(self.complete("isi"), [self.sule.pk])
+        self.assertEqual(self.complete("alize yıl"), [self.alize.pk])
+        self.assertEqual(self.complete("yok"), [])
+
+    def test_repeated_keystrokes_served_from_cache(self):
+        self.complete("a")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.complete("a"), self.complete("a"))
+            # "a" sonucu tam: "al", "ali" ... veritabanına gitmeden süzülür
+            self.assertEqual(self.complete("ali")[0], self.ali.pk)
+        User.objects.create_user(email="aliye@example.com")
+        self.assertIn(User.objects.get(email="aliye@example.com").pk, self.complete("ali"))
+
+    def test_truncated_prefix_is_not_reused(self):
+        with override_settings(USER_AUTOCOMPLETE={**settings.USER_AUTOCOMPLETE, "MAX_LIMIT": 2}):
+            self.complete("a")
+            with self.assertNumQueries(1):
+                self.assertEqual(self.complete("ali"), [self.ali.pk, self.alican.pk])
+
+    def test_prefix_query_uses_index(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite sorgu planı")
+        with CaptureQueriesContext(connection) as ctx:
+            self.complete("ali")
+        sql, = [q["sql"] for q in ctx.captured_queries]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        for index in ("user_email_key_idx", "user_name_key_idx", "user_last_name_key_idx"):
+            self.assertIn(index, plan)
+        self.assertNotIn("SCAN users_user", plan)
+
+    def test_validation_auth_and_throttle(self):
+        self.assertEqual(self.client.get(self.url, {"q": "  "}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"q": "a", "limit": "x"}).status_code, 400)
+        cache.clear()
+        with mock.patch.object(ScopedRateThrottle, "THROTTLE_RATES", {"user-autocomplete": "2/min"}):
+            statuses = [self.client.get(self.url, {"q": "a"}).status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url, {"q": "a"}).status_code, 401)
+
+
+class FindUserByEmailTests(TestCase):
+    url = "/api/users/find-by-email/"
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="Ayse@Example.com", first_name="Ayşe")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_case_insensitive_lookup(self):
+        response = self.client.get(self.url, {"email": "ayse@example.COM"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], self.user.pk)
+        self.assertEqual(self.client.get(self.url, {"email": "yok@example.com"}).status_code, 404)
+
+    def test_accent_or_dotless_i_variant_is_another_user(self):
+        sirket = User.objects.create_user(email="a@şirket.com")
+        self.assertEqual(self.client.get(self.url, {"email": "a@sirket.com"}).status_code, 404)
+        self.assertEqual(self.client.get(self.url, {"email": "A@ŞIRKET.com"}).json()["id"], sirket.pk)
+
+        User.objects.create_user(email="ali@example.com")
+        self.assertEqual(self.client.get(self.url, {"email": "alı@example.com"}).status_code, 404)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url, {"email": "ayse@example.com"}).status_code, 401)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    url = "/api/users/me/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ece@example.com", first_name="Ece", password="gizli-parola")
+        cls.staff = User.objects.create_user(email="yonetici@example.com", is_staff=True)
+
+    def setUp(self):
+        get_user_cache().clear()
+
+    def _client(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client
+
+    def test_repeated_request_runs_no_queries(self):
+        client = self._client(self.user)
+        self.assertEqual(client.get(self.url).status_code, 200)
+        with self.assertNumQueries(0):
+            response = client.get(self.url)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["email"], "ece@example.com")
+        self.assertEqual(response.json()["first_name"], "Ece")
+
+    def test_uncached_fields_are_loaded_not_guessed(self):
+        client = self._client(self.user)
+        client.get(self.url)
+        user = client.get(self.url).wsgi_request.user
+        with self.assertNumQueries(1):
+            self.assertTrue(user.check_password("gizli-parola"))
+
+    def test_role_change_through_api_is_seen_on_next_request(self):
+        client = self._client(self.user)
+        self.assertEqual(client.get(self.url).json()["role"], "üye")
+        response = self._client(self.staff).patch(f"/api/users/{self.user.pk}/", {"role": "admin"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.get(self.url).json()["role"], "admin")
+
+    def test_deactivated_user_is_rejected_on_next_request(self):
+        client = self._client(self.user)
+        self.assertEqual(client.get(self.url).status_code, 200)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        self.assertEqual(client.get(self.url).status_code, 401)
+
+    def test_writes_without_signals_are_stale_at_most_ttl(self):
+        client = self._client(self.user)
+        ttl = settings.JWT_USER_CACHE["TTL"]
+        with mock.patch("proje_yonetimi.ttlcache.time.monotonic", return_value=1000.0) as clock:
+            client.get(self.url)
+            User.objects.filter(pk=self.user.pk).update(role="admin", is_active=False)
+            clock.return_value = 1000.0 + ttl
+            self.assertEqual(client.get(self.url).json()["role"], "üye")
+            clock.return_value = 1000.0 + ttl + 0.001
+            self.assertEqual(client.get(self.url).status_code, 401)
+
+    @override_settings(JWT_USER_CACHE={"MAX_ENTRIES": 10, "TTL": 0})
+    def test_zero_ttl_disables_cache(self):
+        client = self._client(self.user)
+        client.get(self.url)
+        with self.assertNumQueries(1):
+            client.get(self.url)
+        self.assertEqual(len(get_user_cache()), 0)
+
+
+class TTLCacheTests(TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        ttl_cache = TTLCache(max_entries=2, ttl=60)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.get("a")
+        ttl_cache.set("c", 3)
+        self.assertEqual(len(ttl_cache), 2)
+        self.assertIsNone(ttl_cache.get("b"))
+        self.assertEqual((ttl_cache.get("a"), ttl_cache.get("c")), (1, 3))
+
+    def test_entry_expires_after_ttl(self):
+        ttl_cache = TTLCache(max_entries=2, ttl=5)
+        with mock.patch("proje_yonetimi.ttlcache.time.monotonic", return_value=10.0) as clock:
+            ttl_cache.set("a", 1)
+            clock.return_value = 15.0
+            self.assertEqual(ttl_cache.get("a"), 1)
+            clock.return_value = 15.5
+            self.assertIsNone(ttl_cache.get("a"))
+        self.assertEqual(len(ttl_cache), 0)
@@ -3,6 +3,7 @@ from .views import (
     RegisterView,
     UserDetailView,
     FindUserByEmailView,
+    UserAutocompleteView,
     GoogleLoginView,
     GoogleConfigView,
     UserViewSet,
@@ -21,4 +22,5 @@ urlpatterns = [
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('me/', UserDetailView.as_view(), name='me'),
     path('find-by-email/', FindUserByEmailView.as_view(), name='find-by-email'),
+    path('autocomplete/', UserAutocompleteView.as_view(), name='autocomplete'),
 ] + router.urls
\ No newline at end of file
@@ -5,11 +5,15 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 
+from proje_yonetimi.sparse import SparseFieldsMixin
+
+from .lookup import autocomplete, lookup_key
 from .serializers import RegisterSerializer, UserSerializer
 from .models import User
 from .permissions import CanUpdateUser
@@ -23,12 +27,17 @@ UserModel = get_user_model()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]"""
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated, CanUpdateUser]
+    keyset_ordering = ("date_joined", "id")
     http_method_names = ['get', 'put', 'patch', 'head', 'options']  # DELETE yok, POST yok (kayıt ayrı endpoint)
 
+    def get_queryset(self):
+        # ?fields= verilirse yalnızca istenen kolonlar okunur
+        return self.project_queryset(super().get_queryset())
+
     def get_serializer_context(self):
         ctx = super().get_serializer_context()
         ctx['request'] = self.request
@@ -50,13 +59,39 @@ class UserDetailView(generics.RetrieveAPIView):
         return self.request.user
     
 class FindUserByEmailView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "user-lookup"
+
     def get(self, request):
-        email = request.query_params.get("email")
-        try:
-            user = User.objects.get(email=email)
-            return Response({"id": user.id, "email": user.email, "first_name": user.first_name, "last_name": user.last_name})
-        except User.DoesNotExist:
+        email = request.query_params.get("email") or ""
+        # Adaylar indeksli anahtardan; anahtar aksanları ve ı/i'yi de katladığı için
+        # (a@sirket.com ~ a@şirket.com) yalnızca büyük/küçük harf farkı kabul edilir, tam yazım önce
+        candidates = User.objects.filter(email_key=lookup_key(email)).order_by("pk")
+        matches = [u for u in candidates if u.email.casefold() == email.casefold()]
+        user = next((u for u in matches if u.email == email), matches[0] if matches else None)
+        if user is None:
             return Response({"error": "Kullanıcı bulunamadı."}, status=404)
+        return Response({"id": user.id, "email": user.email, "first_name": user.first_name, "last_name": user.last_name})
+
+
+class UserAutocompleteView(APIView):
+    """``?q=`` ile e-posta, ad veya soyad önekine göre kullanıcılar (atanan seçici)."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "user-autocomplete"
+
+    def get(self, request):
+        query = request.query_params.get("q", "")
+        if not lookup_key(query):
+            return Response({"q": "Arama metni gerekli."}, status=status.HTTP_400_BAD_REQUEST)
+        options = settings.USER_AUTOCOMPLETE
+        try:
+            limit = int(request.query_params.get("limit", options["LIMIT"]))
+        except ValueError:
+            return Response({"limit": "Tamsayı olmalı."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(autocomplete(query, max(1, min(limit, options["MAX_LIMIT"]))))
 
 def _google_client_id():
     # Önce SocialApp (Site ile ilişkilendirilmiş) → yoksa settings